@@ -1,25 +1,35 @@
 import os
 import uuid
+import atexit
 import json
 import time
 from datetime import datetime
+from typing import Optional
 
-import redis
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 from flask_caching import Cache
-import psycopg2
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from src.pipelines.run import MainPipeline
+from src.pipelines.export_saved_data import EXPORT_FORMATS
+from src.pipelines.project_evidence import evidence_mode_from_env
+from src.schemas.project_gen import GeneratedProject
+from src.utils.prompt_cache import get_prompt_cache
+from src.utils.response_cache import ResponseCache
+from src.utils.redis_single_flight import RedisSingleFlight, SingleFlightTimeout
+from src.utils.app_container import AppContainer
+from src.utils.evidence_cache import EvidenceCache
+from src.utils.evidence_partitions import EvidencePartitions
+from src.utils.cache_codec import get_cache_codec
+from src.utils.job_queue import JobQueue, SUCCEEDED
 
 app = Flask(__name__)
 
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
 app.config["DEBUG"] = os.getenv("FLASK_DEBUG", "false").lower() == "true"
-app.config["CACHE_TYPE"] = "redis"
+app.config["CACHE_TYPE"] = "RedisCache"
 app.config["CACHE_REDIS_HOST"] = os.getenv("REDIS_HOST", "localhost")
 app.config["CACHE_REDIS_PORT"] = int(os.getenv("REDIS_PORT", "6379"))
 app.config["CACHE_REDIS_DB"] = int(os.getenv("REDIS_DB", "0"))
@@ -27,20 +37,63 @@ app.config["CACHE_REDIS_DB"] = int(os.getenv("REDIS_DB", "0"))
 cache = Cache(app=app)
 cache.init_app(app)
 
-redis_client = redis.Redis(
-    host=os.getenv("REDIS_HOST", "localhost"), 
-    port=int(os.getenv("REDIS_PORT", "6379")), 
-    db=int(os.getenv("REDIS_DB", "0"))
+# Shared clients, created by container.startup() where the app is run and
+# otherwise on first use, are closed at exit
+container = AppContainer()
+atexit.register(container.shutdown)
+
+redis_client = container.redis_client
+
+# Seconds searches, ux_info and their results are kept in Redis
+CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "3600"))
+
+job_search_cache = ResponseCache(
+    redis_client,
+    ttl=int(os.getenv("JOB_SEARCH_CACHE_TTL", "3600")),
+    stale_ttl=int(os.getenv("JOB_SEARCH_CACHE_STALE_TTL", "600"))
 )
 
-db_conn = psycopg2.connect(
-    database=os.getenv("DATABASE_NAME"), 
-    user=os.getenv("USERNAME"),
-    password=os.getenv("PASSWORD"), 
-    host=os.getenv("DB_HOST", "localhost"), 
-    port=os.getenv("PORT")
+project_ideas_flight = RedisSingleFlight(
+    redis_client,
+    lock_ttl=int(os.getenv("PROJECT_IDEAS_LOCK_TTL", "120")),
+    wait_timeout=float(os.getenv("PROJECT_IDEAS_WAIT_TIMEOUT", "90"))
+)
+
+cache_codec = get_cache_codec()
+
+evidence_exhaustive, evidence_top_k = evidence_mode_from_env()
+evidence_cache = EvidenceCache(
+    redis_client,
+    default_ttl=CACHE_DEFAULT_TIMEOUT,
+    exhaustive=evidence_exhaustive,
+    top_k=evidence_top_k
 )
 
+# Matches per project and listing pair, reused across ux_info payloads
+evidence_partitions = None
+if os.getenv("EVIDENCE_INCREMENTAL", "false").lower() == "true":
+    evidence_partitions = EvidencePartitions(
+        redis_client,
+        ttl=int(os.getenv("EVIDENCE_PARTITION_TTL", "86400"))
+    )
+
+project_ideas_queue = JobQueue(
+    redis_client,
+    name="project_ideas",
+    visibility_timeout=int(os.getenv("PROJECT_IDEAS_VISIBILITY_TIMEOUT", "300")),
+    max_attempts=int(os.getenv("PROJECT_IDEAS_MAX_ATTEMPTS", "3")),
+    result_ttl=CACHE_DEFAULT_TIMEOUT
+)
+
+PROJECT_IDEAS_QUEUE = os.getenv("PROJECT_IDEAS_QUEUE", "false").lower() == "true"
+
+RECENT_SEARCHES_PAGE_SIZE = int(os.getenv("RECENT_SEARCHES_PAGE_SIZE", "5"))
+RECENT_SEARCHES_MAX = int(os.getenv("RECENT_SEARCHES_MAX", "100"))
+SAVED_PROJECTS_PAGE_SIZE = int(os.getenv("SAVED_PROJECTS_PAGE_SIZE", "20"))
+SAVED_PROJECTS_MAX_PAGE_SIZE = int(os.getenv("SAVED_PROJECTS_MAX_PAGE_SIZE", "100"))
+EXPORT_ITERSIZE = int(os.getenv("EXPORT_ITERSIZE", "500"))
+SAVE_BATCH_SIZE = int(os.getenv("SAVE_BATCH_SIZE", "500"))
+
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
 
 CORS(
@@ -54,53 +107,72 @@ def index():
         "success": True
     })
 
+def _search_request_error(data: Optional[dict]) -> Optional[str]:
+    if data is None:
+        return "No JSON data received. Make sure Content-Type is application/json"
+
+    if not data or "role" not in data or not data.get("role"):
+        return "Role is required"
+
+    return None
+
+def _user_inputs(data: dict) -> dict:
+    return {
+        "role": data.get("role"),
+        "uk_locations": data.get("uk_location"),
+        "date_posted": data.get("date_posted"),
+        "off_site": data.get("hybrid_or_remote"),
+        "employment_types": data.get("employment_types")
+    }
+
+def _queue_search_writes(pipe, user_inputs: dict, job_listings_dict: dict) -> str:
+    # Queues the writes on a sync or asyncio Redis pipeline, the caller
+    # executes it
+    job_search_id = str(uuid.uuid4())
+    redis_key = job_search_id
+    timeout = CACHE_DEFAULT_TIMEOUT
+
+    metadata = {
+        "job_search_id": job_search_id,
+        "parameters": user_inputs,
+        "timestamp": datetime.now().isoformat(),
+        "job_count": len(job_listings_dict)
+    }
+    metadata_key = f"search_metadata:{job_search_id}"
+
+    now = time.time()
+    pipe.set(redis_key, cache_codec.encode(job_listings_dict), ex=timeout)
+    pipe.set(metadata_key, cache_codec.encode(metadata), ex=timeout)
+    pipe.zadd("recent_searches", {job_search_id: now})
+    # Drop searches whose metadata has expired, then keep the newest
+    pipe.zremrangebyscore("recent_searches", "-inf", now - timeout)
+    pipe.zremrangebyrank("recent_searches", 0, -RECENT_SEARCHES_MAX - 1)
+
+    return job_search_id
+
 @app.route("/api/scrape_locations", methods=["POST"])
 def scrape_locations(): # Change the naming of these at some point
     """Handle scraping request from React frontend."""
     try:
         data = request.get_json()
         
-        if data is None:
+        error = _search_request_error(data)
+        if error is not None:
             return jsonify({
                 "success": False,
-                "error": "No JSON data received. Make sure Content-Type is application/json"
-            }), 400
-
-        if not data or "role" not in data or not data.get("role"):
-            return jsonify({
-                "success": False,
-                "error": "Role is required"
+                "error": error
             }), 400
         
-        user_inputs = {
-            "role": data.get("role"),
-            "uk_locations": data.get("uk_location"),
-            "date_posted": data.get("date_posted"),
-            "off_site": data.get("hybrid_or_remote"),
-            "employment_types": data.get("employment_types")
-        }
+        user_inputs = _user_inputs(data)
         
-        main_pipeline = MainPipeline()
-        job_listings = main_pipeline.job_search(user_inputs)
+        main_pipeline = container.main_pipeline
+        job_listings = main_pipeline.job_search(user_inputs, job_search_cache)
 
         job_listings_dict = job_listings.model_dump(exclude_none=True)
 
-        job_search_id = str(uuid.uuid4())
-        redis_key = job_search_id
-        timeout = os.getenv("CACHE_DEFAULT_TIMEOUT")
-        redis_client.setex(redis_key, timeout, json.dumps(job_listings_dict))
-
-        metadata = {
-            "job_search_id": job_search_id,
-            "parameters": user_inputs,
-            "timestamp": datetime.now().isoformat(),
-            "job_count": len(job_listings_dict)
-        }
-        metadata_key = f"search_metadata:{job_search_id}"
-        redis_client.setex(metadata_key, timeout, json.dumps(metadata))
-
-        redis_client.zadd("recent_searches", {job_search_id: time.time()})
-        redis_client.expire("recent_searches", timeout)
+        with redis_client.pipeline() as pipe:
+            job_search_id = _queue_search_writes(pipe, user_inputs, job_listings_dict)
+            pipe.execute()
 
         return jsonify({
             "success": True,
@@ -118,18 +190,24 @@ def scrape_locations(): # Change the naming of these at some point
 
 @app.route("/api/recent-searches", methods=["GET"])
 def recent_searches():
+    """Lists the most recent searches.
+
+    Takes an optional limit query parameter, capped at RECENT_SEARCHES_MAX.
+    """
     try:
-        # Last 5 most recent searches
-        search_ids = redis_client.zrevrange("recent_searches", 0, 4)
+        limit = request.args.get("limit", default=RECENT_SEARCHES_PAGE_SIZE, type=int)
+        limit = max(1, min(limit, RECENT_SEARCHES_MAX))
 
-        recent_searches_list = []
-        for id in search_ids:
-            metadata_key = f"search_metadata:{id.decode()}"
-            metadata_str = redis_client.get(metadata_key)
+        search_ids = redis_client.zrevrange("recent_searches", 0, limit - 1)
+        if not search_ids:
+            return jsonify([])
 
-            if metadata_str is not None:
-                metadata_dict = json.loads(metadata_str.decode("utf-8"))
-                recent_searches_list.append(metadata_dict)
+        metadata_keys = [f"search_metadata:{id.decode()}" for id in search_ids]
+
+        recent_searches_list = []
+        for metadata in redis_client.mget(metadata_keys):
+            if metadata is not None:
+                recent_searches_list.append(cache_codec.decode(metadata))
         
         return jsonify(recent_searches_list)
     except Exception as e:
@@ -138,59 +216,189 @@ def recent_searches():
             "error": str(e)
         }), 500
 
+def _generate_ux_info(job_search_id: str) -> bytes:
+    job_listings = redis_client.get(job_search_id)
+    dict_job_listings = cache_codec.decode(job_listings)
+
+    main_pipeline = container.main_pipeline
+    ux_info = main_pipeline.project_idea_generation(dict_job_listings)
+
+    return cache_codec.encode(ux_info.model_dump(exclude_none=True))
+
 @app.route("/api/project-ideas", methods=["POST"])
 def project_ideas():
     try:
         data = request.get_json()
 
-        existing_projects_id = f"ux_info:{data['job_search_id']}"
-        existing_projects = redis_client.get(existing_projects_id)
+        job_search_id = data["job_search_id"]
+        ux_info_id = f"ux_info:{job_search_id}"
 
-        if existing_projects:
-            str_projects = existing_projects.decode("utf-8")
-            dict_projects = json.loads(str_projects)
+        if PROJECT_IDEAS_QUEUE:
+            existing_ux_info = redis_client.get(ux_info_id)
+            if existing_ux_info:
+                return jsonify({
+                    "id": ux_info_id,
+                    "data": cache_codec.decode(existing_ux_info)
+                })
 
+            # Generated by api/worker.py, polled through /api/jobs/<job_id>
+            job_id = project_ideas_queue.enqueue({"job_search_id": job_search_id})
             return jsonify({
-                "id": existing_projects_id,
-                "data": dict_projects
-            })
-
-        job_listings = redis_client.get(data["job_search_id"])
-        str_job_listings = job_listings.decode("utf-8")
-        dict_job_listings = json.loads(str_job_listings)
-
-        main_pipeline = MainPipeline()
-        ux_info = main_pipeline.project_idea_generation(dict_job_listings)
-
-        ux_info_dict = ux_info.model_dump(exclude_none=True)
-
-        ux_info_id = f"ux_info:{data['job_search_id']}"
-        redis_key = ux_info_id
-        timeout = os.getenv("CACHE_DEFAULT_TIMEOUT")
-        redis_client.setex(redis_key, timeout, json.dumps(ux_info_dict))
+                "success": True,
+                "job_id": job_id,
+                "status_url": f"/api/jobs/{job_id}"
+            }), 202
+
+        # Concurrent requests for the same search share one generation
+        ux_info = project_ideas_flight.run(
+            ux_info_id, lambda: _generate_ux_info(job_search_id), CACHE_DEFAULT_TIMEOUT
+        )
         
         return(jsonify({
             "id": ux_info_id,
-            "data": ux_info_dict
+            "data": cache_codec.decode(ux_info)
         }))
+    except SingleFlightTimeout as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 503, {"Retry-After": "5"}
     except Exception as e:
         return jsonify({
             "success": False,
             "error": str(e)
         }), 500
 
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    """Reports the status of a queued project generation job.
+
+    Once the job has succeeded, the response carries the same id and data 
+    as /api/project-ideas.
+    """
+    try:
+        status = project_ideas_queue.status(job_id)
+        if status is None:
+            return jsonify({
+                "success": False,
+                "error": f"Unknown job: {job_id}"
+            }), 404
+
+        if status["status"] == SUCCEEDED:
+            ux_info_id = status["result"]["id"]
+            ux_info = redis_client.get(ux_info_id)
+            if ux_info is not None:
+                status["id"] = ux_info_id
+                status["data"] = cache_codec.decode(ux_info)
+
+        return jsonify(status)
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.route("/api/project-ideas/stream", methods=["POST"])
+def project_ideas_stream():
+    """Streams each generated project as a server-sent event.
+
+    Emits a "project" event per GeneratedProject as soon as it is complete,
+    then a "done" event with the same payload as /api/project-ideas.
+    Unavailable when PROJECT_IDEAS_QUEUE is true, as generation then runs
+    on the workers.
+    """
+    if PROJECT_IDEAS_QUEUE:
+        return jsonify({
+            "success": False,
+            "error": "Streaming is unavailable while project generation is queued"
+        }), 404
+
+    data = request.get_json()
+    job_search_id = data["job_search_id"]
+    ux_info_id = f"ux_info:{job_search_id}"
+    timeout = CACHE_DEFAULT_TIMEOUT
+
+    def replay(ux_info: bytes):
+        dict_ux_info = cache_codec.decode(ux_info)
+        for project in dict_ux_info["project_list"]["projects"]:
+            yield _sse("project", project)
+        yield _sse("done", {"id": ux_info_id, "data": dict_ux_info})
+
+    def generate():
+        try:
+            existing_ux_info = redis_client.get(ux_info_id)
+            if existing_ux_info:
+                yield from replay(existing_ux_info)
+                return
+
+            token = project_ideas_flight.acquire(ux_info_id)
+            if token is None:
+                # Another request is generating, wait for its result instead
+                ux_info = project_ideas_flight.run(
+                    ux_info_id, lambda: _generate_ux_info(job_search_id), timeout
+                )
+                yield from replay(ux_info)
+                return
+
+            try:
+                # The previous holder may have stored it since our read
+                existing_ux_info = redis_client.get(ux_info_id)
+                if existing_ux_info:
+                    yield from replay(existing_ux_info)
+                    return
+
+                job_listings = redis_client.get(job_search_id)
+                dict_job_listings = cache_codec.decode(job_listings)
+
+                main_pipeline = container.main_pipeline
+                with project_ideas_flight.hold(ux_info_id, token):
+                    for item in main_pipeline.project_idea_generation_stream(
+                        dict_job_listings
+                    ):
+                        if isinstance(item, GeneratedProject):
+                            yield _sse("project", item.model_dump(exclude_none=True))
+                            continue
+
+                        ux_info_dict = item.model_dump(exclude_none=True)
+                        redis_client.set(
+                            ux_info_id, cache_codec.encode(ux_info_dict), ex=timeout
+                        )
+                        yield _sse("done", {"id": ux_info_id, "data": ux_info_dict})
+            finally:
+                project_ideas_flight.release(ux_info_id, token)
+        except Exception as e:
+            yield _sse("error", {"success": False, "error": str(e)})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _parse_evidence(ux_info_id: str, dict_ux_info: dict) -> list:
+    cached = evidence_cache.get(ux_info_id, dict_ux_info)
+    if cached is not None:
+        return cached
+
+    main_pipeline = container.main_pipeline
+    parsed_evidence = main_pipeline.parse_evidence(dict_ux_info, evidence_partitions)
+    parsed_evidence_dict = parsed_evidence.model_dump(exclude_none=True)
+    evidence_cache.put(ux_info_id, dict_ux_info, parsed_evidence_dict)
+
+    return parsed_evidence_dict
+
 @app.route("/api/project-evidence", methods=["POST"])
 def project_evidence():
     try:
         data = request.get_json()
 
         ux_info = redis_client.get(data["id"])
-        str_ux_info = ux_info.decode("utf-8")
-        dict_ux_info = json.loads(str_ux_info)
+        dict_ux_info = cache_codec.decode(ux_info)
 
-        main_pipeline = MainPipeline()
-        parsed_evidence = main_pipeline.parse_evidence(dict_ux_info)
-        parsed_evidence_dict = parsed_evidence.model_dump(exclude_none=True)
+        parsed_evidence_dict = _parse_evidence(data["id"], dict_ux_info)
 
         return jsonify(parsed_evidence_dict)
 
@@ -204,30 +412,65 @@ def project_evidence():
 def save():
     try:
         data = request.get_json()
-        db_cur = db_conn.cursor()
 
         id = data["save_project"]
         ux_info = redis_client.get(id)
-        str_ux_info = ux_info.decode("utf-8")
-        dict_ux_info = json.loads(str_ux_info)
+        dict_ux_info = cache_codec.decode(ux_info)
 
-        main_pipeline = MainPipeline()
-
-        parsed_evidence = main_pipeline.parse_evidence(dict_ux_info)
-        print(parsed_evidence)
-        parsed_evidence_dict = parsed_evidence.model_dump(exclude_none=True)
+        # Usually parsed already by /api/project-evidence
+        parsed_evidence_dict = _parse_evidence(id, dict_ux_info)
 
+        main_pipeline = container.main_pipeline
         main_pipeline.save_project_data(
             dict_ux_info,
             parsed_evidence_dict,
-            db_conn,
-            db_cur
+            container.db_pool
         )
 
-        db_cur.close()
+        return jsonify({
+            "success": True,
+        })
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+@app.route("/api/save-bulk", methods=["POST"])
+def save_bulk():
+    """Saves many generated project lists in one transaction.
+
+    Takes a save_projects list of ux_info ids and returns the saved ids in 
+    the same order.
+    """
+    try:
+        data = request.get_json()
+
+        ids = data["save_projects"]
+        ux_infos = redis_client.mget(ids) if ids else []
+
+        missing = [id for id, ux_info in zip(ids, ux_infos) if ux_info is None]
+        if missing:
+            return jsonify({
+                "success": False,
+                "error": f"Not found: {', '.join(missing)}"
+            }), 404
+
+        saves = []
+        for id, ux_info in zip(ids, ux_infos):
+            dict_ux_info = cache_codec.decode(ux_info)
+            saves.append((dict_ux_info, _parse_evidence(id, dict_ux_info)))
+
+        main_pipeline = container.main_pipeline
+        saved_ids = main_pipeline.save_project_data_bulk(
+            saves,
+            container.db_pool,
+            SAVE_BATCH_SIZE
+        )
 
         return jsonify({
             "success": True,
+            "ids": saved_ids
         })
     except Exception as e:
         return jsonify({
@@ -235,52 +478,72 @@ def save():
             "error": str(e)
         }), 500
 
-# Make this more efficient by not passing all of the data (not all of it is needed for this stage)
 @app.route("/api/fetch-saved-projects")
 def fetch_saved_projects():
-    db_cur = db_conn.cursor()
+    """Lists saved projects one page at a time, newest first.
 
-    main_pipeline = MainPipeline()
-    fetched_data = main_pipeline.fetch_saved_data(db_conn, db_cur)
+    Takes optional cursor (the next_cursor of the previous page) and limit
+    query parameters. Full rows are loaded by /api/fetch-saved-project/<id>.
+    """
+    before_id = request.args.get("cursor", type=int)
+    limit = request.args.get("limit", default=SAVED_PROJECTS_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, SAVED_PROJECTS_MAX_PAGE_SIZE))
 
-    db_cur.close()
+    main_pipeline = container.main_pipeline
+    fetched_data = main_pipeline.fetch_saved_data(container.db_pool, before_id, limit)
 
     return jsonify(fetched_data.model_dump(exclude_none=True))
 
 
-@app.route("/api/fetch-saved-project/<int:id>", methods=["GET"])
-def fetch_saved_project(id):
-    db_cur = db_conn.cursor()
+@app.route("/api/export-saved-projects")
+def export_saved_projects():
+    """Streams every saved project as NDJSON or CSV.
 
-    main_pipeline = MainPipeline()
-    requested_data = main_pipeline.fetch_requested_data(id, db_conn, db_cur)
+    Takes an optional format query parameter, either ndjson (default) or csv.
+    """
+    output_format = request.args.get("format", default="ndjson")
+    if output_format not in EXPORT_FORMATS:
+        return jsonify({
+            "success": False, 
+            "error": f"format must be one of {', '.join(EXPORT_FORMATS)}"
+        }), 400
 
-    db_cur.close()
+    mimetypes = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+    main_pipeline = container.main_pipeline
+    lines = main_pipeline.export_saved_data(container.db_pool, output_format, EXPORT_ITERSIZE)
+
+    return Response(
+        stream_with_context(lines),
+        mimetype=mimetypes[output_format],
+        headers={
+            "Content-Disposition": f"attachment; filename=saved_projects.{output_format}"
+        }
+    )
+
+
+@app.route("/api/fetch-saved-project/<int:id>", methods=["GET"])
+def fetch_saved_project(id):
+    main_pipeline = container.main_pipeline
+    requested_data = main_pipeline.fetch_requested_data(id, container.db_pool)
 
     return jsonify(requested_data)
 
 @app.route("/api/fetch-saved-project-evidence/<int:id>")
 def fetch_saved_project_evidence(id):
-    db_cur = db_conn.cursor()
-
-    main_pipeline = MainPipeline()
-    evidence = main_pipeline.fetch_saved_evidence(id, db_conn, db_cur)
-
-    db_cur.close()
+    main_pipeline = container.main_pipeline
+    evidence = main_pipeline.fetch_saved_evidence(id, container.db_pool)
 
     return jsonify(evidence)
 
 @app.route("/api/delete-saved-project/<int:id>", methods=["DELETE"])
 def delete_saved_project(id):
     try:
-        db_cur = db_conn.cursor()
-        db_cur.execute("DELETE FROM history WHERE id = %s", (id,))
-        db_conn.commit()
-        db_cur.close()
+        with container.db_pool.cursor() as (_, db_cur):
+            db_cur.execute("DELETE FROM history WHERE id = %s", (id,))
 
         return jsonify({"success": True})
     except Exception as e:
-        db_conn.rollback()
         return jsonify({
             "success": False,
             "error": str(e)
@@ -291,7 +554,24 @@ def health():
     """Health check endpoint."""
     return jsonify({"status": "ok"}), 200
 
+def _counters() -> dict:
+    counters = {
+        "http_pool": container.http_pool.stats(),
+        "job_search_cache": job_search_cache.stats(),
+        "prompt_cache": get_prompt_cache().stats()
+    }
+    if evidence_partitions is not None:
+        counters["evidence_partitions"] = evidence_partitions.stats()
+
+    return counters
+
+@app.route("/api/metrics", methods=["GET"])
+def metrics():
+    """Cache and connection pool counters."""
+    return jsonify(_counters()), 200
+
 if __name__ == "__main__":
+    container.startup()
     app.run(
         debug=os.getenv("FLASK_DEBUG", "false").lower() == "true", 
         host=os.getenv("FLASK_HOST", "0.0.0.0"), 
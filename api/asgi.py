@@ -0,0 +1,299 @@
+"""Async ASGI serving mode.
+
+The job search and project generation routes, which spend nearly all of
+their time waiting on OpenWebNinja, Azure OpenAI and Redis, are served by a
+Quart app on shared async clients. Every other route falls through to the
+Flask app in api/app.py, run in a thread by the WSGI adapter, as do
+/api/project-ideas and its stream when PROJECT_IDEAS_QUEUE is true.
+
+Run from the repository root:
+    hypercorn api.asgi:application --bind 0.0.0.0:5001
+"""
+
+import os
+import asyncio
+from typing import Optional
+
+import httpx
+import redis.asyncio
+from asgiref.wsgi import WsgiToAsgi
+from openai import AsyncAzureOpenAI
+from quart import Quart, Response, request, jsonify
+from quart_cors import cors
+
+from api.app import (
+    app as flask_app,
+    container,
+    cache_codec,
+    _search_request_error,
+    _user_inputs,
+    _queue_search_writes,
+    _sse,
+    _counters,
+    ALLOWED_ORIGINS,
+    CACHE_DEFAULT_TIMEOUT,
+    PROJECT_IDEAS_QUEUE,
+    RECENT_SEARCHES_PAGE_SIZE,
+    RECENT_SEARCHES_MAX
+)
+from src.schemas.project_gen import GeneratedProject
+from src.utils.response_cache import AsyncResponseCache
+from src.utils.redis_single_flight import AsyncRedisSingleFlight, SingleFlightTimeout
+
+app = cors(Quart(__name__), allow_origin=ALLOWED_ORIGINS)
+
+# Created once the event loop is running, shared by every request
+http_client: Optional[httpx.AsyncClient] = None
+openai_client: Optional[AsyncAzureOpenAI] = None
+redis_client: Optional[redis.asyncio.Redis] = None
+job_search_cache: Optional[AsyncResponseCache] = None
+project_ideas_flight: Optional[AsyncRedisSingleFlight] = None
+
+@app.before_serving
+async def open_clients():
+    global http_client, openai_client, redis_client
+    global job_search_cache, project_ideas_flight
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("ASYNC_HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("HTTP_POOL_MAX_PER_HOST", "8")),
+            keepalive_expiry=float(os.getenv("HTTP_POOL_IDLE_TIMEOUT", "60"))
+        )
+    )
+    openai_client = AsyncAzureOpenAI(
+        api_key = os.getenv("AZURE_OPENAI_KEY"),
+        azure_endpoint = os.getenv("AZURE_ENDPOINT"),
+        api_version = os.getenv("API_VERSION")
+    )
+    redis_client = redis.asyncio.Redis(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        db=int(os.getenv("REDIS_DB", "0"))
+    )
+
+    job_search_cache = AsyncResponseCache(
+        redis_client,
+        ttl=int(os.getenv("JOB_SEARCH_CACHE_TTL", "3600")),
+        stale_ttl=int(os.getenv("JOB_SEARCH_CACHE_STALE_TTL", "600"))
+    )
+    project_ideas_flight = AsyncRedisSingleFlight(
+        redis_client,
+        lock_ttl=int(os.getenv("PROJECT_IDEAS_LOCK_TTL", "120")),
+        wait_timeout=float(os.getenv("PROJECT_IDEAS_WAIT_TIMEOUT", "90"))
+    )
+
+    # The sync clients of the routes falling through to Flask
+    await asyncio.to_thread(container.startup)
+
+@app.after_serving
+async def close_clients():
+    await http_client.aclose()
+    await openai_client.close()
+    await redis_client.aclose()
+
+@app.route("/api/scrape_locations", methods=["POST"])
+async def scrape_locations():
+    """Handle scraping request from React frontend."""
+    try:
+        data = await request.get_json()
+
+        error = _search_request_error(data)
+        if error is not None:
+            return jsonify({
+                "success": False,
+                "error": error
+            }), 400
+
+        user_inputs = _user_inputs(data)
+
+        main_pipeline = container.main_pipeline
+        job_listings = await main_pipeline.job_search_async(
+            user_inputs, http_client, job_search_cache
+        )
+
+        job_listings_dict = job_listings.model_dump(exclude_none=True)
+
+        async with redis_client.pipeline() as pipe:
+            job_search_id = _queue_search_writes(pipe, user_inputs, job_listings_dict)
+            await pipe.execute()
+
+        return jsonify({
+            "success": True,
+            "job_search_id": job_search_id,
+            "counts": {
+                "responses": len(job_listings_dict),
+            },
+        })
+
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+@app.route("/api/recent-searches", methods=["GET"])
+async def recent_searches():
+    """Lists the most recent searches.
+
+    Takes an optional limit query parameter, capped at RECENT_SEARCHES_MAX.
+    """
+    try:
+        limit = request.args.get("limit", default=RECENT_SEARCHES_PAGE_SIZE, type=int)
+        limit = max(1, min(limit, RECENT_SEARCHES_MAX))
+
+        search_ids = await redis_client.zrevrange("recent_searches", 0, limit - 1)
+        if not search_ids:
+            return jsonify([])
+
+        metadata_keys = [f"search_metadata:{id.decode()}" for id in search_ids]
+
+        recent_searches_list = []
+        for metadata in await redis_client.mget(metadata_keys):
+            if metadata is not None:
+                recent_searches_list.append(cache_codec.decode(metadata))
+
+        return jsonify(recent_searches_list)
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+async def _generate_ux_info(job_search_id: str) -> bytes:
+    job_listings = await redis_client.get(job_search_id)
+    dict_job_listings = cache_codec.decode(job_listings)
+
+    main_pipeline = container.main_pipeline
+    ux_info = await main_pipeline.project_idea_generation_async(
+        dict_job_listings, openai_client
+    )
+
+    return cache_codec.encode(ux_info.model_dump(exclude_none=True))
+
+@app.route("/api/project-ideas", methods=["POST"])
+async def project_ideas():
+    try:
+        data = await request.get_json()
+
+        job_search_id = data["job_search_id"]
+        ux_info_id = f"ux_info:{job_search_id}"
+
+        # Concurrent requests for the same search share one generation
+        ux_info = await project_ideas_flight.run(
+            ux_info_id, lambda: _generate_ux_info(job_search_id), CACHE_DEFAULT_TIMEOUT
+        )
+
+        return jsonify({
+            "id": ux_info_id,
+            "data": cache_codec.decode(ux_info)
+        })
+    except SingleFlightTimeout as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 503, {"Retry-After": "5"}
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+@app.route("/api/project-ideas/stream", methods=["POST"])
+async def project_ideas_stream():
+    """Streams each generated project as a server-sent event.
+
+    Emits a "project" event per GeneratedProject as soon as it is complete,
+    then a "done" event with the same payload as /api/project-ideas.
+    """
+    data = await request.get_json()
+    job_search_id = data["job_search_id"]
+    ux_info_id = f"ux_info:{job_search_id}"
+    timeout = CACHE_DEFAULT_TIMEOUT
+
+    def replay(ux_info: bytes):
+        dict_ux_info = cache_codec.decode(ux_info)
+        for project in dict_ux_info["project_list"]["projects"]:
+            yield _sse("project", project)
+        yield _sse("done", {"id": ux_info_id, "data": dict_ux_info})
+
+    async def generate():
+        try:
+            existing_ux_info = await redis_client.get(ux_info_id)
+            if existing_ux_info:
+                for event in replay(existing_ux_info):
+                    yield event
+                return
+
+            token = await project_ideas_flight.acquire(ux_info_id)
+            if token is None:
+                # Another request is generating, wait for its result instead
+                ux_info = await project_ideas_flight.run(
+                    ux_info_id, lambda: _generate_ux_info(job_search_id), timeout
+                )
+                for event in replay(ux_info):
+                    yield event
+                return
+
+            try:
+                # The previous holder may have stored it since our read
+                existing_ux_info = await redis_client.get(ux_info_id)
+                if existing_ux_info:
+                    for event in replay(existing_ux_info):
+                        yield event
+                    return
+
+                job_listings = await redis_client.get(job_search_id)
+                dict_job_listings = cache_codec.decode(job_listings)
+
+                main_pipeline = container.main_pipeline
+                async with project_ideas_flight.hold(ux_info_id, token):
+                    async for item in main_pipeline.project_idea_generation_stream_async(
+                        dict_job_listings, openai_client
+                    ):
+                        if isinstance(item, GeneratedProject):
+                            yield _sse("project", item.model_dump(exclude_none=True))
+                            continue
+
+                        ux_info_dict = item.model_dump(exclude_none=True)
+                        await redis_client.set(
+                            ux_info_id, cache_codec.encode(ux_info_dict), ex=timeout
+                        )
+                        yield _sse("done", {"id": ux_info_id, "data": ux_info_dict})
+            finally:
+                await project_ideas_flight.release(ux_info_id, token)
+        except Exception as e:
+            yield _sse("error", {"success": False, "error": str(e)})
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.route("/api/metrics", methods=["GET"])
+async def metrics():
+    """Cache and connection pool counters of both apps.
+
+    The Flask app's counters, as its /api/metrics reports them, plus those
+    of the async job search cache.
+    """
+    counters = _counters()
+    counters["async_job_search_cache"] = job_search_cache.stats()
+
+    return jsonify(counters), 200
+
+flask_asgi = WsgiToAsgi(flask_app)
+
+ASYNC_PATHS = {rule.rule for rule in app.url_map.iter_rules()} - {"/static/<path:filename>"}
+if PROJECT_IDEAS_QUEUE:
+    # Queued generation, and /api/jobs/<job_id>, are served by the Flask app
+    ASYNC_PATHS.discard("/api/project-ideas")
+    ASYNC_PATHS.discard("/api/project-ideas/stream")
+
+async def application(scope, receive, send):
+    """Routes lifespan events and the async paths to Quart, the rest to Flask."""
+    if scope["type"] == "lifespan" or scope.get("path") in ASYNC_PATHS:
+        await app(scope, receive, send)
+    else:
+        await flask_asgi(scope, receive, send)
@@ -0,0 +1,64 @@
+"""Background worker for queued project generation.
+
+Takes jobs enqueued by /api/project-ideas when PROJECT_IDEAS_QUEUE is true,
+generates the project list, matches the evidence and stores both where the
+inline routes would.
+
+Run from the repository root, as many processes as needed:
+    python -m api.worker
+"""
+
+import os
+import logging
+from typing import Any, Callable, Dict
+
+from api.app import (
+    container,
+    CACHE_DEFAULT_TIMEOUT,
+    cache_codec,
+    project_ideas_flight,
+    project_ideas_queue,
+    _generate_ux_info,
+    _parse_evidence
+)
+from src.utils.job_queue import QueueWorker
+
+def generate_project_ideas(
+    payload: Dict[str, Any], progress: Callable[[str], None]) -> Dict[str, Any]:
+    """Runs a queued project generation job.
+
+    Args:
+        payload (Dict[str, Any]): Holds the job_search_id to generate for.
+        progress (Callable[[str], None]): Records the current stage.
+
+    Returns:
+        Dict[str, Any]: Holds the Redis id of the stored ux_info.
+    """
+
+    job_search_id = payload["job_search_id"]
+    ux_info_id = f"ux_info:{job_search_id}"
+
+    progress("generating_projects")
+    # Shares the generation with any inline request for the same search
+    ux_info = project_ideas_flight.run(
+        ux_info_id, lambda: _generate_ux_info(job_search_id), CACHE_DEFAULT_TIMEOUT
+    )
+
+    progress("matching_evidence")
+    _parse_evidence(ux_info_id, cache_codec.decode(ux_info))
+
+    return {"id": ux_info_id}
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    container.startup()
+
+    worker = QueueWorker(
+        project_ideas_queue,
+        generate_project_ideas,
+        concurrency=int(os.getenv("PROJECT_IDEAS_WORKER_CONCURRENCY", "4"))
+    )
+    worker.run_forever()
+
+if __name__ == "__main__":
+    main()
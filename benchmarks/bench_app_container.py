@@ -0,0 +1,53 @@
+"""Benchmark for per-request pipeline construction.
+
+Compares building a MainPipeline and ProjectGenApi per request, which
+creates a new AzureOpenAI client each time, with taking both from an
+AppContainer. This only measures construction, the new client's cold
+connection pool also costs a TCP and TLS handshake on its first call.
+
+Run from the repository root:
+    python -m benchmarks.bench_app_container
+"""
+
+import os
+import timeit
+
+os.environ.setdefault("AZURE_OPENAI_KEY", "benchmark")
+os.environ.setdefault("AZURE_ENDPOINT", "https://benchmark.openai.azure.com")
+os.environ.setdefault("API_VERSION", "2024-08-01-preview")
+
+from benchmarks.fixtures import make_job_search_responses
+from src.pipelines.run import MainPipeline
+from src.pipelines.project_generation_api import ProjectGenApi
+from src.utils.app_container import AppContainer
+
+def main():
+    job_listings = make_job_search_responses(10).model_dump(exclude_none=True)
+    container = AppContainer()
+
+    # What MainPipeline.project_idea_generation builds before calling run
+    def per_request():
+        MainPipeline()
+        return ProjectGenApi(job_listings)
+
+    def shared():
+        main_pipeline = container.main_pipeline
+        return ProjectGenApi(job_listings, client=main_pipeline.get_openai_client())
+
+    assert per_request().client is not per_request().client
+    assert shared().client is shared().client
+
+    runs = 500
+    timings = {
+        "per request": timeit.timeit(per_request, number=runs),
+        "app container": timeit.timeit(shared, number=runs),
+    }
+
+    print(f"{runs} requests")
+    for name, seconds in timings.items():
+        print(f"{name:<16}{seconds / runs * 1e6:10.1f} us/request")
+
+    container.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark for the Redis cache codecs.
+
+Compares the stored size and encode/decode time of a job search result
+under the original json.dumps storage and each CacheCodec compression.
+
+Run from the repository root:
+    python -m benchmarks.bench_cache_codec
+"""
+
+import json
+import timeit
+
+from benchmarks.fixtures import make_job_search_responses
+from src.utils.cache_codec import CacheCodec, zstandard
+
+def main():
+    value = make_job_search_responses(100).model_dump(exclude_none=True)
+
+    codecs = {
+        "orjson": CacheCodec(compression="none"),
+        "orjson + zlib": CacheCodec(compression="zlib"),
+    }
+    if zstandard is not None:
+        codecs["orjson + zstd"] = CacheCodec(compression="zstd")
+
+    runs = 50
+
+    legacy = json.dumps(value).encode("utf-8")
+    rows = [(
+        "json (legacy)",
+        len(legacy),
+        timeit.timeit(lambda: json.dumps(value).encode("utf-8"), number=runs),
+        timeit.timeit(lambda: json.loads(legacy), number=runs)
+    )]
+
+    for name, codec in codecs.items():
+        encoded = codec.encode(value)
+        assert codec.decode(encoded) == value
+        rows.append((
+            name,
+            len(encoded),
+            timeit.timeit(lambda: codec.encode(value), number=runs),
+            timeit.timeit(lambda: codec.decode(encoded), number=runs)
+        ))
+
+    print(f"100 job listings x {runs} runs")
+    print(f"{'codec':<16}{'bytes':>10}{'ratio':>8}{'encode ms':>12}{'decode ms':>12}")
+    for name, size, encode, decode in rows:
+        print(
+            f"{name:<16}{size:>10}{size / len(legacy):>8.2f}"
+            f"{encode / runs * 1e3:>12.3f}{decode / runs * 1e3:>12.3f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark for parallel evidence scoring.
+
+Compares matching the evidence of a large ux_info serially with matching
+it on an EvidencePool of 2, 4 and every available core, keeping every
+match and the top 5 of each achievement. Listings get distinct
+qualifications, as otherwise only a handful of unique pairs are left to
+score.
+
+Run from the repository root:
+    python -m benchmarks.bench_evidence_parallel
+"""
+
+import os
+import timeit
+
+from benchmarks.fixtures import make_ux_info
+from src.utils.evidence_matcher import EvidenceMatcher
+from src.utils.evidence_pool import EvidencePool
+
+def main():
+    ux_info = make_ux_info(1000, distinct_qualifications=True)
+    projects = ux_info["project_list"]["projects"]
+    evidence = ux_info["evidence"]
+
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({n for n in (2, 4, cores) if n > 1})
+    pools = {workers: EvidencePool(workers=workers, min_pairs=0)
+        for workers in worker_counts}
+    for pool in pools.values():
+        pool.start()
+
+    runs = 3
+    for exhaustive in (False, True):
+        for top_k in (None, 5):
+            serial = EvidenceMatcher(
+                projects, evidence, exhaustive=exhaustive, top_k=top_k
+            )
+            expected = serial.run().to_dicts()
+
+            print(f"{len(serial.achievements)} achievements x "
+                f"{len(serial.qualifications)} qualifications"
+                f"{', exhaustive' if exhaustive else ''}"
+                f"{f', top {top_k}' if top_k else ''}")
+            seconds = timeit.timeit(serial.run, number=runs) / runs
+            print(f"  {'serial':<12}{seconds * 1e3:10.1f} ms")
+
+            for workers, pool in pools.items():
+                matcher = EvidenceMatcher(
+                    projects, evidence, exhaustive=exhaustive, top_k=top_k,
+                    pool=pool
+                )
+                assert matcher.run().to_dicts() == expected
+
+                seconds = timeit.timeit(matcher.run, number=runs) / runs
+                print(f"  {f'{workers} workers':<12}{seconds * 1e3:10.1f} ms")
+
+    for pool in pools.values():
+        pool.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark for incremental evidence matching.
+
+Compares matching a ux_info from scratch with EvidencePartitions after a
+single project is regenerated and after listings from a new search are
+added. Partitions are kept in the Redis server configured by REDIS_HOST,
+REDIS_PORT and REDIS_DB, and removed again afterwards.
+
+Run from the repository root:
+    python -m benchmarks.bench_evidence_partitions
+"""
+
+import copy
+import os
+import time
+
+import redis
+
+from benchmarks.fixtures import make_ux_info
+from src.utils.evidence_matcher import EvidenceMatcher
+from src.utils.evidence_partitions import EvidencePartitions
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def main():
+    redis_client = redis.Redis(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        db=int(os.getenv("REDIS_DB", "0"))
+    )
+    partitions = EvidencePartitions(redis_client, ttl=600)
+
+    ux_info = make_ux_info(1000, distinct_qualifications=True)
+    projects = ux_info["project_list"]["projects"]
+    evidence = ux_info["evidence"]
+
+    # A regenerated project and a second search's listings
+    regenerated = copy.deepcopy(projects)
+    regenerated[0]["achieved_qualifications"] = \
+        regenerated[0]["achieved_qualifications"][::-1]
+    extended = evidence + make_ux_info(
+        100, distinct_qualifications=True, seed=1
+    )["evidence"]
+
+    try:
+        _, seconds = timed(lambda: partitions.run(projects, evidence))
+        print(f"{'initial, all partitions':<32}{seconds * 1e3:10.1f} ms")
+
+        for name, (new_projects, new_evidence) in (
+            ("one project regenerated", (regenerated, evidence)),
+            ("100 listings added", (projects, extended)),
+        ):
+            expected, full = timed(
+                lambda: EvidenceMatcher(new_projects, new_evidence).run()
+            )
+            records, incremental = timed(
+                lambda: partitions.run(new_projects, new_evidence)
+            )
+            assert records.to_dicts() == expected.to_dicts()
+
+            print(name)
+            print(f"  {'from scratch':<30}{full * 1e3:10.1f} ms")
+            print(f"  {'incremental':<30}{incremental * 1e3:10.1f} ms")
+    finally:
+        keys = list(redis_client.scan_iter("evidence_partition:*"))
+        if keys:
+            redis_client.delete(*keys)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Benchmark for ranked evidence matching.
+
+Compares keeping every match over the threshold with keeping the top_k
+highest scoring matches of each achievement, by matching time and the size
+of the JSON payload sent to the frontend.
+
+Run from the repository root:
+    python -m benchmarks.bench_evidence_ranking
+"""
+
+import json
+import timeit
+
+from benchmarks.fixtures import make_ux_info
+from src.utils.evidence_matcher import EvidenceMatcher
+
+def main():
+    for n_jobs in (100, 1000, 5000):
+        ux_info = make_ux_info(n_jobs)
+        projects = ux_info["project_list"]["projects"]
+        evidence = ux_info["evidence"]
+
+        # Warm the normalisation cache so every mode scores equally fast
+        EvidenceMatcher(projects, evidence).score_matrix()
+
+        print(f"{n_jobs} listings")
+        for top_k in (None, 10, 5):
+            def run():
+                return EvidenceMatcher(projects, evidence, top_k=top_k).run()
+
+            runs = 3
+            seconds = timeit.timeit(run, number=runs) / runs
+            payload = json.dumps(run().to_dicts()).encode("utf-8")
+
+            name = "all matches" if top_k is None else f"top {top_k}"
+            print(f"  {name:<14}{seconds * 1e3:10.1f} ms{len(payload) / 1024:10.1f} KiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark for the internal representation of evidence matches.
+
+Compares building a frozen Match schema for every hit and deduplicating
+the schemas, as ProjectEvidence.run used to, with collecting MatchRecords
+and converting only the unique matches to the schema at the end. Reports
+time and peak traced memory for both.
+
+Run from the repository root:
+    python -m benchmarks.bench_evidence_records
+"""
+
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.fixtures import make_ux_info
+from src.schemas.project_evidence import Match, ProjectListRelevance
+from src.utils.evidence_matcher import EvidenceMatcher, SIMILARITY_THRESHOLD
+
+def legacy_run(matcher: EvidenceMatcher) -> ProjectListRelevance:
+    hits = matcher.score_matrix() >= SIMILARITY_THRESHOLD
+
+    matches = []
+    for project in matcher.projects:
+        rows = [matcher._achievement_idx[a] for a in project["achieved_qualifications"]]
+        for listing in matcher.evidence:
+            quals = listing.get("Qualifications") or []
+            cols = [matcher._qualification_idx[q] for q in quals]
+            if not rows or not cols:
+                continue
+
+            for i, j in np.argwhere(hits[np.ix_(rows, cols)]):
+                matches.append(Match(
+                    project_title=project["title"],
+                    project_achievement=project["achieved_qualifications"][i],
+                    job_title=listing["job_title"],
+                    company_name=listing["employer_name"],
+                    qualification=quals[j]
+                ))
+
+    return ProjectListRelevance(root=list(dict.fromkeys(matches)))
+
+def records_run(matcher: EvidenceMatcher) -> ProjectListRelevance:
+    return matcher.run().to_schema()
+
+def peak_memory(func, *args) -> int:
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+def main():
+    for n_jobs in (100, 1000):
+        ux_info = make_ux_info(n_jobs)
+        matcher = EvidenceMatcher(
+            ux_info["project_list"]["projects"], ux_info["evidence"]
+        )
+        # Warm the normalisation cache so both sides score equally fast
+        matcher.score_matrix()
+
+        expected = legacy_run(matcher)
+        assert records_run(matcher) == expected
+
+        runs = 5
+        print(f"{n_jobs} listings, {len(expected.root)} unique matches")
+        for name, func in (("Match per hit", legacy_run), ("MatchRecords", records_run)):
+            seconds = timeit.timeit(lambda: func(matcher), number=runs) / runs
+            peak = peak_memory(func, matcher)
+            print(f"  {name:<16}{seconds * 1e3:10.1f} ms{peak / 2**20:10.1f} MiB peak")
+
+if __name__ == "__main__":
+    main()
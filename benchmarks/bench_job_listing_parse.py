@@ -0,0 +1,84 @@
+"""Benchmark for parsing OpenWebNinja job search responses.
+
+Compares json.loads followed by the original JobListingsApi.parse_job_listing,
+which built every UserJobListing field by field, with validating the raw
+response in one pass through JSearchResponse.model_validate_json.
+
+Run from the repository root:
+    python -m benchmarks.bench_job_listing_parse
+"""
+
+import json
+import timeit
+from typing import Any, Dict, List
+
+from benchmarks.fixtures import make_raw_job_listings
+from src.pipelines.job_listings_api import JobListingsApi
+from src.schemas.jsearch_user_view import ApplyOption, JobHighlights, UserJobListing
+
+LISTING_FIELDS = [
+    "job_id", "job_title", "employer_name", "employer_logo",
+    "employer_website", "job_location", "job_city", "job_state",
+    "job_country", "job_is_remote", "job_employment_type",
+    "job_employment_types", "job_posted_at", "job_posted_at_timestamp",
+    "job_posted_at_datetime_utc", "job_salary", "job_min_salary",
+    "job_max_salary", "job_salary_period", "job_apply_link",
+    "job_apply_is_direct", "job_description", "job_benefits",
+    "job_publisher"
+]
+
+def legacy_parse_job_listing(own_data: Dict[str, Any]) -> List[UserJobListing]:
+    job_listings = []
+    for job in own_data["data"]:
+        apply_options = [
+            ApplyOption(
+                publisher=app_opts.get("publisher"),
+                apply_link=app_opts.get("apply_link"),
+                is_direct=app_opts.get("is_direct")
+            )
+            for app_opts in job["apply_options"]
+        ]
+
+        job_high = job["job_highlights"]
+        # The misspelt key was always dropped, so Responsibilities is None
+        job_highlight = JobHighlights(**{
+            "Qualifications": job_high.get("Qualifications"),
+            "Responsibilites": job_high.get("Responsibilities"),
+            "Benefits": job.get("job_benefits")
+        })
+
+        job_listings.append(UserJobListing(
+            **{field: job.get(field) for field in LISTING_FIELDS},
+            apply_options=apply_options,
+            job_highlights=job_highlight
+        ))
+
+    return job_listings
+
+def main():
+    api = JobListingsApi("data engineer", ["London"], None, None, None)
+
+    for n_jobs in (10, 100, 1000):
+        raw = json.dumps({"data": make_raw_job_listings(n_jobs)})
+
+        legacy = legacy_parse_job_listing(json.loads(raw))
+        fast = api.parse_job_listing_json(raw)
+        assert [job.model_dump() for job in fast] == \
+            [job.model_dump() for job in legacy]
+
+        runs = max(1, 2000 // n_jobs)
+        timings = {
+            "parse_job_listing": timeit.timeit(
+                lambda: legacy_parse_job_listing(json.loads(raw)), number=runs
+            ),
+            "model_validate_json": timeit.timeit(
+                lambda: api.parse_job_listing_json(raw), number=runs
+            ),
+        }
+
+        print(f"{n_jobs} listings")
+        for name, seconds in timings.items():
+            print(f"  {name:<22}{n_jobs * runs / seconds:12.0f} listings/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Microbenchmark for text_normalisation.
+
+Compares the per-call cost of the original sequential normaliser with the
+precompiled one, both uncached and served from the LRU cache.
+
+Run from the repository root:
+    python -m benchmarks.bench_text_normalisation
+"""
+
+import re
+import timeit
+
+from src.prompts.project_gen import EXAMPLE_RESPONSE
+from src.utils import text_normalisation as tn
+
+def legacy_text_normalisation(text: str):
+    text = text.lower().strip()
+
+    for key, val in tn.SPECIAL_TOKENS.items():
+        text = text.replace(key, val)
+
+    for pattern, repl in tn.CANONICAL_PHRASES:
+        text = re.sub(pattern, repl, text)
+
+    text = text.replace("&", " and ")
+    text = re.sub(r"[/\-]", " ", text)
+    text = re.sub(r"[^a-z0-9_\s]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+
+    toks = tn._light_lemmatise(tn._remove_stopwords(tn._tokens(text)))
+    token_set = set(toks)
+    token_set |= tn._add_ngrams(toks, 2)
+    token_set |= tn._add_ngrams(toks, 3)
+
+    return token_set
+
+def main():
+    corpus = [
+        qual
+        for project in EXAMPLE_RESPONSE
+        for qual in project["achieved_qualifications"]
+    ]
+
+    for text in corpus:
+        assert legacy_text_normalisation(text) == tn.text_normalisation(text)
+
+    uncached = tn.text_normalisation.__wrapped__
+    runs = 200
+    calls = runs * len(corpus)
+
+    timings = {
+        "legacy": timeit.timeit(
+            lambda: [legacy_text_normalisation(t) for t in corpus], number=runs
+        ),
+        "compiled": timeit.timeit(
+            lambda: [uncached(t) for t in corpus], number=runs
+        ),
+        "compiled + lru": timeit.timeit(
+            lambda: [tn.text_normalisation(t) for t in corpus], number=runs
+        ),
+    }
+
+    print(f"{len(corpus)} strings x {runs} runs")
+    for name, seconds in timings.items():
+        print(f"{name:<16}{seconds / calls * 1e6:8.2f} us/call")
+
+if __name__ == "__main__":
+    main()
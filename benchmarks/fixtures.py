@@ -0,0 +1,187 @@
+"""Synthetic but realistically sized job search payloads for benchmarks.
+
+Listings are built from the qualifications in EXAMPLE_RESPONSE with a seeded
+random generator, so every run sees the same data.
+"""
+
+import random
+from typing import Any, Dict, List
+
+from src.prompts.project_gen import EXAMPLE_RESPONSE
+from src.schemas.jsearch_user_view import UserJobSearchResponses
+
+QUALIFICATIONS = [
+    qual
+    for project in EXAMPLE_RESPONSE
+    for qual in project["achieved_qualifications"]
+]
+
+TITLES = [
+    "Data Scientist", "Machine Learning Engineer", "Data Engineer",
+    "Software Engineer", "Data Analyst", "MLOps Engineer"
+]
+
+COMPANIES = [
+    "Acme Analytics", "Northwind", "Globex", "Initech", "Umbrella Health",
+    "Stark Industries", "Wayne Enterprises", "Hooli"
+]
+
+LOCATIONS = ["London", "Manchester", "Bristol", "Leeds", "Edinburgh", "Cardiff"]
+
+PARAMETERS = {
+    "query": [f"Data Scientist roles in {loc}." for loc in LOCATIONS[:3]],
+    "country": "gb",
+    "date_posted": "week",
+    "off_site": False,
+    "employment_types": ["FULLTIME"]
+}
+
+def make_job_listing(rng: random.Random, idx: int) -> Dict[str, Any]:
+    """Builds a single job listing in the JSearch response shape.
+
+    Args:
+        rng (random.Random): Seeded generator.
+        idx (int): Position of the listing, used for its id.
+
+    Returns:
+        Dict[str, Any]: The job listing.
+    """
+
+    quals = rng.sample(QUALIFICATIONS, k=min(8, len(QUALIFICATIONS)))
+    sentences = rng.choices(QUALIFICATIONS, k=40)
+    location = rng.choice(LOCATIONS)
+
+    return {
+        "job_id": f"job-{idx:06d}",
+        "job_title": rng.choice(TITLES),
+        "employer_name": rng.choice(COMPANIES),
+        "employer_logo": f"https://logo.example.com/{idx}.png",
+        "employer_website": "https://www.example.com",
+        "job_location": f"{location}, UK",
+        "job_city": location,
+        "job_state": "England",
+        "job_country": "GB",
+        "job_is_remote": rng.random() < 0.3,
+        "job_employment_type": "Full-time",
+        "job_employment_types": ["FULLTIME"],
+        "job_posted_at": f"{rng.randint(1, 30)} days ago",
+        "job_posted_at_timestamp": 1760000000 + idx,
+        "job_posted_at_datetime_utc": "2025-10-09T00:00:00.000Z",
+        "job_salary": None,
+        "job_min_salary": 45000.0,
+        "job_max_salary": 70000.0,
+        "job_salary_period": "YEAR",
+        "job_apply_link": f"https://jobs.example.com/{idx}",
+        "job_apply_is_direct": False,
+        "apply_options": [
+            {
+                "publisher": "LinkedIn",
+                "apply_link": f"https://linkedin.example.com/{idx}",
+                "is_direct": False
+            }
+        ],
+        "job_description": ". ".join(sentences) + ".",
+        "job_highlights": {
+            "Qualifications": quals,
+            "Responsibilities": rng.sample(QUALIFICATIONS, k=4),
+            "Benefits": ["Pension", "Hybrid working", "25 days holiday"]
+        },
+        "job_benefits": ["retirement_savings", "paid_time_off"],
+        "job_publisher": "LinkedIn"
+    }
+
+def make_raw_job_listings(n_jobs: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Builds a list of raw job listings.
+
+    Args:
+        n_jobs (int): Number of listings.
+        seed (int): Seed for the generator.
+
+    Returns:
+        List[Dict[str, Any]]: The job listings.
+    """
+
+    rng = random.Random(seed)
+    return [make_job_listing(rng, idx) for idx in range(n_jobs)]
+
+def make_job_search_responses(
+    n_jobs: int, per_response: int = 10, seed: int = 0) -> UserJobSearchResponses:
+    """Builds a job search result as stored in Redis by /api/scrape_locations.
+
+    Args:
+        n_jobs (int): Total number of listings.
+        per_response (int): Listings per upstream response.
+        seed (int): Seed for the generator.
+
+    Returns:
+        UserJobSearchResponses: The job search result.
+    """
+
+    listings = make_raw_job_listings(n_jobs, seed)
+    responses = [
+        listings[i:i + per_response] for i in range(0, n_jobs, per_response)
+    ]
+
+    return UserJobSearchResponses(
+        parameters=PARAMETERS,
+        job_listings=responses
+    )
+
+def make_qualification(rng: random.Random) -> str:
+    """Builds a qualification by splicing two from QUALIFICATIONS.
+
+    Args:
+        rng (random.Random): Seeded generator.
+
+    Returns:
+        str: The qualification, almost always distinct from the others.
+    """
+
+    head, tail = rng.sample(QUALIFICATIONS, k=2)
+    head_words, tail_words = head.split(), tail.split()
+
+    return " ".join(
+        head_words[:rng.randint(2, len(head_words))]
+        + tail_words[rng.randint(0, len(tail_words) - 2):]
+    )
+
+def make_ux_info(
+    n_jobs: int, distinct_qualifications: bool = False, seed: int = 0
+) -> Dict[str, Any]:
+    """Builds a ux_info payload as stored in Redis by /api/project-ideas.
+
+    The project list is EXAMPLE_RESPONSE, so every listing shares
+    qualifications with the projects.
+
+    Args:
+        n_jobs (int): Number of listings in the evidence.
+        distinct_qualifications (bool): Give every listing its own spliced
+            qualifications, as real listings word them differently, instead
+            of repeating QUALIFICATIONS verbatim.
+        seed (int): Seed for the generator.
+
+    Returns:
+        Dict[str, Any]: The ux_info payload.
+    """
+
+    rng = random.Random(seed)
+    evidence = []
+    for listing in make_raw_job_listings(n_jobs, seed):
+        quals = listing["job_highlights"]["Qualifications"]
+        if distinct_qualifications:
+            quals = [make_qualification(rng) for _ in quals]
+
+        evidence.append({
+            "job_id": listing["job_id"],
+            "job_title": listing["job_title"],
+            "employer_name": listing["employer_name"],
+            "job_location": listing["job_location"],
+            "job_apply_link": listing["job_apply_link"],
+            "Qualifications": quals
+        })
+
+    return {
+        "parameters": PARAMETERS,
+        "project_list": {"projects": EXAMPLE_RESPONSE},
+        "evidence": evidence
+    }
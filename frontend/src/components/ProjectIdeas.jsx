@@ -4,10 +4,133 @@ import { Home, X } from "lucide-react";
 import styles from '../styles/components/ProjectIdeas.module.css';
 import API_URL from "../config";
 
+const JOB_POLL_INTERVAL_MS = 2000;
+// Long enough for every attempt a worker makes with the default
+// PROJECT_IDEAS_VISIBILITY_TIMEOUT and PROJECT_IDEAS_MAX_ATTEMPTS
+const JOB_POLL_TIMEOUT_MS = 15 * 60 * 1000;
+
+async function pollJob(statusUrl) {
+    const deadline = Date.now() + JOB_POLL_TIMEOUT_MS;
+
+    while (Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+
+        const response = await fetch(`${API_URL}${statusUrl}`);
+        const job = await response.json();
+        if (!response.ok) {
+            throw new Error(job.error || "Failed to fetch job status");
+        }
+
+        if (job.status === "succeeded") {
+            if (!job.data) {
+                throw new Error("Generated project ideas have expired");
+            }
+            return { id: job.id, data: job.data };
+        }
+        if (job.status === "failed") {
+            throw new Error(job.error || "Failed to generate project ideas");
+        }
+    }
+
+    throw new Error("Timed out waiting for project ideas, please try again");
+}
+
+// Splits a server-sent event into its name and JSON data
+function parseEvent(block) {
+    let event = "message";
+    let data = "";
+    for (const line of block.split("\n")) {
+        if (line.startsWith("event: ")) {
+            event = line.slice("event: ".length);
+        } else if (line.startsWith("data: ")) {
+            data += line.slice("data: ".length);
+        }
+    }
+    return { event, data: data ? JSON.parse(data) : null };
+}
+
+// Reads /api/project-ideas/stream, passing each project to onProject as
+// soon as it is generated. Resolves with the same payload as
+// /api/project-ideas, or null if the stream is not available.
+async function streamProjectIdeas(jobSearchId, onProject) {
+    const response = await fetch(`${API_URL}/api/project-ideas/stream`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ job_search_id: jobSearchId }),
+    });
+    if (!response.ok || !response.body) {
+        return null;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            throw new Error("Project stream ended before it was done");
+        }
+
+        buffer += decoder.decode(value, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+            const { event, data } = parseEvent(buffer.slice(0, boundary));
+            buffer = buffer.slice(boundary + 2);
+
+            if (event === "project") {
+                onProject(data);
+            } else if (event === "done") {
+                reader.cancel();
+                return data;
+            } else if (event === "error") {
+                throw new Error(data.error || "Failed to generate project ideas");
+            }
+        }
+    }
+}
+
+async function fetchProjectIdeas(jobSearchId) {
+    const response = await fetch(`${API_URL}/api/project-ideas`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ job_search_id: jobSearchId }),
+    });
+
+    let data = await response.json();
+    if (!response.ok) {
+        throw new Error(data.error || "Failed to generate project ideas");
+    }
+
+    // Queued on a worker, poll the job until it finishes
+    if (response.status === 202) {
+        data = await pollJob(data.status_url);
+    }
+
+    return data;
+}
+
+// Fetches a page of saved projects, newest first. cursor is the
+// next_cursor of the previous page, or null for the first page.
+async function fetchSavedProjects(cursor = null) {
+    const query = cursor === null ? "" : `?cursor=${cursor}`;
+    const response = await fetch(`${API_URL}/api/fetch-saved-projects${query}`);
+    const data = await response.json();
+
+    if (!response.ok) {
+        throw new Error(data.error || "Failed to fetch saved projects");
+    }
+
+    return { items: data.items, nextCursor: data.next_cursor ?? null };
+}
+
 function ProjectIdeas() {
     const { jobSearchId } = useParams();
     const [uxInformation, setUxInformation] = useState(null);
+    const [streamedProjects, setStreamedProjects] = useState([]);
     const [savedProjects, setSavedProjects] = useState(null);
+    const [savedCursor, setSavedCursor] = useState(null);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
     const [isSaved, setIsSaved] = useState(false);
     const [deleteConfirmation, setDeleteConfirmation] = useState(null);
     const [error, setError] = useState(null);
@@ -34,15 +157,19 @@ function ProjectIdeas() {
 
         (async () => {
             try {
-                const response = await fetch(`${API_URL}/api/project-ideas`, {
-                    method: "POST",
-                    headers: { "Content-Type": "application/json" },
-                    body: JSON.stringify({ job_search_id: jobSearchId }),
-                });
+                let data = null;
+                try {
+                    data = await streamProjectIdeas(jobSearchId, (project) => (
+                        setStreamedProjects(prev => [...prev, project])
+                    ));
+                } catch (err) {
+                    console.error('Error streaming project ideas:', err);
+                }
 
-                const data = await response.json();
-                if (!response.ok) {
-                    throw new Error(data.error || "Failed to generate project ideas");
+                // Streaming unavailable or interrupted, wait for the whole list
+                if (!data) {
+                    setStreamedProjects([]);
+                    data = await fetchProjectIdeas(jobSearchId);
                 }
 
                 setUxInformation(data);
@@ -59,14 +186,10 @@ function ProjectIdeas() {
     useEffect(() => {
         (async () => {
             try {
-                const response = await fetch(`${API_URL}/api/fetch-saved-projects`);
-                const data = await response.json();
-                
-                if (!response.ok) {
-                    throw new Error(data.error || "Failed to fetch saved projects");
-                }
+                const page = await fetchSavedProjects();
 
-                setSavedProjects(data);
+                setSavedProjects(page.items);
+                setSavedCursor(page.nextCursor);
             } catch (err) {
                 console.error('Error fetching saved projects:', err);
                 // Non-critical: just set empty array
@@ -80,12 +203,14 @@ function ProjectIdeas() {
         throw error;
     }
 
-    if (!uxInformation) {
+    if (!uxInformation && streamedProjects.length === 0) {
         return <div className="loading">Generating project ideas...</div>;
     }
 
-    const projectList = uxInformation.data.project_list.projects
-    const uxInfoId = uxInformation.id
+    // Projects streamed so far are shown while the rest are generated
+    const isGenerating = !uxInformation
+    const projectList = isGenerating ? streamedProjects : uxInformation.data.project_list.projects
+    const uxInfoId = isGenerating ? null : uxInformation.id
 
     const handleSubmit = async (title) => {
         navigate(`/project-evidence/${uxInfoId}?project=${encodeURIComponent(title)}`);
@@ -104,14 +229,10 @@ function ProjectIdeas() {
                 throw new Error(data.error || "Failed to save project");
             }
 
-            const fetchResponse = await fetch(`${API_URL}/api/fetch-saved-projects`);
-            const fetchData = await fetchResponse.json();
-            
-            if (!fetchResponse.ok) {
-                throw new Error(fetchData.error || "Failed to refresh saved projects");
-            }
+            const page = await fetchSavedProjects();
 
-            setSavedProjects(fetchData);
+            setSavedProjects(page.items);
+            setSavedCursor(page.nextCursor);
             setIsSaved(true);
         } catch (err) {
             console.error('Error saving project:', err);
@@ -119,6 +240,20 @@ function ProjectIdeas() {
         }
     }
 
+    const handleLoadMore = async () => {
+        setIsLoadingMore(true);
+        try {
+            const page = await fetchSavedProjects(savedCursor);
+
+            setSavedProjects(prev => [...prev, ...page.items]);
+            setSavedCursor(page.nextCursor);
+        } catch (err) {
+            console.error('Error fetching more saved projects:', err);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    }
+
     const handleDelete = async (e, projectId) => {
         e.preventDefault();
         e.stopPropagation();
@@ -150,12 +285,16 @@ function ProjectIdeas() {
             <header className={styles.header}>
                 <h1 className={styles.title}>Project Ideas</h1>
                 <div className={styles.actions}>
-                    <button className={styles.saveBtn} onClick={handleSave} disabled={isSaved}>
+                    <button className={styles.saveBtn} onClick={handleSave} disabled={isSaved || isGenerating}>
                         Save Results
                     </button>
                 </div>
             </header>
 
+            {isGenerating && (
+                <div className="loading">Generating more project ideas...</div>
+            )}
+
             <div className={styles.projectGrid}>
                 {projectList.map((project, idx) => (
                     <article key={idx} className={styles.projectCard}>
@@ -208,6 +347,7 @@ function ProjectIdeas() {
                         <button 
                             className={styles.evidenceBtn} 
                             onClick={() => handleSubmit(project.title)}
+                            disabled={isGenerating}
                         >
                             View Market Evidence →
                         </button>
@@ -270,6 +410,15 @@ function ProjectIdeas() {
                                 </div>
                             ))}
                         </div>
+                        {savedCursor !== null && (
+                            <button
+                                className={styles.loadMoreBtn}
+                                onClick={handleLoadMore}
+                                disabled={isLoadingMore}
+                            >
+                                {isLoadingMore ? "Loading..." : "Load more"}
+                            </button>
+                        )}
                     </aside>
                 )}
             </div>
@@ -0,0 +1,67 @@
+from typing import Dict, Any, List, Tuple
+
+from psycopg2.extras import execute_values
+from psycopg2.extensions import connection, cursor
+
+from src.pipelines.save_project_data import SaveProjectData
+from src.queries.general import ALLOCATE_HISTORY_IDS, ADD_HISTORY_BULK
+
+class BulkSaveProjectData:
+
+    def __init__(self,
+        saves: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        db_conn: connection,
+        db_curs: cursor,
+        batch_size: int = 500
+    ):
+        """Initialisation method for BulkSaveProjectData.
+
+        Args:
+            saves (List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]): Pairs
+                of ux_info and parsed evidence, as taken by SaveProjectData.
+            db_conn (connection): Represents the active connection from the
+                python app the PostgresSQL server.
+            db_curs (cursor): Runs the SQL queries.
+            batch_size (int): Rows sent to the server per INSERT statement.
+        """
+
+        self.saves = saves
+        self.db_conn = db_conn
+        self.db_curs = db_curs
+        self.batch_size = batch_size
+
+    def run(self) -> List[int]:
+        """Main orchestration workflow method.
+
+        Every row is inserted in a single transaction, so either all of the
+        project data is saved or none of it is.
+
+        Returns:
+            List[int]: IDs of the saved rows, in the order of saves.
+        """
+
+        if not self.saves:
+            return []
+
+        # RETURNING doesn't promise the order of the inserted rows, so the
+        # ids are taken from the sequence up front and paired with the saves
+        self.db_curs.execute(ALLOCATE_HISTORY_IDS, (len(self.saves),))
+        ids = sorted(row[0] for row in self.db_curs.fetchall())
+
+        rows = [
+            (id,) + SaveProjectData(
+                ux_info, parsed_evidence, self.db_conn, self.db_curs
+            ).build_row()
+            for id, (ux_info, parsed_evidence) in zip(ids, self.saves)
+        ]
+
+        # Each batch becomes one multi-row INSERT
+        execute_values(
+            self.db_curs,
+            ADD_HISTORY_BULK,
+            rows,
+            page_size=self.batch_size
+        )
+        self.db_conn.commit()
+
+        return ids
@@ -0,0 +1,161 @@
+import io
+import csv
+import sys
+import json
+import argparse
+from typing import Iterator, List, Tuple
+
+from psycopg2.extensions import connection
+
+from src.queries.general import EXPORT_HISTORY
+from src.schemas.retrieved_saved_data import SavedData
+from src.utils.db_pool import DatabasePool
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+CSV_COLUMNS = ["id", "title", "parameters", "project_list", "evidence"]
+
+class ExportSavedData:
+
+    def __init__(self,
+        db_conn: connection,
+        output_format: str = "ndjson",
+        itersize: int = 500
+    ):
+        """Initialisation method for ExportSavedData.
+
+        Args:
+            db_conn (connection): Represents the active connection from the
+                python app the PostgresSQL server.
+            output_format (str): Either ndjson or csv.
+            itersize (int): Rows fetched from the server per round trip.
+
+        Raises:
+            ValueError: If output_format is not supported.
+        """
+
+        if output_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {output_format}")
+
+        self.db_conn = db_conn
+        self.output_format = output_format
+        self.itersize = itersize
+
+    def run(self) -> Iterator[str]:
+        """Main orchestration workflow method for ExportSavedData.
+
+        Rows are read through a server-side cursor, so only itersize rows
+        are held in memory at a time however large the history table is.
+
+        Yields:
+            str: Lines of the export, each ending in a newline.
+        """
+
+        if self.output_format == "csv":
+            yield self.format_csv_row(CSV_COLUMNS)
+
+        for row in self.retrieve_data():
+            saved_data = self.parse_row(row)
+
+            if self.output_format == "csv":
+                yield self.format_csv_row([
+                    str(saved_data.id),
+                    saved_data.title,
+                    saved_data.parameters.model_dump_json(),
+                    saved_data.project_list.model_dump_json(),
+                    saved_data.evidence.model_dump_json(exclude_none=True)
+                ])
+            else:
+                yield self.format_ndjson_row(saved_data)
+
+    def retrieve_data(self) -> Iterator[Tuple]:
+        """Streams the saved data from the history database.
+
+        Yields:
+            Tuple: Each row of the history database, in id order.
+        """
+
+        # Naming the cursor makes psycopg2 declare it on the server
+        with self.db_conn.cursor(name="export_history") as db_curs:
+            db_curs.itersize = self.itersize
+            db_curs.execute(EXPORT_HISTORY)
+            yield from db_curs
+
+    def parse_row(self, row: Tuple) -> SavedData:
+        """Parses a row of the history database.
+
+        Args:
+            row (Tuple): Row retrieved by EXPORT_HISTORY.
+
+        Returns:
+            SavedData: Schema for the parsed row.
+        """
+
+        relevant_data = {
+            "id": row[0],
+            "title": row[1],
+            "parameters": row[2],
+            "project_list": row[3],
+            "evidence": row[4]
+        }
+
+        return SavedData(**relevant_data)
+
+    def format_ndjson_row(self, saved_data: SavedData) -> str:
+        """Formats a single NDJSON row.
+
+        Args:
+            saved_data (SavedData): The parsed row.
+
+        Returns:
+            str: The JSON encoded row, ending in a newline.
+        """
+
+        row = saved_data.model_dump(mode="json")
+        # Matches are saved without a score unless they were ranked
+        row["evidence"] = saved_data.evidence.model_dump(mode="json", exclude_none=True)
+
+        return json.dumps(row) + "\n"
+
+    def format_csv_row(self, values: List[str]) -> str:
+        """Formats a single CSV row.
+
+        Args:
+            values (List[str]): Values of the row.
+
+        Returns:
+            str: The CSV encoded row.
+        """
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+
+        return buffer.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the saved project history."
+    )
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--output", default="-",
+        help="File to write to, or - for stdout.")
+    parser.add_argument("--itersize", type=int, default=500,
+        help="Rows fetched from the server per round trip.")
+    args = parser.parse_args()
+
+    db_pool = DatabasePool.from_env()
+    output = sys.stdout if args.output == "-" else \
+        open(args.output, "w", newline="", encoding="utf-8")
+
+    try:
+        with db_pool.connection() as db_conn:
+            export = ExportSavedData(db_conn, args.format, args.itersize)
+            for line in export.run():
+                output.write(line)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        db_pool.close()
+
+if __name__ == "__main__":
+    main()
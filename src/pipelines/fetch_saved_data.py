@@ -2,24 +2,42 @@ from typing import List, Tuple, Optional
 
 from psycopg2.extensions import connection, cursor
 
-from src.queries.general import RETRIEVE_DATA
-from src.schemas.retrieved_saved_data import SavedData, SavedDataList
-from src.schemas.base import Parameters
-from src.schemas.project_gen import ProjectList, ProjectIdeaEvidence
+from src.queries.general import (
+    RETRIEVE_SAVED_SUMMARIES,
+    RETRIEVE_SAVED_SUMMARIES_BEFORE
+)
+from src.schemas.retrieved_saved_data import SavedDataSummary, SavedDataPage
 
 class FetchSavedData:
 
-    def __init__(self, db_conn: connection, db_curs: cursor):
+    def __init__(self, 
+        db_conn: connection, 
+        db_curs: cursor,
+        before_id: Optional[int] = None,
+        limit: int = 20
+    ):
+        """Initialisation method for FetchSavedData.
+
+        Args:
+            db_conn (connection): Represents the active connection from the
+                python app the PostgresSQL server.
+            db_curs (cursor): Runs the SQL queries.
+            before_id (Optional[int]): ID of the last row on the previous 
+                page, or None for the first page.
+            limit (int): Maximum number of rows on the page.
+        """
+
         self.db_conn = db_conn
         self.db_curs = db_curs
+        self.before_id = before_id
+        self.limit = limit
 
-
-    def run(self) -> Optional[SavedDataList]:
+    def run(self) -> SavedDataPage:
         """Main orchestration workflow method.
 
         Returns:
-            Optional[SavedDataList]: Contains the saved data from the PostgreSQL
-                database, or None if the database is empty.
+            SavedDataPage: A page of saved data summaries from the PostgreSQL
+                database, and the cursor for the next page.
         """
 
         retrieved_data = self.retrieve_data()
@@ -28,19 +46,28 @@ class FetchSavedData:
         return parsed_data
 
     def retrieve_data(self) -> List[Tuple]:
-        """Retrieves data from the history database.
+        """Retrieves a page of summaries from the history database.
+
+        Pages run from the newest save to the oldest, so new saves are on
+        the first page. Only the columns needed to list saved projects are 
+        selected, full rows are loaded by FetchRequestedData.
 
         Returns:
-            List[Tuple]: Retrieved data from the database.
+            List[Tuple]: Retrieved data from the database, with one row
+                beyond the page if there is a next page.
         """
 
-        self.db_curs.execute(RETRIEVE_DATA)
+        if self.before_id is None:
+            self.db_curs.execute(RETRIEVE_SAVED_SUMMARIES, (self.limit + 1,))
+        else:
+            self.db_curs.execute(RETRIEVE_SAVED_SUMMARIES_BEFORE,
+                (self.before_id, self.limit + 1))
         data = self.db_curs.fetchall()
 
         return data
     
     def parse_retrieved_data(self,
-        retrieved_data: List[Tuple]) -> SavedDataList:
+        retrieved_data: List[Tuple]) -> SavedDataPage:
         """Parses the retrieved database data.
 
         Args:
@@ -48,18 +75,21 @@ class FetchSavedData:
                 database.
         
         Returns:
-            SavedDataList: Schema for the parsed data from the database.
+            SavedDataPage: Schema for the parsed page of data from the 
+                database.
         """
 
         saved_data_list = []
-        for row in retrieved_data:
+        for row in retrieved_data[:self.limit]:
             relevant_data = {
                 "id": row[0],
-                "title": row[2],
-                "parameters": row[3],
-                "project_list": row[4],
-                "evidence":row[5]
+                "title": row[1],
+                "parameters": row[2]
             }
-            saved_data_list.append(SavedData(**relevant_data))
+            saved_data_list.append(SavedDataSummary(**relevant_data))
+
+        next_cursor = None
+        if len(retrieved_data) > self.limit and saved_data_list:
+            next_cursor = saved_data_list[-1].id
         
-        return SavedDataList(root=saved_data_list)
+        return SavedDataPage(items=saved_data_list, next_cursor=next_cursor)
@@ -1,9 +1,10 @@
 import os
-import http.client
+import asyncio
 from typing import Dict, Any
-from urllib.parse import urlencode
-from typing import List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+from typing import List, Optional, Tuple, Union
 
+import httpx
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -11,10 +12,12 @@ from src.schemas.jsearch_user_view import (
     UserJobSearchResponse,
     UserJobSearchResponses,
     UserJobListing,
-    JobHighlights,
-    ApplyOption,
-    Parameters
+    Parameters,
+    JSearchResponse
 )
+from src.utils.concurrent_fetch import fetch_concurrently
+from src.utils.http_pool import HTTPStatusError, get_http_pool
+from src.utils.response_cache import ResponseCache, AsyncResponseCache
 
 class JobListingsApi():
     """Class for parsing job listing data from OpenWebNinja API.
@@ -29,7 +32,10 @@ class JobListingsApi():
         uk_locations: Optional[List[str]],
         date_posted: Optional[str],
         off_site: Optional[bool],
-        employment_types: Optional[List[str]]
+        employment_types: Optional[List[str]],
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """Initialize JobListingsApi instance.
 
@@ -43,6 +49,13 @@ class JobListingsApi():
                 positions, or None if no off_site filter is applied.
             employment_types (Optional[List[str]]): List of employment types 
                 to filter by, or None if no employment_types filter is applied.
+            max_in_flight (Optional[int]): Maximum number of concurrent 
+                requests to the API, or None to read JOB_LISTINGS_MAX_IN_FLIGHT.
+            timeout (Optional[float]): Per-request timeout in seconds, or None 
+                to read JOB_LISTINGS_TIMEOUT.
+            response_cache (Optional[ResponseCache]): Cache for upstream 
+                responses keyed by query parameters, or None to always call 
+                the API.
         """
 
         self.role = role
@@ -52,7 +65,19 @@ class JobListingsApi():
         self.employment_types = employment_types
 
         self.api_key = os.getenv("OPEN_WEB_NINJA_API_KEY")
-        self.conn = http.client.HTTPSConnection("api.openwebninja.com")
+        self.api_url = urlsplit(
+            os.getenv("OPEN_WEB_NINJA_URL", "https://api.openwebninja.com")
+        )
+
+        if max_in_flight is None:
+            max_in_flight = int(os.getenv("JOB_LISTINGS_MAX_IN_FLIGHT", "8"))
+        if timeout is None:
+            timeout = float(os.getenv("JOB_LISTINGS_TIMEOUT", "30"))
+
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.http_pool = get_http_pool()
+        self.response_cache = response_cache
     
     def run(self) -> UserJobSearchResponses:
         """Main orchestration workflow method. (Alter when return type is found).
@@ -62,23 +87,88 @@ class JobListingsApi():
                 search response.
         """
 
+        search_params = self.build_search_params()
+
+        # Wall-clock latency tracks the slowest query rather than their sum
+        job_listings = fetch_concurrently(
+            self.fetch_job_listing,
+            search_params,
+            self.max_in_flight
+        )
+
+        return self.build_response(search_params, job_listings)
+
+    async def run_async(self,
+        http_client: httpx.AsyncClient,
+        response_cache: Optional[AsyncResponseCache] = None
+    ) -> UserJobSearchResponses:
+        """Asynchronous variant of run.
+
+        Args:
+            http_client (httpx.AsyncClient): Client for the OpenWebNinja API,
+                shared across requests.
+            response_cache (Optional[AsyncResponseCache]): Cache for upstream
+                responses keyed by query parameters, or None to always call
+                the API.
+
+        Returns:
+            UserJobSearchResponses: List of the schema for the parsed job
+                search response.
+        """
+
+        search_params = self.build_search_params()
+
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        async def fetch(params: Tuple[str, Dict[str, Any]]) -> UserJobSearchResponse:
+            async with in_flight:
+                return await self.fetch_job_listing_async(
+                    params, http_client, response_cache
+                )
+
+        job_listings = await asyncio.gather(
+            *(fetch(params) for params in search_params)
+        )
+
+        return self.build_response(search_params, list(job_listings))
+
+    def build_search_params(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Builds the query parameters for every location and employment type.
+
+        Returns:
+            List[Tuple[str, Dict[str, Any]]]: Parsed query parameters from
+                parse_params, one per query.
+        """
+
         uk_locs = [None] if self.uk_locations == [] else self.uk_locations
         emp_types = [None] if self.employment_types == [] else self.employment_types
 
-        job_listings = []
-        query_list = []
+        return [
+            self.parse_params(uk_loc, emp_type)
+            for uk_loc in uk_locs
+            for emp_type in emp_types
+        ]
 
-        for uk_loc in uk_locs:
-            for emp_type in emp_types:
-                param_url, params = self.parse_params(uk_loc, emp_type)
-                # retrieved_data = self.retrieve_own_data(param_url)
-                # own_data = json.loads(retrieved_data)
-                job_listing = self.parse_job_listing(self.EXAMPLE_RESPONSE)
-                response = UserJobSearchResponse(root=job_listing)
+    def build_response(self,
+        search_params: List[Tuple[str, Dict[str, Any]]],
+        job_listings: List[UserJobSearchResponse]
+    ) -> UserJobSearchResponses:
+        """Assembles the job search response.
+
+        Args:
+            search_params (List[Tuple[str, Dict[str, Any]]]): Parsed query 
+                parameters from build_search_params.
+            job_listings (List[UserJobSearchResponse]): Parsed response for
+                each query, in the same order.
+
+        Returns:
+            UserJobSearchResponses: List of the schema for the parsed job
+                search response.
+        """
+
+        emp_types = [None] if self.employment_types == [] else self.employment_types
+        query_list = [params["query"] for _, params in search_params]
 
-                job_listings.append(response)
-                query_list.append(params["query"])
-    
         parsed_params = {
             "query": query_list,
             "country": "uk",
@@ -98,6 +188,30 @@ class JobListingsApi():
         
         return UserJobSearchResponses(**job_search_response)
 
+    def fetch_job_listing(self,
+        search_params: Tuple[str, Dict[str, Any]]) -> UserJobSearchResponse:
+        """Retrieves and parses the job listings for a single query.
+
+        Args:
+            search_params (Tuple[str, Dict[str, Any]]): Parsed query 
+                parameters from parse_params.
+
+        Returns:
+            UserJobSearchResponse: The schema for the parsed job search 
+                response.
+        """
+
+        param_url, params = search_params
+        if self.response_cache is not None:
+            retrieved_data = self.response_cache.get_or_fetch(
+                params, lambda: self.retrieve_own_data(param_url)
+            )
+        else:
+            retrieved_data = self.retrieve_own_data(param_url)
+        job_listing = self.parse_job_listing_json(retrieved_data)
+
+        return UserJobSearchResponse(root=job_listing)
+
     def retrieve_own_data(self, params: str) -> str:
         """Retrieves job listings.
 
@@ -106,18 +220,91 @@ class JobListingsApi():
 
         Returns:
             str: Returns job listings in string representation.
+
+        Raises:
+            HTTPStatusError: If the API responds with a non-2xx status, so
+                error bodies are never cached.
         """
 
         headers = {
             "x-api-key": self.api_key
         }
 
-        endpoint = f"/jsearch/search{params}"
-        self.conn.request("GET", endpoint, headers=headers)
-        res = self.conn.getresponse()
-        data = res.read()
+        endpoint = f"{self.api_url.path.rstrip('/')}/jsearch/search{params}"
+        status, data = self.http_pool.request(
+            self.api_url.scheme,
+            self.api_url.netloc,
+            "GET",
+            endpoint,
+            headers=headers,
+            timeout=self.timeout
+        )
+        if not 200 <= status < 300:
+            raise HTTPStatusError(status, data)
 
         return data.decode("utf-8")
+
+    async def fetch_job_listing_async(self,
+        search_params: Tuple[str, Dict[str, Any]],
+        http_client: httpx.AsyncClient,
+        response_cache: Optional[AsyncResponseCache] = None
+    ) -> UserJobSearchResponse:
+        """Asynchronous variant of fetch_job_listing.
+
+        Args:
+            search_params (Tuple[str, Dict[str, Any]]): Parsed query 
+                parameters from parse_params.
+            http_client (httpx.AsyncClient): Client for the OpenWebNinja API.
+            response_cache (Optional[AsyncResponseCache]): Cache for upstream
+                responses, or None to always call the API.
+
+        Returns:
+            UserJobSearchResponse: The schema for the parsed job search 
+                response.
+        """
+
+        param_url, params = search_params
+        if response_cache is not None:
+            retrieved_data = await response_cache.get_or_fetch(
+                params, lambda: self.retrieve_own_data_async(param_url, http_client)
+            )
+        else:
+            retrieved_data = await self.retrieve_own_data_async(param_url, http_client)
+        job_listing = self.parse_job_listing_json(retrieved_data)
+
+        return UserJobSearchResponse(root=job_listing)
+
+    async def retrieve_own_data_async(self,
+        params: str, http_client: httpx.AsyncClient) -> str:
+        """Asynchronous variant of retrieve_own_data.
+
+        Args:
+            params (str): Contains parsed parameters.
+            http_client (httpx.AsyncClient): Client for the OpenWebNinja API.
+
+        Returns:
+            str: Returns job listings in string representation.
+
+        Raises:
+            httpx.HTTPStatusError: If the API responds with a non-2xx
+                status, so error bodies are never cached.
+        """
+
+        headers = {
+            "x-api-key": self.api_key
+        }
+
+        url = self.api_url._replace(
+            path=f"{self.api_url.path.rstrip('/')}/jsearch/search"
+        ).geturl()
+        response = await http_client.get(
+            f"{url}{params}",
+            headers=headers,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+
+        return response.text
     
     def parse_params(self, 
         loc: Optional[str], 
@@ -153,100 +340,20 @@ class JobListingsApi():
 
         return f"?{urlencode(params)}", params
     
-    def parse_apply_options(self, 
-        job: Dict[str, Dict]) -> List[ApplyOption]:
-        """Populates a list of ApplyOption schemas.
+    def parse_job_listing_json(self, 
+        retrieved_data: Union[str, bytes]) -> List[UserJobListing]:
+        """Validates the raw response into UserJobListing schemas in one pass.
 
-        Args:
-            job (Dict[str, Dict]): Retrieved data from OpenWebNinja API.
-        
-        Returns:
-            List[ApplyOption]: List of the schema for parsed apply
-                options data.
-        """
-
-        apply_options = []
-        for app_opts in job["apply_options"]:
-            app_opt_vals = {
-                "publisher": app_opts.get("publisher"),
-                "apply_link": app_opts.get("apply_link"),
-                "is_direct": app_opts.get("is_direct")
-            }
-
-            apply_options.append(ApplyOption(**app_opt_vals))
-        
-        return apply_options
-    
-    def parse_job_highlights(self,
-        job: Dict[str, Any]) -> JobHighlights:
-        """Populates a JobHighlights schemas.
+        The JSON is parsed and validated together by pydantic, without 
+        building intermediate dicts and models.
 
         Args:
-            job (Dict[str, Any]): Retrieved data from OpenWebNinja API.
-        
-        Returns:
-            JobHighlights: The schema for parsed job highlights
-                data.
-        """
-
-        job_high = job["job_highlights"]
-        job_high_vals = {
-            "Qualifications": job_high.get("Qualifications"),
-            "Responsibilites": job_high.get("Responsibilities"),
-            "Benefits": job.get("job_benefits")
-        }
-        
-        return JobHighlights(**job_high_vals)
-    
-
-    def parse_job_listing(self, 
-        own_data: Dict[str, Dict]) -> List[UserJobListing]:
-        """Populates a list of UserJobListing schemas.
-
-        Args:
-            own_data (Dict[str, Dict]): Retrieved data from OpenWebNinja API.
+            retrieved_data (Union[str, bytes]): Raw response from the 
+                OpenWebNinja API.
         
         Returns:
             List[UserJobListing]: List of the schema for parsed 
                 job listing data.
         """
 
-        job_listings = []
-        for job in own_data["data"]:
-            apply_options = self.parse_apply_options(job)
-            job_highlight = self.parse_job_highlights(job)
-            jl_values = {
-                "job_id": job.get("job_id"),
-                "job_title": job.get("job_title"),
-                "employer_name": job.get("employer_name"),
-                "employer_logo": job.get("employer_logo"),
-                "employer_website": job.get("employer_website"),
-                "job_location": job.get("job_location"),
-                "job_city": job.get("job_city"),
-                "job_state": job.get("job_state"),
-                "job_country": job.get("job_country"),
-                "job_is_remote": job.get("job_is_remote"),
-                "job_employment_type": job.get("job_employment_type"),
-                "job_employment_types": job.get("job_employment_types"),
-                "job_posted_at": job.get("job_posted_at"),
-                "job_posted_at_timestamp": job.get("job_posted_at_timestamp"),
-                "job_posted_at_datetime_utc": job.get("job_posted_at_datetime_utc"),
-                "job_salary": job.get("job_salary"),
-                "job_min_salary": job.get("job_min_salary"),
-                "job_max_salary": job.get("job_max_salary"),
-                "job_salary_period": job.get("job_salary_period"),
-                "job_apply_link": job.get("job_apply_link"),
-                "job_apply_is_direct": job.get("job_apply_is_direct"),
-                "apply_options": apply_options,
-                "job_description": job.get("job_description"),
-                "job_highlights": job_highlight,
-                "job_benefits": job.get("job_benefits"),
-                "job_publisher": job.get("job_publisher"),
-            }
-
-            job_listings.append(UserJobListing(**jl_values))
-
-        return job_listings
-
-        
-
+        return JSearchResponse.model_validate_json(retrieved_data).data
@@ -1,28 +1,52 @@
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional, Tuple
 
-from thefuzz import fuzz
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from src.schemas.project_evidence import (
-    ProjectListRelevance,
-    Match
-)
-from src.utils.text_normalisation import text_normalisation
+from src.schemas.project_evidence import ProjectListRelevance
+from src.utils.evidence_matcher import EvidenceMatcher, MatchRecords
+from src.utils.evidence_pool import get_evidence_pool
+from src.utils.evidence_partitions import EvidencePartitions
+
+def evidence_mode_from_env() -> Tuple[bool, Optional[int]]:
+    """Reads the matching mode from the environment.
+
+    Pruning to pairs sharing a token is faster, but loses the 1-3% of
+    matches that only agree on fuzzy similarity, so it is opt-in.
+
+    Returns:
+        Tuple[bool, Optional[int]]: Whether every pair is scored, from
+            EVIDENCE_EXHAUSTIVE, and the matches kept per achievement, from
+            EVIDENCE_TOP_K, or None to keep every match.
+    """
+
+    exhaustive = os.getenv("EVIDENCE_EXHAUSTIVE", "true").lower() == "true"
+    # 0 keeps every match over the threshold, unranked
+    top_k = int(os.getenv("EVIDENCE_TOP_K", "0")) or None
+
+    return exhaustive, top_k
 
 class ProjectEvidence():
 
-    def __init__(self, ux_info: Dict[str, Any]):
+    def __init__(self,
+        ux_info: Dict[str, Any],
+        partitions: Optional[EvidencePartitions] = None
+    ):
         """Initalisation method for ProjectEvidence.
 
         Args:
             ux_info (Dict[str, Any]): Carries the project lists and evidence
                 for the project list relevance to the job market.
+            partitions (Optional[EvidencePartitions]): Stored matches per
+                project and listing pair, so only changed pairs are scored,
+                or None to score every pair.
         """
 
         self.ux_info = ux_info
+        self.partitions = partitions
+        self.exhaustive, self.top_k = evidence_mode_from_env()
     
     def run(self) -> ProjectListRelevance:
         """Main orchestration workflow method for ProjectEvidence.
@@ -32,85 +56,34 @@ class ProjectEvidence():
                 the job role requirements that they achieve.
         """
 
-        all_matches = []
-        for project in self.ux_info["project_list"]["projects"]:
-            for j_listing in self.ux_info["evidence"]:
-                matches = self.parse_project_evidence(project, j_listing)
-                all_matches.extend(matches)
-        
-        removed_duplicates = set(all_matches)
-        
-        return ProjectListRelevance(root=list(removed_duplicates))
+        return self.run_records().to_schema()
 
-    def parse_project_evidence(self, 
-        project: Dict[str, Any], evidence: Dict[str, Any]) -> List[Match]:
-        """Parses the real-world job market relavance of a project.
+    def run_records(self) -> MatchRecords:
+        """Matches the projects against the evidence without building schemas.
 
-        Args:
-            project (Dict[str, Any]): A project from the list of generated
-                projects.
-            evidence (Dict[str, Any]): Job listing information.
-        
         Returns:
-            List[Match]: List of matches between project achievements
-                and job qualifications.
+            MatchRecords: Compact matches, converted with to_schema or
+                to_dicts where they leave the pipeline.
         """
 
-        achieved_qualifications = project["achieved_qualifications"]
-        job_qualifications = evidence.get("Qualifications") or []
-
-        matches = []
-        for proj_q in achieved_qualifications:
-            for job_q in job_qualifications:
-                overlap = self.calc_token_overlap(proj_q, job_q)
-                fuzz_sim = self.calc_fuzzy_similarity(proj_q, job_q)
-
-                final_sim = 0.4 * overlap + 0.6 * fuzz_sim
-
-                if final_sim >= 0.40:
-                    match = Match(
-                        project_title = project["title"],
-                        project_achievement=proj_q,
-                        job_title=evidence["job_title"],
-                        company_name=evidence["employer_name"],
-                        qualification=job_q
-                    )
-                    matches.append(match)
-        
-        return matches
-    
-    def calc_token_overlap(self, 
-        achievement: str, job_qualification: str) -> float:
-        """Calculates Jaccard similarity between normalised strings.
-
-        Args:
-            achievement (str): Contains an achievement that the project
-                carries out.
-            job_qualification (str): Contains a job qualification.
-        
-        Returns:
-            float: Returns a float value between 0 and 1.
-        """
-
-        norm_achieve = text_normalisation(achievement)
-        norm_qual = text_normalisation(job_qualification)
-
-        return len(norm_achieve & norm_qual) / len(norm_achieve | norm_qual)
-    
-    def calc_fuzzy_similarity(self,
-        achievement: str, job_qualification: str) -> float:
-        """Calculates fuzzy string similarity.
-
-        Args:
-            achievement (str): Contains an achievement that the project
-                carries out.
-            job_qualification (str): Contains a job qualification.
-        
-        Returns:
-            float: Returns a float value between 0 and 1.
-        """
-
-        sim = fuzz.token_set_ratio(achievement, job_qualification)
-        return sim / 100
-
-    
+        projects = self.ux_info["project_list"]["projects"]
+        evidence = self.ux_info["evidence"]
+
+        if self.partitions is not None:
+            return self.partitions.run(
+                projects,
+                evidence,
+                exhaustive=self.exhaustive,
+                top_k=self.top_k,
+                pool=get_evidence_pool()
+            )
+
+        matcher = EvidenceMatcher(
+            projects,
+            evidence,
+            exhaustive=self.exhaustive,
+            top_k=self.top_k,
+            pool=get_evidence_pool()
+        )
+
+        return matcher.run()
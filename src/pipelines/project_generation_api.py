@@ -1,7 +1,8 @@
 import os
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Tuple, Union
 
-from openai import AzureOpenAI
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,27 +13,48 @@ from src.schemas.project_gen import (
     UxInformation, 
     JobInformation, 
     PromptData,
-    ProjectList
+    ProjectList,
+    GeneratedProject
 )
 from src.prompts.project_gen import PROJECT_GEN_PROMPT
+from src.utils.prompt_cache import PromptCache, get_prompt_cache
+from src.utils.prompt_compaction import compact_prompt_data
 
 class ProjectGenApi():
 
-    def __init__(self, job_listings: List[Dict[str, Any]]):
+    def __init__(self, 
+        job_listings: List[Dict[str, Any]],
+        client: Optional[AzureOpenAI] = None,
+        prompt_cache: Optional[PromptCache] = None,
+        async_client: Optional[AsyncAzureOpenAI] = None
+    ):
         """Initialisation method for ProjectGenApi.
 
         Args:
             job_listings (List[Dict[str, Any]]): Retrieved job listings based
                 off user input filters.
+            client (Optional[AzureOpenAI]): Client for the GPT model, or None
+                to create one from the environment.
+            prompt_cache (Optional[PromptCache]): Cache of generated project
+                lists, or None to use the process-wide cache.
+            async_client (Optional[AsyncAzureOpenAI]): Client for the GPT
+                model used by the async methods. When given without client,
+                only the async methods can be used.
         """
 
         self.job_listings = job_listings
 
-        self.client = AzureOpenAI(
-            api_key = os.getenv("AZURE_OPENAI_KEY"),
-            azure_endpoint = os.getenv("AZURE_ENDPOINT"),
-            api_version = os.getenv("API_VERSION")
-        )
+        if client is None and async_client is None:
+            client = AzureOpenAI(
+                api_key = os.getenv("AZURE_OPENAI_KEY"),
+                azure_endpoint = os.getenv("AZURE_ENDPOINT"),
+                api_version = os.getenv("API_VERSION")
+            )
+
+        self.client = client
+        self.async_client = async_client
+        self.prompt_cache = prompt_cache or get_prompt_cache()
+        self.prompt_token_budget = int(os.getenv("PROMPT_TOKEN_BUDGET", "6000"))
     
     def run(self) -> UxInformation:
         """Main orchestration workflow method for ProjectGenApi.
@@ -42,6 +64,98 @@ class ProjectGenApi():
                 that the project listings meet job listing qualifications.
         """
 
+        project_evidence, prompt_data = self.parse_job_listings()
+        project_list = self.generate_project_list(prompt_data)
+
+        ux_information = {
+            "parameters": self.job_listings["parameters"],
+            "project_list": project_list,
+            "evidence": project_evidence
+        }
+
+        return UxInformation(**ux_information)
+
+    def run_stream(self) -> Iterator[Union[GeneratedProject, UxInformation]]:
+        """Streaming variant of run.
+
+        Yields:
+            Union[GeneratedProject, UxInformation]: Each generated project as 
+                soon as the GPT model has finished it, followed by the 
+                assembled UxInformation.
+        """
+
+        project_evidence, prompt_data = self.parse_job_listings()
+
+        projects = []
+        for project in self.stream_project_list(prompt_data):
+            projects.append(project)
+            yield project
+
+        ux_information = {
+            "parameters": self.job_listings["parameters"],
+            "project_list": ProjectList(projects=projects),
+            "evidence": project_evidence
+        }
+
+        yield UxInformation(**ux_information)
+
+    async def run_async(self) -> UxInformation:
+        """Asynchronous variant of run, using async_client.
+
+        Returns:
+            UxInformation: Schema containing generated project list and evidence 
+                that the project listings meet job listing qualifications.
+        """
+
+        # Normalisation and compaction are CPU bound, keep them off the loop
+        project_evidence, prompt_data = await asyncio.to_thread(
+            self.parse_job_listings
+        )
+        project_list = await self.generate_project_list_async(prompt_data)
+
+        ux_information = {
+            "parameters": self.job_listings["parameters"],
+            "project_list": project_list,
+            "evidence": project_evidence
+        }
+
+        return UxInformation(**ux_information)
+
+    async def run_stream_async(self
+    ) -> AsyncIterator[Union[GeneratedProject, UxInformation]]:
+        """Asynchronous variant of run_stream, using async_client.
+
+        Yields:
+            Union[GeneratedProject, UxInformation]: Each generated project as 
+                soon as the GPT model has finished it, followed by the 
+                assembled UxInformation.
+        """
+
+        project_evidence, prompt_data = await asyncio.to_thread(
+            self.parse_job_listings
+        )
+
+        projects = []
+        async for project in self.stream_project_list_async(prompt_data):
+            projects.append(project)
+            yield project
+
+        ux_information = {
+            "parameters": self.job_listings["parameters"],
+            "project_list": ProjectList(projects=projects),
+            "evidence": project_evidence
+        }
+
+        yield UxInformation(**ux_information)
+
+    def parse_job_listings(self) -> Tuple[ProjectIdeaEvidence, PromptData]:
+        """Parses the job listings into evidence and compacted prompt data.
+
+        Returns:
+            Tuple[ProjectIdeaEvidence, PromptData]: Evidence for the project 
+                list and the prompt data for the GPT model.
+        """
+
         evidence_list = []
         prompt_data_list = []
         for response in self.job_listings["job_listings"]:
@@ -53,17 +167,12 @@ class ProjectGenApi():
                 prompt_data_list.append(p_data)
         
         project_evidence = ProjectIdeaEvidence(root=evidence_list)
-        prompt_data = PromptData(root=prompt_data_list)
-
-        project_list = self.generate_project_list(prompt_data)
-
-        ux_information = {
-            "parameters": self.job_listings["parameters"],
-            "project_list": project_list,
-            "evidence": project_evidence
-        }
+        prompt_data = compact_prompt_data(
+            PromptData(root=prompt_data_list),
+            self.prompt_token_budget
+        )
 
-        return UxInformation(**ux_information)
+        return project_evidence, prompt_data
 
     def parse_evidence(self, job: Dict[str, Any]) -> JobInformation:
         """Parses the job listing information as evidence for the project list.
@@ -115,26 +224,165 @@ class ProjectGenApi():
         Args:
             prompt_data (PromptData): Prompt data to aid the prompting of the
                 GPT model.
+
+        Returns:
+            ProjectList: Generated project list, served from the prompt cache 
+                when the same or a similar prompt was already generated.
         """
 
-        prompt = PROJECT_GEN_PROMPT.format(data=prompt_data)
+        cached = self.prompt_cache.get(prompt_data)
+        if cached is not None:
+            return ProjectList(**cached)
+
         response = self.client.beta.chat.completions.parse(
             model="gpt-4o-mini",
-            messages=[
-                    {
-                        "role": "system", 
-                        "content": "Generate a list of projects"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format=ProjectList
+            messages=self.build_messages(prompt_data),
+            response_format=ProjectList
         )
         
-        return response.choices[0].message.parsed
+        project_list = response.choices[0].message.parsed
+        self.prompt_cache.put(prompt_data, project_list.model_dump())
+
+        return project_list
+
+    def stream_project_list(self, 
+        prompt_data: PromptData) -> Iterator[GeneratedProject]:
+        """Uses GPT model to generate a project list, one project at a time.
+
+        Args:
+            prompt_data (PromptData): Prompt data to aid the prompting of the
+                GPT model.
 
+        Yields:
+            GeneratedProject: Each project as soon as the GPT model has 
+                finished it.
+        """
+
+        cached = self.prompt_cache.get(prompt_data)
+        if cached is not None:
+            yield from ProjectList(**cached).projects
+            return
+
+        projects = []
+        with self.client.beta.chat.completions.stream(
+            model="gpt-4o-mini",
+            messages=self.build_messages(prompt_data),
+            response_format=ProjectList
+        ) as stream:
+            for event in stream:
+                if event.type != "content.delta" or not event.parsed:
+                    continue
+
+                # Once the next project has started, the previous is complete
+                partial = event.parsed.get("projects") or []
+                while len(projects) < len(partial) - 1:
+                    project = GeneratedProject(**partial[len(projects)])
+                    projects.append(project)
+                    yield project
+
+            project_list = stream.get_final_completion().choices[0].message.parsed
+
+        for project in project_list.projects[len(projects):]:
+            projects.append(project)
+            yield project
+
+        self.prompt_cache.put(prompt_data, project_list.model_dump())
 
+    async def generate_project_list_async(self,
+        prompt_data: PromptData) -> ProjectList:
+        """Asynchronous variant of generate_project_list.
+
+        Args:
+            prompt_data (PromptData): Prompt data to aid the prompting of the
+                GPT model.
+
+        Returns:
+            ProjectList: Generated project list, served from the prompt cache 
+                when the same or a similar prompt was already generated.
+        """
+
+        cached = self.prompt_cache.get(prompt_data)
+        if cached is not None:
+            return ProjectList(**cached)
+
+        response = await self.async_client.beta.chat.completions.parse(
+            model="gpt-4o-mini",
+            messages=self.build_messages(prompt_data),
+            response_format=ProjectList
+        )
         
+        project_list = response.choices[0].message.parsed
+        self.prompt_cache.put(prompt_data, project_list.model_dump())
+
+        return project_list
+
+    async def stream_project_list_async(self, 
+        prompt_data: PromptData) -> AsyncIterator[GeneratedProject]:
+        """Asynchronous variant of stream_project_list.
+
+        Args:
+            prompt_data (PromptData): Prompt data to aid the prompting of the
+                GPT model.
+
+        Yields:
+            GeneratedProject: Each project as soon as the GPT model has 
+                finished it.
+        """
+
+        cached = self.prompt_cache.get(prompt_data)
+        if cached is not None:
+            for project in ProjectList(**cached).projects:
+                yield project
+            return
+
+        projects = []
+        async with self.async_client.beta.chat.completions.stream(
+            model="gpt-4o-mini",
+            messages=self.build_messages(prompt_data),
+            response_format=ProjectList
+        ) as stream:
+            async for event in stream:
+                if event.type != "content.delta" or not event.parsed:
+                    continue
+
+                # Once the next project has started, the previous is complete
+                partial = event.parsed.get("projects") or []
+                while len(projects) < len(partial) - 1:
+                    project = GeneratedProject(**partial[len(projects)])
+                    projects.append(project)
+                    yield project
+
+            completion = await stream.get_final_completion()
+            project_list = completion.choices[0].message.parsed
+
+        for project in project_list.projects[len(projects):]:
+            projects.append(project)
+            yield project
+
+        self.prompt_cache.put(prompt_data, project_list.model_dump())
+
+    def build_messages(self, prompt_data: PromptData) -> List[Dict[str, str]]:
+        """Builds the chat messages for the GPT model.
+
+        Args:
+            prompt_data (PromptData): Prompt data to aid the prompting of the
+                GPT model.
+
+        Returns:
+            List[Dict[str, str]]: System and user messages.
+        """
+
+        prompt = PROJECT_GEN_PROMPT.format(
+            data=prompt_data.model_dump_json(exclude_none=True)
+        )
 
+        return [
+            {
+                "role": "system", 
+                "content": "Generate a list of projects"
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
@@ -1,38 +1,85 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Iterator, AsyncIterator, Tuple, Union
 
-from psycopg2.extensions import connection, cursor
+import httpx
+from openai import AzureOpenAI, AsyncAzureOpenAI
 
 from src.pipelines.job_listings_api import JobListingsApi
 from src.pipelines.project_generation_api import ProjectGenApi
 from src.pipelines.project_evidence import ProjectEvidence
 from src.pipelines.save_project_data import SaveProjectData
+from src.pipelines.bulk_save_project_data import BulkSaveProjectData
 from src.pipelines.fetch_saved_data import FetchSavedData
 from src.pipelines.fetch_requested_data import FetchRequestedData
 from src.pipelines.fetch_saved_evidence import FetchSavedEvidence
+from src.pipelines.export_saved_data import ExportSavedData
 from src.schemas.jsearch_user_view import UserJobSearchResponses
-from src.schemas.project_gen import UxInformation
+from src.schemas.project_gen import UxInformation, GeneratedProject
 from src.schemas.project_evidence import ProjectListRelevance
-from src.schemas.retrieved_saved_data import SavedDataList
+from src.schemas.retrieved_saved_data import SavedDataPage
+from src.utils.response_cache import ResponseCache, AsyncResponseCache
+from src.utils.db_pool import DatabasePool
+from src.utils.evidence_partitions import EvidencePartitions
 
 class MainPipeline():
 
-    def job_search(self, user_inputs: Dict[str, Any]) -> UserJobSearchResponses:
+    def __init__(self,
+        get_openai_client: Optional[Callable[[], AzureOpenAI]] = None):
+        """Initialisation method for MainPipeline.
+
+        Args:
+            get_openai_client (Optional[Callable[[], AzureOpenAI]]): Returns
+                the client for the GPT model shared across requests, only
+                called when generating. None creates a client per generation.
+        """
+
+        self.get_openai_client = get_openai_client
+
+    def job_search(self, 
+        user_inputs: Dict[str, Any],
+        response_cache: Optional[ResponseCache] = None
+    ) -> UserJobSearchResponses:
         """Triggers the JobListingApi pipeline.
 
         Args:
             user_inputs (Dict[str, Any]): Holds the user parameters for job
                 search filters.
+            response_cache (Optional[ResponseCache]): Cache for upstream job
+                search responses, or None to always call the API.
         
         Returns:
             UserJobSearchResponses: A schema that contains a list of job
                 listings and parameters.
         """
 
-        jl_api = JobListingsApi(**user_inputs)
+        jl_api = JobListingsApi(**user_inputs, response_cache=response_cache)
         job_listings = jl_api.run()
 
         return job_listings
     
+    async def job_search_async(self,
+        user_inputs: Dict[str, Any],
+        http_client: httpx.AsyncClient,
+        response_cache: Optional[AsyncResponseCache] = None
+    ) -> UserJobSearchResponses:
+        """Triggers the JobListingApi pipeline asynchronously.
+
+        Args:
+            user_inputs (Dict[str, Any]): Holds the user parameters for job
+                search filters.
+            http_client (httpx.AsyncClient): Client for the OpenWebNinja API.
+            response_cache (Optional[AsyncResponseCache]): Cache for upstream
+                job search responses, or None to always call the API.
+        
+        Returns:
+            UserJobSearchResponses: A schema that contains a list of job
+                listings and parameters.
+        """
+
+        jl_api = JobListingsApi(**user_inputs)
+        job_listings = await jl_api.run_async(http_client, response_cache)
+
+        return job_listings
+
     def project_idea_generation(self, 
         job_listings: List[Dict[str, Any]]) -> UxInformation:
         """Triggers the ProjectGenApi pipeline.
@@ -46,25 +93,87 @@ class MainPipeline():
                 project list.
         """
 
-        project_gen_api = ProjectGenApi(job_listings)
+        project_gen_api = ProjectGenApi(job_listings, client=self._openai_client())
         project_gen_data = project_gen_api.run()
     
         return project_gen_data
+
+    def project_idea_generation_stream(self,
+        job_listings: List[Dict[str, Any]]
+    ) -> Iterator[Union[GeneratedProject, UxInformation]]:
+        """Triggers the streaming ProjectGenApi pipeline.
+
+        Args:
+            job_listings (List[Dict[str, Any]]): Holds the retrieved job
+                listings based of the user input filters.
+
+        Yields:
+            Union[GeneratedProject, UxInformation]: Each generated project as
+                soon as it is complete, followed by the UxInformation.
+        """
+
+        project_gen_api = ProjectGenApi(job_listings, client=self._openai_client())
+        yield from project_gen_api.run_stream()
     
+    async def project_idea_generation_async(self,
+        job_listings: List[Dict[str, Any]],
+        client: AsyncAzureOpenAI
+    ) -> UxInformation:
+        """Triggers the ProjectGenApi pipeline asynchronously.
+
+        Args:
+            job_listings (List[Dict[str, Any]]): Holds the retrieved job
+                listings based of the user input filters.
+            client (AsyncAzureOpenAI): Client for the GPT model.
+
+        Returns:
+            UxInformation: Contains project list and evidence for the
+                project list.
+        """
+
+        project_gen_api = ProjectGenApi(job_listings, async_client=client)
+        project_gen_data = await project_gen_api.run_async()
+    
+        return project_gen_data
+
+    async def project_idea_generation_stream_async(self,
+        job_listings: List[Dict[str, Any]],
+        client: AsyncAzureOpenAI
+    ) -> AsyncIterator[Union[GeneratedProject, UxInformation]]:
+        """Triggers the streaming ProjectGenApi pipeline asynchronously.
+
+        Args:
+            job_listings (List[Dict[str, Any]]): Holds the retrieved job
+                listings based of the user input filters.
+            client (AsyncAzureOpenAI): Client for the GPT model.
+
+        Yields:
+            Union[GeneratedProject, UxInformation]: Each generated project as
+                soon as it is complete, followed by the UxInformation.
+        """
+
+        project_gen_api = ProjectGenApi(job_listings, async_client=client)
+        async for item in project_gen_api.run_stream_async():
+            yield item
+
     def parse_evidence(self,
-        ux_info: Dict[str, Any]) -> ProjectListRelevance:
+        ux_info: Dict[str, Any],
+        partitions: Optional[EvidencePartitions] = None
+    ) -> ProjectListRelevance:
         """Triggers the ProjectEvidence pipeline.
 
         Args:
             ux_info (Dict[str, Any]): Carries the project lists and evidence
                 for the project list relevance to the job market.
+            partitions (Optional[EvidencePartitions]): Stored matches to
+                reuse for unchanged project and listing pairs.
         
         Returns:
             ProjectListRelevance: Schema to carry the list of project names and
                 the job role requirements that they achieve.
         """
 
-        project_evidence = ProjectEvidence(ux_info)
+        project_evidence = ProjectEvidence(ux_info, partitions)
         project_list_evidence = project_evidence.run()
 
         return project_list_evidence
@@ -72,8 +181,7 @@ class MainPipeline():
     def save_project_data(self,
         ux_info: Dict[str, Any],
         parsed_evidence: List[Dict[str, Any]],
-        db_conn: connection, 
-        db_curs: cursor
+        db_pool: DatabasePool
     ):
         """Triggers the SaveProjectData pipeline.
 
@@ -82,75 +190,130 @@ class MainPipeline():
                 for the project list relevance to the job market.
             parsed_evidence (List[Dict[str, Any]]): Carries list of project 
                 names and the job role requirements that they achieve.
-            db_conn (connection): Represents the active connection from the
-                python app the PostgresSQL server.
-            db_curs (cursor): Runs the SQL queries.
+            db_pool (DatabasePool): Pool of connections to the PostgreSQL
+                server.
         """
 
-        save_project = SaveProjectData(
-            ux_info,
-            parsed_evidence,
-            db_conn, 
-            db_curs
-        )
-        save_project.run()
+        with db_pool.cursor() as (db_conn, db_curs):
+            save_project = SaveProjectData(
+                ux_info,
+                parsed_evidence,
+                db_conn, 
+                db_curs
+            )
+            save_project.run()
+
+    def save_project_data_bulk(self,
+        saves: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        db_pool: DatabasePool,
+        batch_size: int = 500
+    ) -> List[int]:
+        """Triggers the BulkSaveProjectData pipeline.
+
+        Args:
+            saves (List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]): Pairs
+                of ux_info and parsed evidence to save.
+            db_pool (DatabasePool): Pool of connections to the PostgreSQL
+                server.
+            batch_size (int): Rows sent to the server per INSERT statement.
+
+        Returns:
+            List[int]: IDs of the saved rows, in the order of saves.
+        """
+
+        with db_pool.cursor() as (db_conn, db_curs):
+            bulk_save = BulkSaveProjectData(saves, db_conn, db_curs, batch_size)
+            saved_ids = bulk_save.run()
+
+        return saved_ids
 
     def fetch_saved_data(self,
-        db_conn: connection, db_curs: cursor) -> Optional[SavedDataList]:
+        db_pool: DatabasePool,
+        before_id: Optional[int] = None,
+        limit: int = 20
+    ) -> SavedDataPage:
         """Triggers the FetchSavedData pipeline.
 
         Args:
-            db_conn (connection): Represents the active connection from the
-                python app the PostgresSQL server.
-            db_curs (cursor): Runs the SQL queries.
+            db_pool (DatabasePool): Pool of connections to the PostgreSQL
+                server.
+            before_id (Optional[int]): ID of the last row on the previous 
+                page, or None for the first page.
+            limit (int): Maximum number of rows on the page.
 
         Returns:
-            Optional[SavedDataList]: Contains the saved data from the PostgreSQL
-                database, or None if the database is empty.
+            SavedDataPage: A page of saved data summaries from the PostgreSQL
+                database, and the cursor for the next page.
         """
 
-        saved_data = FetchSavedData(db_conn, db_curs)
-        retrieved_data = saved_data.run()
+        with db_pool.cursor() as (db_conn, db_curs):
+            saved_data = FetchSavedData(db_conn, db_curs, before_id, limit)
+            retrieved_data = saved_data.run()
 
         return retrieved_data
     
     def fetch_requested_data(self,
-        id: int, db_conn: connection, db_curs: cursor) -> Dict[str, Any]:
+        id: int, db_pool: DatabasePool) -> Dict[str, Any]:
         """Retrieves requested saved data from the database.
 
         Args:
             id (int): ID for the requested database row.
-            db_conn (connection): Represents the active connection from the
-                python app the PostgresSQL server.
-            db_curs (cursor): Runs the SQL queries.
+            db_pool (DatabasePool): Pool of connections to the PostgreSQL
+                server.
         
         Returns:
             Dict[str, Any]: Holds requested database data.
         """
 
-        fetch_requested_data = FetchRequestedData(id, db_conn, db_curs)
-        requested_data = fetch_requested_data.run()
+        with db_pool.cursor() as (db_conn, db_curs):
+            fetch_requested_data = FetchRequestedData(id, db_conn, db_curs)
+            requested_data = fetch_requested_data.run()
 
         return requested_data
     
     def fetch_saved_evidence(self,
-        id: int, db_conn: connection, db_curs: cursor) -> List[Dict[str, Any]]:
+        id: int, db_pool: DatabasePool) -> List[Dict[str, Any]]:
         """Retrieves requested saved evidence from the database.
 
         Args:
             id (int): ID for the requested database row.
-            db_conn (connection): Represents the active connection from the
-                python app the PostgresSQL server.
-            db_curs (cursor): Runs the SQL queries.
+            db_pool (DatabasePool): Pool of connections to the PostgreSQL
+                server.
         
         Returns:
             List[Dict[str, Any]]: Holds requested database data.
         """
 
-        fetch_evidence = FetchSavedEvidence(id, db_conn, db_curs)
-        evidence = fetch_evidence.run()
+        with db_pool.cursor() as (db_conn, db_curs):
+            fetch_evidence = FetchSavedEvidence(id, db_conn, db_curs)
+            evidence = fetch_evidence.run()
 
         return evidence
 
+    def export_saved_data(self,
+        db_pool: DatabasePool,
+        output_format: str = "ndjson",
+        itersize: int = 500
+    ) -> Iterator[str]:
+        """Streams the saved data from the database as NDJSON or CSV.
+
+        The connection is held until the export has been fully consumed.
+
+        Args:
+            db_pool (DatabasePool): Pool of connections to the PostgreSQL
+                server.
+            output_format (str): Either ndjson or csv.
+            itersize (int): Rows fetched from the server per round trip.
+
+        Yields:
+            str: Lines of the export.
+        """
 
+        with db_pool.connection() as db_conn:
+            export = ExportSavedData(db_conn, output_format, itersize)
+            yield from export.run()
 
+    def _openai_client(self) -> Optional[AzureOpenAI]:
+        if self.get_openai_client is None:
+            return None
+        return self.get_openai_client()
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from src.queries.general import ADD_HISTORY
@@ -36,20 +36,29 @@ class SaveProjectData:
 
         """
 
+        self.db_curs.execute(ADD_HISTORY, self.build_row())
+        self.db_conn.commit()
+
+    def build_row(self) -> Tuple[str, str, str, str]:
+        """Builds the history row for the project data.
+
+        Returns:
+            Tuple[str, str, str, str]: The title, parameters, project list 
+                and evidence, in ADD_HISTORY column order.
+        """
+
         parameters = self.ux_info["parameters"]
         queries = parameters.get("query")
         locations = self.retrieve_locations(queries)
         title = self.generate_title(locations)
         parameters = self.parse_parameters(locations)
-        self.db_curs.execute(ADD_HISTORY,
-            (
-                title,
-                json.dumps(parameters),
-                json.dumps(self.ux_info["project_list"]),
-                json.dumps(self.parsed_evidence)
-            )
+
+        return (
+            title,
+            json.dumps(parameters),
+            json.dumps(self.ux_info["project_list"]),
+            json.dumps(self.parsed_evidence)
         )
-        self.db_conn.commit()
     
     def generate_title(self, locations: Optional[List[str]]) -> str:
         """Generates the title for saved project data.
@@ -4,8 +4,34 @@ ADD_HISTORY = """
     RETURNING id
 """
 
-RETRIEVE_DATA = "SELECT * FROM history"
+ALLOCATE_HISTORY_IDS = """
+    SELECT nextval(pg_get_serial_sequence('history', 'id'))
+    FROM generate_series(1, %s)
+"""
+
+ADD_HISTORY_BULK = """
+    INSERT INTO history (id, title, parameters, project_list, evidence)
+    VALUES %s
+"""
+
+RETRIEVE_SAVED_SUMMARIES = """
+    SELECT id, title, parameters FROM history
+    ORDER BY id DESC
+    LIMIT %s
+"""
+
+RETRIEVE_SAVED_SUMMARIES_BEFORE = """
+    SELECT id, title, parameters FROM history
+    WHERE id < %s
+    ORDER BY id DESC
+    LIMIT %s
+"""
 
 RETRIEVE_REQUESTED_DATA = "SELECT * FROM history WHERE id = %s"
 
-RETRIEVE_REQUESTED_EVIDENCE = "SELECT evidence FROM history WHERE id = %s"
\ No newline at end of file
+RETRIEVE_REQUESTED_EVIDENCE = "SELECT evidence FROM history WHERE id = %s"
+
+EXPORT_HISTORY = """
+    SELECT id, title, parameters, project_list, evidence FROM history
+    ORDER BY id
+"""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import RootModel
+from pydantic import RootModel, model_validator
 
 from src.schemas.base import _BaseModel, Parameters
 
@@ -64,6 +64,20 @@ class UserJobListing(_BaseModel):
     # Provenance (can be shown as a small label in UX)
     job_publisher: Optional[str] = None
 
+class JSearchJobListing(UserJobListing):
+    # Raw item of the JSearch "data" array, validated straight from JSON.
+    # Highlights are narrowed to what the original field by field parser kept
+    @model_validator(mode="after")
+    def _narrow_highlights(self) -> "JSearchJobListing":
+        if self.job_highlights is not None:
+            self.job_highlights.Responsibilities = None
+            self.job_highlights.Benefits = self.job_benefits
+        return self
+
+class JSearchResponse(_BaseModel):
+    # From the JSearch search endpoint (top-level)
+    data: List[JSearchJobListing]
+
 class UserJobSearchResponse(RootModel):
     # From EXAMPLE_RESPONSE (top-level)
     root: List[UserJobListing]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import ConfigDict, RootModel
 
@@ -12,6 +12,7 @@ class Match(_BaseModel):
     job_title: str
     company_name: str
     qualification: str
+    score: Optional[float] = None
 
 class ProjectListRelevance(RootModel):
     root: List[Match]
\ No newline at end of file
@@ -1,9 +1,8 @@
 from typing import List, Union, Optional
 
-from pydantic import RootModel
-
 from src.schemas.base import _BaseModel
-from src.schemas.project_gen import ProjectList, ProjectIdeaEvidence
+from src.schemas.project_gen import ProjectList
+from src.schemas.project_evidence import ProjectListRelevance
 
 class DataBaseParameters(_BaseModel):
     role: str
@@ -19,7 +18,13 @@ class SavedData(_BaseModel):
     title: str
     parameters: DataBaseParameters
     project_list: ProjectList
-    evidence: ProjectIdeaEvidence
+    evidence: ProjectListRelevance
+
+class SavedDataSummary(_BaseModel):
+    id: int
+    title: str
+    parameters: DataBaseParameters
 
-class SavedDataList(RootModel):
-    root: List[SavedData]
\ No newline at end of file
+class SavedDataPage(_BaseModel):
+    items: List[SavedDataSummary]
+    next_cursor: Optional[int] = None
@@ -0,0 +1,107 @@
+import os
+import threading
+from typing import Any, Callable, Dict, List
+
+import redis
+from openai import AzureOpenAI
+
+from src.pipelines.run import MainPipeline
+from src.utils.db_pool import DatabasePool
+from src.utils.evidence_pool import EvidencePool, get_evidence_pool
+from src.utils.http_pool import HTTPConnectionPool, get_http_pool
+
+class AppContainer:
+    """Application-scoped holder of the clients shared by every request.
+
+    Each client is created from the environment on first use and then
+    reused, so requests no longer pay for new connection pools and auth
+    setup. startup creates every client up front, and shutdown closes the
+    ones that were created, in reverse order.
+    """
+
+    def __init__(self):
+        """Initialisation method for AppContainer."""
+
+        self._lock = threading.RLock()
+        self._instances: Dict[str, Any] = {}
+        self._created: List[str] = []
+
+    @property
+    def openai_client(self) -> AzureOpenAI:
+        """AzureOpenAI: Client for the GPT model."""
+
+        return self._get("openai_client", lambda: AzureOpenAI(
+            api_key = os.getenv("AZURE_OPENAI_KEY"),
+            azure_endpoint = os.getenv("AZURE_ENDPOINT"),
+            api_version = os.getenv("API_VERSION")
+        ))
+
+    @property
+    def http_pool(self) -> HTTPConnectionPool:
+        """HTTPConnectionPool: Keep-alive connections to the job listings API."""
+
+        return self._get("http_pool", get_http_pool)
+
+    @property
+    def redis_client(self) -> redis.Redis:
+        """redis.Redis: Client for the Redis server."""
+
+        return self._get("redis_client", lambda: redis.Redis(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "0"))
+        ))
+
+    @property
+    def db_pool(self) -> DatabasePool:
+        """DatabasePool: Pool of connections to the PostgreSQL server."""
+
+        return self._get("db_pool", DatabasePool.from_env)
+
+    @property
+    def evidence_pool(self) -> EvidencePool:
+        """EvidencePool: Worker processes for evidence scoring."""
+
+        return self._get("evidence_pool", get_evidence_pool)
+
+    @property
+    def main_pipeline(self) -> MainPipeline:
+        """MainPipeline: Pipeline orchestrator using the shared clients."""
+
+        return self._get("main_pipeline", lambda: MainPipeline(
+            get_openai_client=lambda: self.openai_client
+        ))
+
+    def startup(self):
+        """Creates every client, so the first request doesn't pay for it."""
+
+        self.openai_client
+        self.redis_client
+        self.http_pool
+        self.db_pool
+        self.evidence_pool.start()
+        self.main_pipeline
+
+    def shutdown(self):
+        """Closes the clients that were created."""
+
+        with self._lock:
+            names = list(reversed(self._created))
+            instances = [self._instances.pop(name) for name in names]
+            self._created = []
+
+        for instance in instances:
+            close = getattr(instance, "close", None)
+            if close is not None:
+                close()
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+                self._created.append(name)
+            return self._instances[name]
@@ -0,0 +1,154 @@
+import os
+import json
+import zlib
+import threading
+from typing import Any, Optional, Union
+
+import orjson
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Can't start a JSON document, so entries written before the codec existed
+# are told apart from versioned ones by their first byte
+MAGIC = b"\xfe"
+
+FORMAT_ORJSON = 1
+FORMAT_ORJSON_ZLIB = 2
+FORMAT_ORJSON_ZSTD = 3
+
+COMPRESSION_FORMATS = {
+    "none": FORMAT_ORJSON,
+    "zlib": FORMAT_ORJSON_ZLIB,
+    "zstd": FORMAT_ORJSON_ZSTD
+}
+
+class CacheCodec:
+    """Serialises values stored in Redis.
+
+    Values are encoded with orjson and, above min_compress_size bytes,
+    compressed with zlib or zstd. Every entry starts with a two byte header
+    naming its format, so the compression can be changed without flushing
+    Redis. Plain JSON entries without a header are still decoded.
+    """
+
+    def __init__(self,
+        compression: str = "zlib",
+        level: Optional[int] = None,
+        min_compress_size: int = 1024
+    ):
+        """Initialisation method for CacheCodec.
+
+        Args:
+            compression (str): One of none, zlib or zstd.
+            level (Optional[int]): Compression level, or None for the
+                library default.
+            min_compress_size (int): Serialised size in bytes below which
+                values are stored uncompressed.
+
+        Raises:
+            ValueError: If compression is unknown, or is zstd without the
+                zstandard package installed.
+        """
+
+        if compression not in COMPRESSION_FORMATS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd cache compression requires zstandard")
+
+        self.compression = compression
+        self.level = level
+        self.min_compress_size = min_compress_size
+
+        # zstandard contexts are not thread-safe
+        self._local = threading.local()
+
+    def encode(self, value: Any) -> bytes:
+        """Encodes a value for Redis.
+
+        Args:
+            value (Any): JSON serialisable value.
+
+        Returns:
+            bytes: Header followed by the encoded value.
+        """
+
+        data = orjson.dumps(value)
+
+        if self.compression == "none" or len(data) < self.min_compress_size:
+            return MAGIC + bytes([FORMAT_ORJSON]) + data
+
+        if self.compression == "zstd":
+            data = self._zstd_compressor().compress(data)
+        else:
+            data = zlib.compress(data, -1 if self.level is None else self.level)
+
+        return MAGIC + bytes([COMPRESSION_FORMATS[self.compression]]) + data
+
+    def decode(self, raw: Union[bytes, str]) -> Any:
+        """Decodes a value read from Redis.
+
+        Args:
+            raw (Union[bytes, str]): Value as stored in Redis, with or without
+                a codec header.
+
+        Returns:
+            Any: The decoded value.
+
+        Raises:
+            ValueError: If the entry was written in an unknown format.
+        """
+
+        if isinstance(raw, str):
+            return json.loads(raw)
+
+        if not raw.startswith(MAGIC):
+            return orjson.loads(raw)
+
+        version, data = raw[1], raw[2:]
+        if version == FORMAT_ORJSON:
+            return orjson.loads(data)
+        if version == FORMAT_ORJSON_ZLIB:
+            return orjson.loads(zlib.decompress(data))
+        if version == FORMAT_ORJSON_ZSTD:
+            if zstandard is None:
+                raise ValueError("Cache entry is zstd compressed, install zstandard")
+            return orjson.loads(self._zstd_decompressor().decompress(data))
+
+        raise ValueError(f"Unknown cache entry format: {version}")
+
+    def _zstd_compressor(self) -> "zstandard.ZstdCompressor":
+        if not hasattr(self._local, "compressor"):
+            level = 3 if self.level is None else self.level
+            self._local.compressor = zstandard.ZstdCompressor(level=level)
+        return self._local.compressor
+
+    def _zstd_decompressor(self) -> "zstandard.ZstdDecompressor":
+        if not hasattr(self._local, "decompressor"):
+            self._local.decompressor = zstandard.ZstdDecompressor()
+        return self._local.decompressor
+
+_shared_codec: Optional[CacheCodec] = None
+_shared_codec_lock = threading.Lock()
+
+def get_cache_codec() -> CacheCodec:
+    """Returns the process-wide cache codec.
+
+    Returns:
+        CacheCodec: Codec shared by every Redis cache in the process,
+            configured from CACHE_COMPRESSION, CACHE_COMPRESSION_LEVEL and
+            CACHE_MIN_COMPRESS_SIZE.
+    """
+
+    global _shared_codec
+    with _shared_codec_lock:
+        if _shared_codec is None:
+            level = os.getenv("CACHE_COMPRESSION_LEVEL")
+            _shared_codec = CacheCodec(
+                compression=os.getenv("CACHE_COMPRESSION", "zlib"),
+                level=int(level) if level else None,
+                min_compress_size=int(os.getenv("CACHE_MIN_COMPRESS_SIZE", "1024"))
+            )
+        return _shared_codec
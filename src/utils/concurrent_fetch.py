@@ -0,0 +1,28 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+def fetch_concurrently(
+    fetch: Callable[[T], R],
+    items: List[T],
+    max_in_flight: int
+) -> List[R]:
+    """Runs an I/O bound fetch over every item on a bounded thread pool.
+
+    Args:
+        fetch (Callable[[T], R]): Function that fetches a single item.
+        items (List[T]): Items to fetch.
+        max_in_flight (int): Maximum number of fetches running at once.
+
+    Returns:
+        List[R]: Fetched results, in the same order as items.
+    """
+
+    if len(items) <= 1 or max_in_flight <= 1:
+        return [fetch(item) for item in items]
+
+    workers = min(max_in_flight, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch, items))
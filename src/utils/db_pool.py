@@ -0,0 +1,159 @@
+import os
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
+
+import psycopg2
+from psycopg2 import pool
+from psycopg2.extensions import connection, cursor, TRANSACTION_STATUS_UNKNOWN
+
+class DatabasePool:
+    """Thread-safe pool of PostgreSQL connections.
+
+    Connections are checked out through a context manager, which commits
+    on success, rolls back on error and always returns the connection. A
+    connection that has been idle longer than health_check_interval is
+    pinged before use, and broken connections are discarded so the pool
+    reconnects instead of handing them to the next request.
+    """
+
+    def __init__(self,
+        minconn: int = 1,
+        maxconn: int = 10,
+        checkout_timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        **conn_kwargs: Any
+    ):
+        """Initialisation method for DatabasePool.
+
+        Args:
+            minconn (int): Connections opened up front.
+            maxconn (int): Maximum connections open at once.
+            checkout_timeout (float): Seconds to wait for a free connection
+                before giving up.
+            health_check_interval (float): Seconds a connection may sit idle
+                before it is pinged on checkout.
+            **conn_kwargs (Any): Arguments passed to psycopg2.connect.
+        """
+
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+
+        self._pool = pool.ThreadedConnectionPool(minconn, maxconn, **conn_kwargs)
+        # ThreadedConnectionPool raises when exhausted instead of blocking
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._last_used: Dict[int, float] = {}
+
+    @classmethod
+    def from_env(cls) -> "DatabasePool":
+        """Creates a pool configured from the environment.
+
+        Returns:
+            DatabasePool: Pool for the DATABASE_NAME database, sized by
+                DB_POOL_MIN and DB_POOL_MAX.
+        """
+
+        return cls(
+            minconn=int(os.getenv("DB_POOL_MIN", "1")),
+            maxconn=int(os.getenv("DB_POOL_MAX", "10")),
+            checkout_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+            health_check_interval=float(os.getenv("DB_HEALTH_CHECK_INTERVAL", "30")),
+            database=os.getenv("DATABASE_NAME"), 
+            user=os.getenv("USERNAME"),
+            password=os.getenv("PASSWORD"), 
+            host=os.getenv("DB_HOST", "localhost"), 
+            port=os.getenv("PORT")
+        )
+
+    @contextmanager
+    def connection(self) -> Iterator[connection]:
+        """Checks out a connection for the duration of the block.
+
+        Yields:
+            connection: A healthy connection, committed when the block
+                exits normally and rolled back when it raises.
+        """
+
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            raise pool.PoolError(
+                f"No free database connection after {self.checkout_timeout}s"
+            )
+
+        conn = None
+        discard = False
+        try:
+            conn = self._checkout()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                discard = self._is_broken(conn, e)
+                if not discard:
+                    conn.rollback()
+                raise
+        finally:
+            if conn is not None:
+                self._checkin(conn, discard)
+            self._slots.release()
+
+    @contextmanager
+    def cursor(self) -> Iterator[Tuple[connection, cursor]]:
+        """Checks out a connection and opens a cursor on it.
+
+        Yields:
+            Tuple[connection, cursor]: The connection and its cursor.
+        """
+
+        with self.connection() as db_conn:
+            with db_conn.cursor() as db_curs:
+                yield db_conn, db_curs
+
+    def close(self):
+        """Closes every connection in the pool."""
+
+        self._pool.closeall()
+
+    def _checkout(self) -> connection:
+        # Every broken connection is replaced by a fresh one from the pool,
+        # so this is bounded by the number of pooled connections
+        while True:
+            conn = self._pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+            self._pool.putconn(conn, close=True)
+
+    def _checkin(self, conn: connection, discard: bool):
+        with self._lock:
+            if discard or conn.closed:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+
+        self._pool.putconn(conn, close=discard or bool(conn.closed))
+
+    def _is_healthy(self, conn: connection) -> bool:
+        if conn.closed or conn.get_transaction_status() == TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        with self._lock:
+            last_used = self._last_used.get(id(conn))
+
+        if last_used is not None and \
+            time.monotonic() - last_used < self.health_check_interval:
+            return True
+
+        try:
+            with conn.cursor() as db_curs:
+                db_curs.execute("SELECT 1")
+            conn.rollback()
+        except psycopg2.Error:
+            return False
+
+        return True
+
+    def _is_broken(self, conn: connection, error: Exception) -> bool:
+        return bool(conn.closed) or isinstance(
+            error, (psycopg2.OperationalError, psycopg2.InterfaceError)
+        )
@@ -0,0 +1,111 @@
+import json
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from redis import Redis
+
+from src.utils.cache_codec import CacheCodec, get_cache_codec
+from src.utils.evidence_matcher import match_mode
+
+def project_list_hash(ux_info: Dict[str, Any]) -> str:
+    """Hashes the project list of a ux_info payload.
+
+    Args:
+        ux_info (Dict[str, Any]): Carries the project lists and evidence
+            for the project list relevance to the job market.
+
+    Returns:
+        str: Hex digest of the canonical JSON of the project list.
+    """
+
+    canonical = json.dumps(ux_info.get("project_list"), sort_keys=True,
+        separators=(",", ":"))
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class EvidenceCache:
+    """Redis cache of parsed project evidence.
+
+    Entries are stored next to the ux_info they were parsed from, keyed by
+    its id, the matching mode and a hash of its project list, so neither a
+    regenerated project list under the same id nor a change of mode ever
+    reuses stale evidence. Entries expire with the ux_info they belong to.
+    """
+
+    def __init__(self,
+        redis_client: Redis,
+        default_ttl: int = 3600,
+        codec: Optional[CacheCodec] = None,
+        exhaustive: bool = True,
+        top_k: Optional[int] = None
+    ):
+        """Initialisation method for EvidenceCache.
+
+        Args:
+            redis_client (Redis): Client for the Redis server holding entries.
+            default_ttl (int): Seconds an entry lives for when its ux_info
+                has no expiry.
+            codec (Optional[CacheCodec]): Serialises entries, or None to use
+                the process-wide codec.
+            exhaustive (bool): Whether the cached evidence scored every pair.
+            top_k (Optional[int]): Matches kept per achievement in the
+                cached evidence, or None for every match.
+        """
+
+        self.redis_client = redis_client
+        self.default_ttl = default_ttl
+        self.codec = codec or get_cache_codec()
+        self.mode = match_mode(exhaustive, top_k)
+
+    def key(self, ux_info_id: str, ux_info: Dict[str, Any]) -> str:
+        """Builds the Redis key for the evidence of a ux_info payload.
+
+        Args:
+            ux_info_id (str): Redis key of the ux_info.
+            ux_info (Dict[str, Any]): The ux_info payload.
+
+        Returns:
+            str: Redis key for the evidence.
+        """
+
+        return f"{ux_info_id}:evidence:{self.mode}:{project_list_hash(ux_info)}"
+
+    def get(self,
+        ux_info_id: str, ux_info: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Returns the cached evidence for a ux_info payload.
+
+        Args:
+            ux_info_id (str): Redis key of the ux_info.
+            ux_info (Dict[str, Any]): The ux_info payload.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: The parsed evidence, or None on
+                a miss.
+        """
+
+        value = self.redis_client.get(self.key(ux_info_id, ux_info))
+        if value is None:
+            return None
+
+        return self.codec.decode(value)
+
+    def put(self,
+        ux_info_id: str,
+        ux_info: Dict[str, Any],
+        evidence: List[Dict[str, Any]]
+    ):
+        """Stores the parsed evidence for a ux_info payload.
+
+        Args:
+            ux_info_id (str): Redis key of the ux_info.
+            ux_info (Dict[str, Any]): The ux_info payload.
+            evidence (List[Dict[str, Any]]): The parsed evidence.
+        """
+
+        # Outlive the ux_info by no more than its remaining lifetime
+        ttl = self.redis_client.ttl(ux_info_id)
+        if ttl is None or ttl <= 0:
+            ttl = self.default_ttl
+
+        self.redis_client.set(self.key(ux_info_id, ux_info),
+            self.codec.encode(evidence), ex=ttl)
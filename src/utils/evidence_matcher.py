@@ -0,0 +1,602 @@
+import heapq
+import logging
+from collections import Counter
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+from src.schemas.project_evidence import Match, ProjectListRelevance
+from src.utils.evidence_pool import EvidencePool
+from src.utils.text_normalisation import text_normalisation
+
+logger = logging.getLogger(__name__)
+
+OVERLAP_WEIGHT = 0.4
+FUZZ_WEIGHT = 0.6
+SIMILARITY_THRESHOLD = 0.40
+
+# Same preprocessing as thefuzz.fuzz.token_set_ratio with force_ascii=True
+_FORCE_ASCII_TABLE = {i: None for i in range(128, 256)}
+
+def _fuzz_process(text: str) -> str:
+    return default_process(text.translate(_FORCE_ASCII_TABLE))
+
+def match_mode(exhaustive: bool, top_k: Optional[int]) -> str:
+    """Names the matching mode, for the keys of stored matches.
+
+    Args:
+        exhaustive (bool): Whether every pair is scored.
+        top_k (Optional[int]): Matches kept per achievement.
+
+    Returns:
+        str: The mode, such as exhaustive:all or pruned:5.
+    """
+
+    return f"{'exhaustive' if exhaustive else 'pruned'}:{top_k or 'all'}"
+
+MATCH_FIELDS = (
+    "project_title",
+    "project_achievement",
+    "job_title",
+    "company_name",
+    "qualification"
+)
+
+class MatchRecords:
+    """Compact, deduplicated matches between achievements and qualifications.
+
+    Each distinct string is stored once in strings, and each match is a
+    tuple of indices into it, one per field of Match in MATCH_FIELDS order.
+    Matches stay as plain tuples while they are collected and deduplicated,
+    and only become Match schemas when converted for the API. Ranked
+    matches also carry their similarity score in scores.
+    """
+
+    __slots__ = ("strings", "records", "scores", "_ids")
+
+    def __init__(self, scored: bool = False):
+        """Initialisation method for MatchRecords.
+
+        Args:
+            scored (bool): Keep a similarity score with each match.
+        """
+
+        self.strings: List[Optional[str]] = []
+        self.records: List[Tuple[int, int, int, int, int]] = []
+        self.scores: Optional[List[float]] = [] if scored else None
+        self._ids: Dict[Optional[str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def intern(self, text: Optional[str]) -> int:
+        """Returns the index of a string, storing it on first use.
+
+        Args:
+            text (Optional[str]): The string.
+
+        Returns:
+            int: Its index in strings.
+        """
+
+        idx = self._ids.get(text)
+        if idx is None:
+            idx = self._ids[text] = len(self.strings)
+            self.strings.append(text)
+
+        return idx
+
+    def dedupe(self):
+        """Drops repeated matches, keeping the first of each."""
+
+        if self.scores is None:
+            self.records = list(dict.fromkeys(self.records))
+            return
+
+        first: Dict[Tuple[int, int, int, int, int], float] = {}
+        for record, score in zip(self.records, self.scores):
+            first.setdefault(record, score)
+
+        self.records = list(first)
+        self.scores = list(first.values())
+
+    def iter_dicts(self) -> Iterator[Dict[str, Optional[str]]]:
+        """Yields each match as a dictionary.
+
+        Yields:
+            Dict[str, Optional[str]]: The match, as dumped from Match.
+        """
+
+        strings = self.strings
+        for pos, record in enumerate(self.records):
+            match = {
+                field: strings[idx] for field, idx in zip(MATCH_FIELDS, record)
+            }
+            if self.scores is not None:
+                match["score"] = self.scores[pos]
+            yield match
+
+    def to_dicts(self) -> List[Dict[str, Optional[str]]]:
+        """Converts the matches to dictionaries.
+
+        Returns:
+            List[Dict[str, Optional[str]]]: The matches, as dumped from
+                Match.
+        """
+
+        return list(self.iter_dicts())
+
+    def to_schema(self) -> ProjectListRelevance:
+        """Converts the matches to the API schema.
+
+        Returns:
+            ProjectListRelevance: Schema to carry the list of project names
+                and the job role requirements that they achieve.
+        """
+
+        return ProjectListRelevance(
+            root=[Match(**match) for match in self.iter_dicts()]
+        )
+
+def build_index(token_sets: List[FrozenSet[str]]) -> Dict[str, List[int]]:
+    """Builds an inverted index from token to the sets containing it.
+
+    Args:
+        token_sets (List[FrozenSet[str]]): Normalised token sets.
+
+    Returns:
+        Dict[str, List[int]]: Indices of the token sets containing each
+            token or n-gram.
+    """
+
+    index: Dict[str, List[int]] = {}
+    for idx, tokens in enumerate(token_sets):
+        for tok in tokens:
+            index.setdefault(tok, []).append(idx)
+
+    return index
+
+def jaccard_matrix(
+    left: List[FrozenSet[str]], right: List[FrozenSet[str]]) -> np.ndarray:
+    """Calculates the Jaccard similarity between every pair of token sets.
+
+    Intersections are counted through an inverted index over right, so
+    the cost grows with the number of shared tokens rather than with the
+    size of the vocabulary.
+
+    Args:
+        left (List[FrozenSet[str]]): Token sets for the rows.
+        right (List[FrozenSet[str]]): Token sets for the columns.
+
+    Returns:
+        np.ndarray: Matrix of similarities between 0 and 1, with 0 where
+            both sets are empty.
+    """
+
+    index = build_index(right)
+
+    intersection = np.zeros((len(left), len(right)))
+    for i, tokens in enumerate(left):
+        shared = Counter(j for tok in tokens for j in index.get(tok, ()))
+        if shared:
+            cols = np.fromiter(shared.keys(), dtype=np.intp, count=len(shared))
+            intersection[i, cols] = np.fromiter(shared.values(), dtype=np.float64, count=len(shared))
+
+    left_sizes = np.array([len(tokens) for tokens in left], dtype=np.float64)
+    right_sizes = np.array([len(tokens) for tokens in right], dtype=np.float64)
+    union = left_sizes[:, None] + right_sizes[None, :] - intersection
+
+    return np.divide(
+        intersection, union, out=np.zeros_like(intersection), where=union > 0
+    )
+
+def score_pairs(
+    overlap: np.ndarray,
+    achievement_strs: List[str],
+    qualification_strs: List[str],
+    exhaustive: bool = False
+) -> np.ndarray:
+    """Weights token overlap and fuzzy similarity into a score per pair.
+
+    Args:
+        overlap (np.ndarray): Jaccard similarities, a row per achievement
+            and a column per qualification.
+        achievement_strs (List[str]): Achievements, preprocessed for fuzzy
+            matching.
+        qualification_strs (List[str]): Qualifications, preprocessed for
+            fuzzy matching.
+        exhaustive (bool): Score every pair instead of only the pairs with
+            a non-zero overlap.
+
+    Returns:
+        np.ndarray: Matrix of weighted similarities, 0 for pruned pairs.
+    """
+
+    if exhaustive:
+        # thefuzz rounds token_set_ratio to an integer percentage
+        fuzz_sim = np.rint(process.cdist(
+            achievement_strs,
+            qualification_strs,
+            scorer=fuzz.token_set_ratio,
+            dtype=np.float64
+        )) / 100
+
+        return OVERLAP_WEIGHT * overlap + FUZZ_WEIGHT * fuzz_sim
+
+    # Pairs sharing a token are exactly the pairs with a non-zero overlap
+    scores = np.zeros_like(overlap)
+    for i, j in np.argwhere(overlap > 0):
+        fuzz_sim = round(fuzz.token_set_ratio(
+            achievement_strs[i], qualification_strs[j]
+        )) / 100
+        scores[i, j] = OVERLAP_WEIGHT * overlap[i, j] + FUZZ_WEIGHT * fuzz_sim
+
+    return scores
+
+def _score_shard(
+    achievement_tokens: List[FrozenSet[str]],
+    achievement_strs: List[str],
+    qualification_tokens: List[FrozenSet[str]],
+    qualification_strs: List[str],
+    exhaustive: bool
+) -> np.ndarray:
+    overlap = jaccard_matrix(achievement_tokens, qualification_tokens)
+    return score_pairs(overlap, achievement_strs, qualification_strs, exhaustive)
+
+# A ranked match: its score, then negated listing and qualification
+# positions so earlier listings win ties, then its job title, company and
+# qualification ids
+RankedMatch = Tuple[float, int, int, Tuple[int, int, int]]
+
+def top_k_row(
+    overlap_row: np.ndarray,
+    achievement_str: str,
+    qualification_strs: List[str],
+    occurrences: List[List[Tuple[int, int, Tuple[int, int, int]]]],
+    top_k: int,
+    exhaustive: bool = False
+) -> List[RankedMatch]:
+    """Ranks the qualifications of one achievement, keeping the best top_k.
+
+    Candidates are scanned from the highest token overlap down, and the
+    scan stops as soon as the best score a pair could reach, with a perfect
+    fuzzy similarity, falls below both the threshold and the lowest score
+    kept so far.
+
+    Args:
+        overlap_row (np.ndarray): Jaccard similarity of the achievement to
+            each qualification.
+        achievement_str (str): Achievement, preprocessed for fuzzy
+            matching.
+        qualification_strs (List[str]): Qualifications, preprocessed for
+            fuzzy matching.
+        occurrences (List[List[Tuple[int, int, Tuple[int, int, int]]]]):
+            Listing position, position within the listing and match key of
+            every listing carrying each qualification, in listing order.
+        top_k (int): Matches kept.
+        exhaustive (bool): Consider every qualification instead of only
+            those with a non-zero overlap.
+
+    Returns:
+        List[RankedMatch]: The kept matches, best first.
+    """
+
+    if exhaustive:
+        cols = np.arange(len(qualification_strs))
+    else:
+        cols = np.flatnonzero(overlap_row > 0)
+    # Highest possible score first, ties in qualification order
+    cols = cols[np.argsort(-overlap_row[cols], kind="stable")]
+
+    # Min-heap, so the root is the match to evict
+    heap: List[RankedMatch] = []
+    kept = set()
+    for j in cols:
+        floor = SIMILARITY_THRESHOLD
+        if len(heap) == top_k:
+            floor = max(floor, heap[0][0])
+
+        partial = OVERLAP_WEIGHT * overlap_row[j]
+        if partial + FUZZ_WEIGHT < floor:
+            break
+
+        # rapidfuzz returns 0 early once a pair can't reach the cut-off,
+        # less half a point as thefuzz rounds to an integer percentage
+        cutoff = max(0.0, (floor - partial) / FUZZ_WEIGHT * 100 - 0.5 - 1e-6)
+        fuzz_sim = round(fuzz.token_set_ratio(
+            achievement_str, qualification_strs[j], score_cutoff=cutoff
+        )) / 100
+        # Unrounded, so pairs match at the threshold as in the unranked
+        # mode and ties are only between equal scores
+        score = float(partial + FUZZ_WEIGHT * fuzz_sim)
+        if score < SIMILARITY_THRESHOLD:
+            continue
+
+        for listing_pos, qual_pos, key in occurrences[j]:
+            if key in kept:
+                continue
+
+            entry = (score, -listing_pos, -qual_pos, key)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                kept.discard(heapq.heapreplace(heap, entry)[3])
+            else:
+                # Later listings score the same and lose the tie
+                break
+            kept.add(key)
+
+    return sorted(heap, reverse=True)
+
+def _rank_shard(
+    achievement_tokens: List[FrozenSet[str]],
+    achievement_strs: List[str],
+    qualification_tokens: List[FrozenSet[str]],
+    qualification_strs: List[str],
+    occurrences: List[List[Tuple[int, int, Tuple[int, int, int]]]],
+    top_k: int,
+    exhaustive: bool
+) -> List[List[RankedMatch]]:
+    overlap = jaccard_matrix(achievement_tokens, qualification_tokens)
+    return [
+        top_k_row(overlap[i], achievement_strs[i], qualification_strs,
+            occurrences, top_k, exhaustive)
+        for i in range(len(achievement_strs))
+    ]
+
+class EvidenceMatcher:
+    """Batch matcher between project achievements and job qualifications.
+
+    Every unique achievement and qualification is normalised once. By
+    default, an inverted index from normalised token to qualification
+    limits scoring to pairs sharing at least one token or n-gram, so the
+    work grows with the actual overlaps. With exhaustive set, the token
+    overlap and fuzzy similarity of every unique pair are scored in bulk,
+    which matches the original pair by pair scoring with thefuzz exactly,
+    including pairs that only match on fuzzy similarity.
+
+    With top_k set, matches keep their score and only the top_k highest
+    scoring matches of each achievement are returned, as ranked by
+    top_k_row.
+
+    With a pool, large score matrices are split by qualification across its
+    worker processes. Ranking is split the same way, each worker keeping
+    the top_k of its own qualifications, and the best top_k of those are
+    merged for each achievement.
+    """
+
+    def __init__(self,
+        projects: List[Dict[str, Any]],
+        evidence: List[Dict[str, Any]],
+        exhaustive: bool = False,
+        top_k: Optional[int] = None,
+        pool: Optional[EvidencePool] = None
+    ):
+        """Initialisation method for EvidenceMatcher.
+
+        Args:
+            projects (List[Dict[str, Any]]): Generated projects.
+            evidence (List[Dict[str, Any]]): Job listing information.
+            exhaustive (bool): Score every pair instead of only the pairs
+                sharing a normalised token.
+            top_k (Optional[int]): Matches kept per achievement, ranked by
+                score, or None to keep every match over the threshold.
+            pool (Optional[EvidencePool]): Worker processes for large score
+                matrices, or None to always score serially.
+        """
+
+        self.projects = projects
+        self.evidence = evidence
+        self.exhaustive = exhaustive
+        self.top_k = top_k
+        self.pool = pool
+
+        self.achievements = list(dict.fromkeys(
+            ach for project in projects
+            for ach in project["achieved_qualifications"]
+        ))
+        self.qualifications = list(dict.fromkeys(
+            qual for listing in evidence
+            for qual in listing.get("Qualifications") or []
+        ))
+
+        self._achievement_idx = {a: i for i, a in enumerate(self.achievements)}
+        self._qualification_idx = {q: i for i, q in enumerate(self.qualifications)}
+
+    def run(self) -> MatchRecords:
+        """Matches every project against every job listing.
+
+        Returns:
+            MatchRecords: Unique matches between project achievements and
+                job qualifications, in project, listing, achievement and
+                qualification order. With top_k set, in project and
+                achievement order, then by descending score.
+        """
+
+        records = MatchRecords(scored=self.top_k is not None)
+        if not self.achievements or not self.qualifications:
+            return records
+
+        if self.top_k is not None:
+            return self._run_ranked(records)
+
+        hits = self.score_matrix() >= SIMILARITY_THRESHOLD
+
+        achievement_ids = [records.intern(a) for a in self.achievements]
+        qualification_ids = [records.intern(q) for q in self.qualifications]
+
+        append = records.records.append
+        for project in self.projects:
+            title_id = records.intern(project["title"])
+            rows = [self._achievement_idx[a] for a in project["achieved_qualifications"]]
+            for listing in self.evidence:
+                quals = listing.get("Qualifications") or []
+                cols = [self._qualification_idx[q] for q in quals]
+                if not rows or not cols:
+                    continue
+
+                job_title_id = records.intern(listing["job_title"])
+                company_id = records.intern(listing["employer_name"])
+                for i, j in np.argwhere(hits[np.ix_(rows, cols)]):
+                    append((
+                        title_id,
+                        achievement_ids[rows[i]],
+                        job_title_id,
+                        company_id,
+                        qualification_ids[cols[j]]
+                    ))
+
+        records.dedupe()
+
+        return records
+
+    def score_matrix(self) -> np.ndarray:
+        """Scores achievements against qualifications.
+
+        Returns:
+            np.ndarray: Matrix of weighted similarities, with a row per
+                unique achievement and a column per unique qualification.
+                Pruned pairs score 0.
+        """
+
+        pairs = len(self.achievements) * len(self.qualifications)
+        if self.pool is not None and self.pool.parallel(pairs):
+            try:
+                return self._score_parallel()
+            except BrokenProcessPool:
+                logger.exception("Evidence pool broke, scoring serially")
+
+        overlap, achievement_strs, qualification_strs = self._prepare()
+
+        return score_pairs(overlap, achievement_strs, qualification_strs,
+            self.exhaustive)
+
+    def rank_rows(self,
+        occurrences: List[List[Tuple[int, int, Tuple[int, int, int]]]]
+    ) -> List[List[RankedMatch]]:
+        """Ranks the qualifications of every achievement, keeping top_k each.
+
+        Args:
+            occurrences (List[List[Tuple[int, int, Tuple[int, int, int]]]]):
+                Listing position, position within the listing and match key
+                of every listing carrying each unique qualification, in
+                listing order.
+
+        Returns:
+            List[List[RankedMatch]]: The kept matches of each unique
+                achievement, best first.
+        """
+
+        pairs = len(self.achievements) * len(self.qualifications)
+        if self.pool is not None and self.pool.parallel(pairs):
+            try:
+                return self._rank_parallel(occurrences)
+            except BrokenProcessPool:
+                logger.exception("Evidence pool broke, ranking serially")
+
+        overlap, achievement_strs, qualification_strs = self._prepare()
+
+        return [
+            top_k_row(overlap[i], achievement_strs[i], qualification_strs,
+                occurrences, self.top_k, self.exhaustive)
+            for i in range(len(self.achievements))
+        ]
+
+    def _score_parallel(self) -> np.ndarray:
+        shards, args = self._shard_args()
+        blocks = self.pool.map(
+            _score_shard,
+            *args,
+            [self.exhaustive] * len(shards)
+        )
+
+        return np.hstack(blocks)
+
+    def _rank_parallel(self,
+        occurrences: List[List[Tuple[int, int, Tuple[int, int, int]]]]
+    ) -> List[List[RankedMatch]]:
+        shards, args = self._shard_args()
+        blocks = self.pool.map(
+            _rank_shard,
+            *args,
+            # Positions stay global, so ties break the same in every shard
+            [[occurrences[j] for j in shard] for shard in shards],
+            [self.top_k] * len(shards),
+            [self.exhaustive] * len(shards)
+        )
+
+        # The best top_k overall are among the best top_k of each shard
+        return [
+            heapq.nlargest(self.top_k, (entry for block in blocks for entry in block[i]))
+            for i in range(len(self.achievements))
+        ]
+
+    def _shard_args(self) -> Tuple[List[np.ndarray], List[List[Any]]]:
+        # The shards, and the token and string tables each worker gets, in
+        # the argument order of _score_shard and _rank_shard
+        # Normalised here, where text_normalisation's cache lives
+        achievement_tokens = [text_normalisation(a) for a in self.achievements]
+        qualification_tokens = [text_normalisation(q) for q in self.qualifications]
+        achievement_strs = [_fuzz_process(a) for a in self.achievements]
+        qualification_strs = [_fuzz_process(q) for q in self.qualifications]
+
+        # Split by qualification, as there are far more of them than
+        # achievements, so each worker gets every achievement and only its
+        # own slice of the qualification table
+        shards = np.array_split(
+            np.arange(len(self.qualifications)),
+            min(self.pool.workers, len(self.qualifications))
+        )
+        n_shards = len(shards)
+
+        return shards, [
+            [achievement_tokens] * n_shards,
+            [achievement_strs] * n_shards,
+            [[qualification_tokens[j] for j in shard] for shard in shards],
+            [[qualification_strs[j] for j in shard] for shard in shards]
+        ]
+
+    def _prepare(self) -> Tuple[np.ndarray, List[str], List[str]]:
+        overlap = jaccard_matrix(
+            [text_normalisation(a) for a in self.achievements],
+            [text_normalisation(q) for q in self.qualifications]
+        )
+        achievement_strs = [_fuzz_process(a) for a in self.achievements]
+        qualification_strs = [_fuzz_process(q) for q in self.qualifications]
+
+        return overlap, achievement_strs, qualification_strs
+
+    def _run_ranked(self, records: MatchRecords) -> MatchRecords:
+        # Every listing carrying each qualification, in listing order
+        occurrences: List[List[Tuple[int, int, Tuple[int, int, int]]]] = [
+            [] for _ in self.qualifications
+        ]
+        for listing_pos, listing in enumerate(self.evidence):
+            job_title_id = records.intern(listing["job_title"])
+            company_id = records.intern(listing["employer_name"])
+            for qual_pos, qual in enumerate(listing.get("Qualifications") or []):
+                j = self._qualification_idx[qual]
+                occurrences[j].append((
+                    listing_pos, qual_pos,
+                    (job_title_id, company_id, records.intern(qual))
+                ))
+
+        ranked = self.rank_rows(occurrences)
+
+        for project in self.projects:
+            title_id = records.intern(project["title"])
+            for ach in project["achieved_qualifications"]:
+                ach_id = records.intern(ach)
+                for score, _, _, (job_title_id, company_id, qual_id) in \
+                    ranked[self._achievement_idx[ach]]:
+                    records.records.append(
+                        (title_id, ach_id, job_title_id, company_id, qual_id)
+                    )
+                    records.scores.append(round(score, 4))
+
+        records.dedupe()
+
+        return records
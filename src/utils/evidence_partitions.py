@@ -0,0 +1,340 @@
+import json
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from redis import Redis
+
+from src.utils.cache_codec import CacheCodec, get_cache_codec
+from src.utils.evidence_matcher import (
+    EvidenceMatcher,
+    MatchRecords,
+    SIMILARITY_THRESHOLD,
+    match_mode
+)
+from src.utils.evidence_pool import EvidencePool
+
+def content_hash(value: Any) -> str:
+    """Hashes a JSON-serialisable value by its canonical JSON.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: Hex digest of the canonical JSON.
+    """
+
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def project_hash(project: Dict[str, Any]) -> str:
+    """Hashes the parts of a project that evidence matching reads.
+
+    Args:
+        project (Dict[str, Any]): A project from the list of generated
+            projects.
+
+    Returns:
+        str: Hex digest of its title and achieved qualifications.
+    """
+
+    return content_hash([project["title"], project["achieved_qualifications"]])
+
+def listing_hash(listing: Dict[str, Any]) -> str:
+    """Hashes the parts of a job listing that evidence matching reads.
+
+    Args:
+        listing (Dict[str, Any]): Job listing information.
+
+    Returns:
+        str: Hex digest of its title, employer and qualifications.
+    """
+
+    return content_hash([
+        listing["job_title"],
+        listing["employer_name"],
+        listing.get("Qualifications") or []
+    ])
+
+class EvidencePartitions:
+    """Incremental evidence matching over Redis-held partitions.
+
+    The matches of each project and job listing pair are stored as a
+    partition, keyed by content hashes of the project and the listing, so
+    a partition is reused by any ux_info holding the same pair. Each
+    project's partitions share a Redis hash, with a field per listing, so
+    a run costs a few round trips however many listings there are. A run only
+    scores the pairs whose partitions are missing, such as those of a
+    regenerated project or of listings from a new search, then merges every
+    partition into the same matches EvidenceMatcher.run returns.
+
+    Partitions hold positions into the project's achievements and the
+    listing's qualifications. With top_k set, they also hold scores, and
+    only the top_k matches of each achievement within the listing, which
+    always include its part of the overall top_k.
+    """
+
+    def __init__(self,
+        redis_client: Redis,
+        ttl: int = 86400,
+        codec: Optional[CacheCodec] = None
+    ):
+        """Initialisation method for EvidencePartitions.
+
+        Args:
+            redis_client (Redis): Client for the Redis server holding the
+                partitions.
+            ttl (int): Seconds a partition lives after it was last used.
+            codec (Optional[CacheCodec]): Serialises partitions, or None to
+                use the process-wide codec.
+        """
+
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.codec = codec or get_cache_codec()
+
+        self._lock = threading.Lock()
+        self._stats = {"reused": 0, "computed": 0}
+
+    def key(self,
+        project: Dict[str, Any],
+        exhaustive: bool = False,
+        top_k: Optional[int] = None
+    ) -> str:
+        """Builds the Redis key of the hash holding a project's partitions.
+
+        Args:
+            project (Dict[str, Any]): A project from the list of generated
+                projects.
+            exhaustive (bool): Whether every pair is scored.
+            top_k (Optional[int]): Matches kept per achievement.
+
+        Returns:
+            str: Redis key for the hash, with a field per listing hash.
+        """
+
+        return self._key(project_hash(project), exhaustive, top_k)
+
+    def run(self,
+        projects: List[Dict[str, Any]],
+        evidence: List[Dict[str, Any]],
+        exhaustive: bool = False,
+        top_k: Optional[int] = None,
+        pool: Optional[EvidencePool] = None
+    ) -> MatchRecords:
+        """Matches every project against every job listing.
+
+        Args:
+            projects (List[Dict[str, Any]]): Generated projects.
+            evidence (List[Dict[str, Any]]): Job listing information.
+            exhaustive (bool): Score every pair instead of only the pairs
+                sharing a normalised token.
+            top_k (Optional[int]): Matches kept per achievement, ranked by
+                score, or None to keep every match over the threshold.
+            pool (Optional[EvidencePool]): Worker processes for scoring the
+                missing partitions.
+
+        Returns:
+            MatchRecords: The matches EvidenceMatcher.run would return.
+        """
+
+        project_keys = [self.key(project, exhaustive, top_k) for project in projects]
+        listing_hashes = [listing_hash(listing) for listing in evidence]
+
+        stored = []
+        if listing_hashes:
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in project_keys:
+                    pipe.hmget(key, listing_hashes)
+                stored = pipe.execute()
+
+        partitions: Dict[Tuple[int, int], List[List[Any]]] = {}
+        missing = []
+        for p, values in enumerate(stored):
+            for l, value in enumerate(values):
+                if value is None:
+                    missing.append((p, l))
+                else:
+                    partitions[(p, l)] = self.codec.decode(value)
+
+        if missing:
+            partitions.update(self._compute(
+                projects, evidence, missing, exhaustive, top_k, pool
+            ))
+
+        new_fields: Dict[int, Dict[str, bytes]] = {}
+        for p, l in missing:
+            new_fields.setdefault(p, {})[listing_hashes[l]] = \
+                self.codec.encode(partitions[(p, l)])
+
+        # Partitions still in use outlive those that aren't
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for p, key in enumerate(project_keys):
+                if p in new_fields:
+                    pipe.hset(key, mapping=new_fields[p])
+                pipe.expire(key, self.ttl)
+            pipe.execute()
+
+        self._count("computed", len(missing))
+        self._count("reused", len(partitions) - len(missing))
+
+        if top_k is None:
+            return self._merge(projects, evidence, partitions)
+
+        return self._merge_ranked(projects, evidence, partitions, top_k)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the partition counters.
+
+        Returns:
+            Dict[str, int]: Partitions reused from Redis and computed.
+        """
+
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, name: str, amount: int):
+        with self._lock:
+            self._stats[name] += amount
+
+    def _key(self, p_hash: str, exhaustive: bool, top_k: Optional[int]) -> str:
+        return f"evidence_partition:{match_mode(exhaustive, top_k)}:{p_hash}"
+
+    def _compute(self,
+        projects: List[Dict[str, Any]],
+        evidence: List[Dict[str, Any]],
+        missing: List[Tuple[int, int]],
+        exhaustive: bool,
+        top_k: Optional[int],
+        pool: Optional[EvidencePool]
+    ) -> Dict[Tuple[int, int], List[List[Any]]]:
+        # Score only the projects and listings with a missing partition
+        project_ids = sorted({p for p, _ in missing})
+        listing_ids = sorted({l for _, l in missing})
+        matcher = EvidenceMatcher(
+            [projects[p] for p in project_ids],
+            [evidence[l] for l in listing_ids],
+            exhaustive=exhaustive,
+            pool=pool
+        )
+        if matcher.achievements and matcher.qualifications:
+            scores = matcher.score_matrix()
+        else:
+            scores = np.zeros((len(matcher.achievements), len(matcher.qualifications)))
+
+        achievement_idx = {a: i for i, a in enumerate(matcher.achievements)}
+        qualification_idx = {q: j for j, q in enumerate(matcher.qualifications)}
+
+        computed = {}
+        for p, l in missing:
+            achievements = projects[p]["achieved_qualifications"]
+            quals = evidence[l].get("Qualifications") or []
+            if not achievements or not quals:
+                computed[(p, l)] = []
+                continue
+
+            rows = [achievement_idx[a] for a in achievements]
+            cols = [qualification_idx[q] for q in quals]
+            block = scores[np.ix_(rows, cols)]
+
+            if top_k is None:
+                computed[(p, l)] = [
+                    [int(i), int(j)]
+                    for i, j in np.argwhere(block >= SIMILARITY_THRESHOLD)
+                ]
+                continue
+
+            partition = []
+            for i in range(len(achievements)):
+                # Unrounded, as in EvidenceMatcher's ranked mode, keeping the
+                # first of any repeated qualification
+                ranked = {}
+                for j, qual in enumerate(quals):
+                    score = float(block[i, j])
+                    if score >= SIMILARITY_THRESHOLD and qual not in ranked:
+                        ranked[qual] = (score, j)
+                best = sorted(ranked.values(), key=lambda entry: (-entry[0], entry[1]))
+                partition.extend([i, j, score] for score, j in best[:top_k])
+            computed[(p, l)] = partition
+
+        return computed
+
+    def _merge(self,
+        projects: List[Dict[str, Any]],
+        evidence: List[Dict[str, Any]],
+        partitions: Dict[Tuple[int, int], List[List[Any]]]
+    ) -> MatchRecords:
+        records = MatchRecords()
+        listing_ids = [
+            (records.intern(listing["job_title"]), records.intern(listing["employer_name"]))
+            for listing in evidence
+        ]
+
+        append = records.records.append
+        for p, project in enumerate(projects):
+            title_id = records.intern(project["title"])
+            achievements = project["achieved_qualifications"]
+            for l, listing in enumerate(evidence):
+                quals = listing.get("Qualifications") or []
+                job_title_id, company_id = listing_ids[l]
+                for i, j in partitions[(p, l)]:
+                    append((
+                        title_id,
+                        records.intern(achievements[i]),
+                        job_title_id,
+                        company_id,
+                        records.intern(quals[j])
+                    ))
+
+        records.dedupe()
+
+        return records
+
+    def _merge_ranked(self,
+        projects: List[Dict[str, Any]],
+        evidence: List[Dict[str, Any]],
+        partitions: Dict[Tuple[int, int], List[List[Any]]],
+        top_k: int
+    ) -> MatchRecords:
+        records = MatchRecords(scored=True)
+        listing_ids = [
+            (records.intern(listing["job_title"]), records.intern(listing["employer_name"]))
+            for listing in evidence
+        ]
+
+        for p, project in enumerate(projects):
+            title_id = records.intern(project["title"])
+            achievements = project["achieved_qualifications"]
+
+            # Candidates of each achievement, best first, ties to the
+            # earliest listing and qualification
+            candidates: Dict[int, List[Tuple[float, int, int, Tuple[int, int, int]]]] = {}
+            for l, listing in enumerate(evidence):
+                quals = listing.get("Qualifications") or []
+                job_title_id, company_id = listing_ids[l]
+                for i, j, score in partitions[(p, l)]:
+                    candidates.setdefault(i, []).append((
+                        -score, l, j,
+                        (job_title_id, company_id, records.intern(quals[j]))
+                    ))
+
+            for i, ach in enumerate(achievements):
+                ach_id = records.intern(ach)
+                kept = {}
+                for neg_score, _, _, key in sorted(candidates.get(i, [])):
+                    if key not in kept:
+                        kept[key] = -neg_score
+                        if len(kept) == top_k:
+                            break
+
+                for (job_title_id, company_id, qual_id), score in kept.items():
+                    records.records.append(
+                        (title_id, ach_id, job_title_id, company_id, qual_id)
+                    )
+                    records.scores.append(round(score, 4))
+
+        records.dedupe()
+
+        return records
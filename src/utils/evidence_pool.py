@@ -0,0 +1,135 @@
+import os
+import importlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, List, Optional
+
+def _preload(modules: List[str]):
+    for module in modules:
+        importlib.import_module(module)
+
+class EvidencePool:
+    """Persistent pool of worker processes for evidence scoring.
+
+    Evidence scoring is CPU bound and holds the GIL, so it is spread across
+    processes instead of threads. The processes are started once, with the
+    spawn method so they never inherit the server's threads or sockets, and
+    reused by every request. Work smaller than min_pairs is not worth the
+    pickling and is left to run serially.
+    """
+
+    def __init__(self,
+        workers: int = 1,
+        min_pairs: int = 20000,
+        preload: Optional[List[str]] = None
+    ):
+        """Initialisation method for EvidencePool.
+
+        Args:
+            workers (int): Number of worker processes. 1 or fewer runs
+                everything serially.
+            min_pairs (int): Fewest achievement and qualification pairs
+                worth scoring in parallel.
+            preload (Optional[List[str]]): Modules each worker process
+                imports as it starts, so their import cost is paid by start
+                instead of the first request.
+        """
+
+        self.workers = workers
+        self.min_pairs = min_pairs
+        self.preload = preload or []
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def parallel(self, pairs: int) -> bool:
+        """Returns whether work of a given size should run in the pool.
+
+        Args:
+            pairs (int): Number of achievement and qualification pairs.
+
+        Returns:
+            bool: Whether to run in parallel.
+        """
+
+        return self.workers > 1 and pairs >= self.min_pairs
+
+    def start(self):
+        """Starts every worker process and waits for its preloaded imports.
+
+        Called by AppContainer.startup, so the first request doesn't wait.
+        """
+
+        if self.workers <= 1:
+            return
+
+        executor = self._get_executor()
+        list(executor.map(int, range(self.workers)))
+
+    def map(self, func: Callable[..., Any], *iterables: Iterable) -> List[Any]:
+        """Runs func over the iterables in the worker processes.
+
+        Args:
+            func (Callable[..., Any]): Module-level function to run.
+            *iterables (Iterable): Arguments for each call.
+
+        Returns:
+            List[Any]: The results, in order.
+
+        Raises:
+            BrokenProcessPool: If a worker died. The pool is replaced on
+                the next call.
+        """
+
+        executor = self._get_executor()
+        try:
+            return list(executor.map(func, *iterables))
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def close(self):
+        """Stops the worker processes."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_preload,
+                    initargs=(self.preload,)
+                )
+            return self._executor
+
+_shared_pool: Optional[EvidencePool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_evidence_pool() -> EvidencePool:
+    """Returns the process-wide evidence pool.
+
+    Returns:
+        EvidencePool: Pool shared by every ProjectEvidence in the process,
+            configured from EVIDENCE_WORKERS and EVIDENCE_PARALLEL_MIN_PAIRS.
+    """
+
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = EvidencePool(
+                workers=int(os.getenv("EVIDENCE_WORKERS", "1")),
+                min_pairs=int(os.getenv("EVIDENCE_PARALLEL_MIN_PAIRS", "20000")),
+                preload=["src.utils.evidence_matcher"]
+            )
+        return _shared_pool
@@ -0,0 +1,224 @@
+import os
+import time
+import threading
+import http.client
+from typing import Dict, List, Optional, Tuple
+
+# Raised when a kept-alive socket was closed by the server while idle
+STALE_CONNECTION_ERRORS = (
+    http.client.BadStatusLine,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+class HTTPStatusError(Exception):
+    """Raised for a response with a non-2xx status."""
+
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+        super().__init__(f"Upstream request failed with status {status}: "
+            f"{body[:200].decode('utf-8', 'replace')}")
+
+class HTTPConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections.
+
+    Connections are kept per (scheme, host) and handed out last-in
+    first-out, so the warmest socket is reused first. The number of
+    connections checked out per host is capped, idle connections are
+    evicted after idle_timeout seconds, and a request sent on a reused
+    socket that turns out to be stale is retried once on a new connection.
+    """
+
+    def __init__(self,
+        max_per_host: int = 8,
+        idle_timeout: float = 60.0,
+        acquire_timeout: float = 30.0
+    ):
+        """Initialisation method for HTTPConnectionPool.
+
+        Args:
+            max_per_host (int): Maximum number of connections open to a
+                single host at once.
+            idle_timeout (float): Seconds a connection may sit idle in the
+                pool before being closed.
+            acquire_timeout (float): Seconds to wait for a free connection
+                slot before giving up.
+        """
+
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._slots: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "reconnects": 0}
+
+    def request(self,
+        scheme: str,
+        host: str,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[int, bytes]:
+        """Sends a request over a pooled connection.
+
+        Args:
+            scheme (str): Either "http" or "https".
+            host (str): Host, optionally with a port.
+            method (str): HTTP method.
+            url (str): Path and query string of the request.
+            headers (Optional[Dict[str, str]]): Request headers.
+            timeout (Optional[float]): Socket timeout in seconds.
+
+        Returns:
+            Tuple[int, bytes]: Response status and body.
+        """
+
+        key = (scheme, host)
+        slot = self._get_slot(key)
+        if not slot.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No free connection to {host} after "
+                f"{self.acquire_timeout}s")
+
+        try:
+            conn, reused = self._checkout(key, timeout)
+            try:
+                try:
+                    status, body, will_close = self._send(
+                        conn, method, url, headers
+                    )
+                except STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    conn.close()
+                    self._count("reconnects")
+                    conn = self._connect(key, timeout)
+                    status, body, will_close = self._send(
+                        conn, method, url, headers
+                    )
+            except Exception:
+                conn.close()
+                raise
+
+            if will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+
+            return status, body
+        finally:
+            slot.release()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the pool counters.
+
+        Returns:
+            Dict[str, int]: Pool hits, misses, idle evictions, stale socket
+                reconnects and currently idle connections.
+        """
+
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = sum(len(conns) for conns in self._idle.values())
+
+        return stats
+
+    def close(self):
+        """Closes every idle connection in the pool."""
+
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn, _ in conns]
+            self._idle.clear()
+
+        for conn in idle:
+            conn.close()
+
+    def _get_slot(self, key: Tuple[str, str]) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self._slots[key]
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _connect(self,
+        key: Tuple[str, str], timeout: Optional[float]) -> http.client.HTTPConnection:
+        scheme, host = key
+        if scheme == "http":
+            return http.client.HTTPConnection(host, timeout=timeout)
+
+        return http.client.HTTPSConnection(host, timeout=timeout)
+
+    def _checkout(self,
+        key: Tuple[str, str], timeout: Optional[float]) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        expired = []
+        conn = None
+
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used > self.idle_timeout:
+                    expired.append(candidate)
+                    continue
+                conn = candidate
+                break
+
+            self._stats["evictions"] += len(expired)
+            self._stats["hits" if conn is not None else "misses"] += 1
+
+        for stale in expired:
+            stale.close()
+
+        if conn is None:
+            return self._connect(key, timeout), False
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+        return conn, True
+
+    def _checkin(self, key: Tuple[str, str], conn: http.client.HTTPConnection):
+        with self._lock:
+            self._idle.setdefault(key, []).append((conn, time.monotonic()))
+
+    def _send(self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[int, bytes, bool]:
+        conn.request(method, url, headers=headers or {})
+        res = conn.getresponse()
+        # The body must be drained before the socket can be reused
+        body = res.read()
+
+        return res.status, body, res.will_close
+
+_shared_pool: Optional[HTTPConnectionPool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_http_pool() -> HTTPConnectionPool:
+    """Returns the process-wide HTTP connection pool.
+
+    Returns:
+        HTTPConnectionPool: Pool shared by every pipeline in the process,
+            configured from HTTP_POOL_MAX_PER_HOST and HTTP_POOL_IDLE_TIMEOUT.
+    """
+
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = HTTPConnectionPool(
+                max_per_host=int(os.getenv("HTTP_POOL_MAX_PER_HOST", "8")),
+                idle_timeout=float(os.getenv("HTTP_POOL_IDLE_TIMEOUT", "60"))
+            )
+        return _shared_pool
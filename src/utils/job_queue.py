@@ -0,0 +1,383 @@
+import os
+import time
+import uuid
+import socket
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from redis import Redis
+from redis.exceptions import ResponseError
+
+from src.utils.cache_codec import CacheCodec, get_cache_codec
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+RETRYING = "retrying"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+class JobQueue:
+    """Redis stream backed queue of background jobs.
+
+    Jobs are delivered to workers through a consumer group. A job that is
+    not acknowledged within visibility_timeout seconds, because its worker
+    died, is claimed by the next worker to poll. Failed jobs are retried up
+    to max_attempts times in total. Each job's status, progress and result
+    are kept in a hash for result_ttl seconds after its last update.
+    """
+
+    def __init__(self,
+        redis_client: Redis,
+        name: str = "project_ideas",
+        visibility_timeout: int = 300,
+        max_attempts: int = 3,
+        result_ttl: int = 3600,
+        codec: Optional[CacheCodec] = None
+    ):
+        """Initialisation method for JobQueue.
+
+        Args:
+            redis_client (Redis): Client for the Redis server holding the
+                queue.
+            name (str): Prefix for the Redis keys of the queue.
+            visibility_timeout (int): Seconds a claimed job may go without
+                progress before another worker takes it over.
+            max_attempts (int): Attempts before a job is marked failed.
+            result_ttl (int): Seconds a job's status is kept after its last
+                update.
+            codec (Optional[CacheCodec]): Serialises payloads and results,
+                or None to use the process-wide codec.
+        """
+
+        self.redis_client = redis_client
+        self.name = name
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.result_ttl = result_ttl
+        self.codec = codec or get_cache_codec()
+
+        self.stream_key = f"{name}:stream"
+        self.group = f"{name}:workers"
+
+        self._group_ready = False
+
+    def enqueue(self, payload: Dict[str, Any]) -> str:
+        """Adds a job to the queue.
+
+        Args:
+            payload (Dict[str, Any]): Arguments for the job handler.
+
+        Returns:
+            str: ID of the job, for status.
+        """
+
+        self._ensure_group()
+
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self.redis_client.pipeline() as pipe:
+            pipe.hset(self._job_key(job_id), mapping={
+                "status": QUEUED,
+                "attempts": 0,
+                "payload": self.codec.encode(payload),
+                "created_at": now,
+                "updated_at": now
+            })
+            pipe.expire(self._job_key(job_id), self.result_ttl)
+            pipe.xadd(self.stream_key, {"job_id": job_id})
+            pipe.execute()
+
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Returns the status of a job.
+
+        Args:
+            job_id (str): ID returned by enqueue.
+
+        Returns:
+            Optional[Dict[str, Any]]: The status, attempts, progress and, once
+                finished, the result or error, or None if the job is unknown
+                or has expired.
+        """
+
+        fields = self.redis_client.hgetall(self._job_key(job_id))
+        if not fields:
+            return None
+
+        fields = {k.decode("utf-8"): v for k, v in fields.items()}
+        status = {
+            "job_id": job_id,
+            "status": fields["status"].decode("utf-8"),
+            "attempts": int(fields["attempts"]),
+            "created_at": float(fields["created_at"]),
+            "updated_at": float(fields["updated_at"])
+        }
+        if "progress" in fields:
+            status["progress"] = fields["progress"].decode("utf-8")
+        if "error" in fields:
+            status["error"] = fields["error"].decode("utf-8")
+        if "result" in fields:
+            status["result"] = self.codec.decode(fields["result"])
+
+        return status
+
+    def claim(self,
+        consumer: str, block_ms: int = 5000
+    ) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        """Claims the next job, preferring jobs abandoned by other workers.
+
+        Args:
+            consumer (str): Name of the claiming worker.
+            block_ms (int): Milliseconds to wait for a new job.
+
+        Returns:
+            Optional[Tuple[str, str, Dict[str, Any]]]: The stream message ID,
+                job ID and payload, or None if there was nothing to claim.
+        """
+
+        self._ensure_group()
+
+        messages = self.redis_client.xautoclaim(
+            self.stream_key,
+            self.group,
+            consumer,
+            min_idle_time=self.visibility_timeout * 1000,
+            start_id="0-0",
+            count=1
+        )[1]
+
+        if not messages:
+            streams = self.redis_client.xreadgroup(
+                self.group, consumer, {self.stream_key: ">"},
+                count=1, block=block_ms
+            )
+            messages = streams[0][1] if streams else []
+
+        if not messages:
+            return None
+
+        message_id, fields = messages[0]
+        message_id = message_id.decode("utf-8")
+        job_id = fields[b"job_id"].decode("utf-8")
+
+        job_key = self._job_key(job_id)
+        payload = self.redis_client.hget(job_key, "payload")
+
+        if payload is None:
+            # Status expired while the job sat in the queue, checked first
+            # so HINCRBY doesn't recreate it without a TTL
+            self._ack(message_id)
+            return None
+
+        attempts = self.redis_client.hincrby(job_key, "attempts", 1)
+
+        if attempts > self.max_attempts:
+            self._finish(message_id, job_id, FAILED,
+                {"error": "Worker stopped responding on every attempt"})
+            return None
+
+        self._update(job_id, {"status": RUNNING})
+
+        return message_id, job_id, self.codec.decode(payload)
+
+    def progress(self, message_id: str, job_id: str, consumer: str, stage: str):
+        """Records progress on a claimed job and extends its visibility.
+
+        Args:
+            message_id (str): Stream message ID returned by claim.
+            job_id (str): Job ID returned by claim.
+            consumer (str): Name of the worker holding the job.
+            stage (str): Description of the current stage.
+        """
+
+        # Re-claiming our own message resets its idle time
+        self.redis_client.xclaim(self.stream_key, self.group, consumer,
+            0, [message_id], justid=True)
+        self._update(job_id, {"progress": stage})
+
+    def complete(self, message_id: str, job_id: str, result: Dict[str, Any]):
+        """Marks a claimed job as succeeded.
+
+        Args:
+            message_id (str): Stream message ID returned by claim.
+            job_id (str): Job ID returned by claim.
+            result (Dict[str, Any]): Result of the job handler.
+        """
+
+        self._finish(message_id, job_id, SUCCEEDED,
+            {"result": self.codec.encode(result)})
+
+    def fail(self, message_id: str, job_id: str, error: str) -> bool:
+        """Records a failed attempt, requeueing the job if it has any left.
+
+        Args:
+            message_id (str): Stream message ID returned by claim.
+            job_id (str): Job ID returned by claim.
+            error (str): Description of the failure.
+
+        Returns:
+            bool: Whether the job was requeued.
+        """
+
+        attempts = int(self.redis_client.hget(self._job_key(job_id), "attempts") or 0)
+        if attempts >= self.max_attempts:
+            self._finish(message_id, job_id, FAILED, {"error": error})
+            return False
+
+        with self.redis_client.pipeline() as pipe:
+            pipe.xack(self.stream_key, self.group, message_id)
+            pipe.xdel(self.stream_key, message_id)
+            pipe.xadd(self.stream_key, {"job_id": job_id})
+            pipe.execute()
+        self._update(job_id, {"status": RETRYING, "error": error})
+
+        return True
+
+    def _finish(self,
+        message_id: str, job_id: str, status: str, fields: Dict[str, Any]):
+        self._update(job_id, {"status": status, **fields})
+        self._ack(message_id)
+
+    def _ack(self, message_id: str):
+        with self.redis_client.pipeline() as pipe:
+            pipe.xack(self.stream_key, self.group, message_id)
+            pipe.xdel(self.stream_key, message_id)
+            pipe.execute()
+
+    def _update(self, job_id: str, fields: Dict[str, Any]):
+        job_key = self._job_key(job_id)
+        with self.redis_client.pipeline() as pipe:
+            pipe.hset(job_key, mapping={**fields, "updated_at": time.time()})
+            pipe.expire(job_key, self.result_ttl)
+            pipe.execute()
+
+    def _ensure_group(self):
+        if self._group_ready:
+            return
+
+        try:
+            self.redis_client.xgroup_create(self.stream_key, self.group,
+                id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        self._group_ready = True
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.name}:job:{job_id}"
+
+class QueueWorker:
+    """Runs jobs from a JobQueue on a fixed number of threads.
+
+    The handler is called with the job payload and a progress callback, and
+    returns the job result. An exception fails the attempt.
+    """
+
+    def __init__(self,
+        queue: JobQueue,
+        handler: Callable[[Dict[str, Any], Callable[[str], None]], Dict[str, Any]],
+        concurrency: int = 4,
+        name: Optional[str] = None,
+        block_ms: int = 5000
+    ):
+        """Initialisation method for QueueWorker.
+
+        Args:
+            queue (JobQueue): Queue to take jobs from.
+            handler (Callable[[Dict[str, Any], Callable[[str], None]],
+                Dict[str, Any]]): Runs a job.
+            concurrency (int): Jobs run at once by this worker.
+            name (Optional[str]): Consumer name prefix, or None to use the
+                host name and process ID.
+            block_ms (int): Milliseconds each thread waits for a new job
+                before checking whether to stop.
+        """
+
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.block_ms = block_ms
+
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """Starts the worker threads."""
+
+        self._stopping.clear()
+        for idx in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._loop, args=(f"{self.name}:{idx}",), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stops the worker threads once their current jobs finish.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for each thread.
+        """
+
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_forever(self):
+        """Runs the worker until interrupted."""
+
+        self.start()
+        try:
+            while not self._stopping.wait(1):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def run_once(self, consumer: Optional[str] = None) -> bool:
+        """Claims and runs a single job on the calling thread.
+
+        Args:
+            consumer (Optional[str]): Consumer name, or None for the worker
+                name.
+
+        Returns:
+            bool: Whether a job was run.
+        """
+
+        consumer = consumer or self.name
+        claimed = self.queue.claim(consumer, self.block_ms)
+        if claimed is None:
+            return False
+
+        message_id, job_id, payload = claimed
+
+        def progress(stage: str):
+            self.queue.progress(message_id, job_id, consumer, stage)
+
+        try:
+            result = self.handler(payload, progress)
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            self.queue.fail(message_id, job_id, str(e))
+        else:
+            self.queue.complete(message_id, job_id, result)
+
+        return True
+
+    def _loop(self, consumer: str):
+        while not self._stopping.is_set():
+            try:
+                self.run_once(consumer)
+            except Exception:
+                # Keep polling through Redis outages
+                logger.exception("Worker %s could not claim a job", consumer)
+                self._stopping.wait(1)
@@ -0,0 +1,189 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from src.schemas.project_gen import PromptData
+from src.utils.text_normalisation import text_normalisation
+
+class _Entry:
+    """Cached LLM output along with the fingerprint it was generated for."""
+
+    def __init__(self, tokens: FrozenSet[str], value: Dict[str, Any]):
+        self.tokens = tokens
+        self.value = value
+        self.stored_at = time.monotonic()
+
+def prompt_fingerprint(prompt_data: PromptData) -> Tuple[str, FrozenSet[str]]:
+    """Builds an order-insensitive fingerprint of the prompt qualifications.
+
+    Every qualification is normalised, then the set of unique normalised
+    qualifications is sorted and hashed, so reordered or repeated listings
+    produce the same digest.
+
+    Args:
+        prompt_data (PromptData): Prompt data for the GPT model.
+
+    Returns:
+        Tuple[str, FrozenSet[str]]: Digest of the normalised qualifications
+            and the union of their tokens, used for near-hit lookups.
+    """
+
+    qualifications = set()
+    for job in prompt_data.root:
+        for qual in job.Qualifications or []:
+            norm_qual = text_normalisation(qual)
+            if norm_qual:
+                qualifications.add(" ".join(sorted(norm_qual)))
+
+    canonical = json.dumps(sorted(qualifications), separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    tokens = frozenset(tok for qual in qualifications for tok in qual.split(" "))
+
+    return digest, tokens
+
+class PromptCache:
+    """In-process LRU cache of generated project lists keyed by prompt.
+
+    Lookups first try the exact fingerprint digest, then fall back to the
+    cached entry whose qualification tokens have the highest Jaccard
+    similarity with the prompt, provided it reaches similarity_threshold.
+    Entries expire after ttl seconds and the least recently used entry is
+    evicted once max_entries is reached.
+    """
+
+    def __init__(self,
+        max_entries: int = 256,
+        ttl: float = 3600.0,
+        similarity_threshold: float = 0.9
+    ):
+        """Initialisation method for PromptCache.
+
+        Args:
+            max_entries (int): Maximum number of cached project lists.
+            ttl (float): Seconds a cached project list is served for.
+            similarity_threshold (float): Minimum Jaccard similarity between
+                qualification tokens for a near-hit, or 1.0 to only serve
+                exact hits.
+        """
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._stats = {"hits": 0, "near_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, prompt_data: PromptData) -> Optional[Dict[str, Any]]:
+        """Looks up a project list generated for the same or similar prompt.
+
+        Args:
+            prompt_data (PromptData): Prompt data for the GPT model.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached project list, or None on a
+                miss.
+        """
+
+        digest, tokens = prompt_fingerprint(prompt_data)
+        if not tokens:
+            return None
+
+        with self._lock:
+            self._evict_expired()
+
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self._stats["hits"] += 1
+                return entry.value
+
+            best_key, best_sim = None, 0.0
+            for key, entry in self._entries.items():
+                sim = len(tokens & entry.tokens) / len(tokens | entry.tokens)
+                if sim > best_sim:
+                    best_key, best_sim = key, sim
+
+            if best_key is not None and best_sim >= self.similarity_threshold:
+                self._entries.move_to_end(best_key)
+                self._stats["near_hits"] += 1
+                return self._entries[best_key].value
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, prompt_data: PromptData, value: Dict[str, Any]):
+        """Stores the project list generated for a prompt.
+
+        Args:
+            prompt_data (PromptData): Prompt data for the GPT model.
+            value (Dict[str, Any]): Generated project list.
+        """
+
+        digest, tokens = prompt_fingerprint(prompt_data)
+        if not tokens:
+            return
+
+        with self._lock:
+            self._entries[digest] = _Entry(tokens, value)
+            self._entries.move_to_end(digest)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the cache counters.
+
+        Returns:
+            Dict[str, Any]: Exact hits, near-hits, misses, evictions, the
+                current size and the overall hit rate.
+        """
+
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+
+        lookups = stats["hits"] + stats["near_hits"] + stats["misses"]
+        hits = stats["hits"] + stats["near_hits"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+
+        return stats
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        expired = [
+            key for key, entry in self._entries.items()
+            if now - entry.stored_at > self.ttl
+        ]
+        for key in expired:
+            del self._entries[key]
+        self._stats["evictions"] += len(expired)
+
+_shared_cache: Optional[PromptCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_prompt_cache() -> PromptCache:
+    """Returns the process-wide prompt cache.
+
+    Returns:
+        PromptCache: Cache shared by every ProjectGenApi in the process,
+            configured from PROMPT_CACHE_MAX_ENTRIES, PROMPT_CACHE_TTL and
+            PROMPT_CACHE_SIMILARITY.
+    """
+
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = PromptCache(
+                max_entries=int(os.getenv("PROMPT_CACHE_MAX_ENTRIES", "256")),
+                ttl=float(os.getenv("PROMPT_CACHE_TTL", "3600")),
+                similarity_threshold=float(
+                    os.getenv("PROMPT_CACHE_SIMILARITY", "0.9")
+                )
+            )
+        return _shared_cache
@@ -0,0 +1,146 @@
+from collections import Counter
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from src.schemas.project_gen import JobHighlights, PromptData
+from src.utils.text_normalisation import text_normalisation
+
+# Rough size of a GPT token in characters of English text
+CHARS_PER_TOKEN = 4
+
+# Quotes, commas and keys added around each value when serialised as JSON
+QUALIFICATION_OVERHEAD = 2
+DESCRIPTION_OVERHEAD = 8
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the number of GPT tokens in a string.
+
+    Args:
+        text (str): Input string of text.
+
+    Returns:
+        int: Estimated token count.
+    """
+
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def _truncate(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    cut = text[:max_chars]
+    return cut[: cut.rfind(" ")] if " " in cut else cut
+
+def _rank_qualifications(
+    prompt_data: PromptData
+) -> Tuple[List[str], Dict[str, Tuple[int, int, str]], Counter]:
+    first_seen: Dict[str, Tuple[int, int, str]] = {}
+    counts: Counter = Counter()
+
+    ordinal = 0
+    for idx, job in enumerate(prompt_data.root):
+        listing_keys = set()
+        for qual in job.Qualifications or []:
+            norm_qual = text_normalisation(qual)
+            if not norm_qual:
+                continue
+
+            key = " ".join(sorted(norm_qual))
+            if key in listing_keys:
+                continue
+
+            listing_keys.add(key)
+            counts[key] += 1
+            if key not in first_seen:
+                first_seen[key] = (idx, ordinal, qual.strip())
+                ordinal += 1
+
+    # Qualifications asked for by the most listings first, then by position
+    ranked = sorted(first_seen, key=lambda k: (-counts[k], first_seen[k][1]))
+
+    return ranked, first_seen, counts
+
+def compact_prompt_data(
+    prompt_data: PromptData,
+    token_budget: int,
+    max_description_tokens: int = 400
+) -> PromptData:
+    """Compacts prompt data to fit within a token budget.
+
+    Qualifications are deduplicated across listings using the normalised
+    token set, and kept in order of how many listings ask for them. The
+    remaining budget is spent on job descriptions, greedily picking the
+    description that covers the most not-yet-covered qualification tokens,
+    weighted by how often those tokens are asked for. The output only
+    depends on the input, so identical searches produce identical prompts.
+
+    Args:
+        prompt_data (PromptData): Prompt data for the GPT model.
+        token_budget (int): Maximum estimated tokens for the prompt data.
+        max_description_tokens (int): Maximum estimated tokens kept from a
+            single job description.
+
+    Returns:
+        PromptData: Compacted prompt data, without listings that have
+            nothing left to contribute.
+    """
+
+    ranked, first_seen, counts = _rank_qualifications(prompt_data)
+
+    used = 0
+    kept: Set[str] = set()
+    for key in ranked:
+        cost = estimate_tokens(first_seen[key][2]) + QUALIFICATION_OVERHEAD
+        if used + cost > token_budget:
+            continue
+        kept.add(key)
+        used += cost
+
+    weights: Counter = Counter()
+    for key in kept:
+        for tok in key.split(" "):
+            weights[tok] += counts[key]
+
+    candidates: Dict[int, Tuple[str, FrozenSet[str]]] = {}
+    for idx, job in enumerate(prompt_data.root):
+        if job.job_description:
+            description = _truncate(job.job_description.strip(),
+                max_description_tokens)
+            candidates[idx] = (description, frozenset(text_normalisation(description)))
+
+    covered: Set[str] = set()
+    descriptions: Dict[int, str] = {}
+    while candidates:
+        idx = max(
+            candidates,
+            key=lambda i: (sum(weights[t] for t in candidates[i][1] - covered), -i)
+        )
+        description, tokens = candidates.pop(idx)
+
+        if sum(weights[t] for t in tokens - covered) == 0:
+            break
+
+        cost = estimate_tokens(description) + DESCRIPTION_OVERHEAD
+        if used + cost > token_budget:
+            continue
+
+        descriptions[idx] = description
+        covered |= tokens
+        used += cost
+
+    listing_quals: Dict[int, List[Tuple[int, str]]] = {}
+    for key in kept:
+        idx, ordinal, qual = first_seen[key]
+        listing_quals.setdefault(idx, []).append((ordinal, qual))
+
+    compacted = []
+    for idx in range(len(prompt_data.root)):
+        quals = [qual for _, qual in sorted(listing_quals.get(idx, []))]
+        description = descriptions.get(idx)
+        if quals or description:
+            compacted.append(JobHighlights(
+                Qualifications=quals or None,
+                job_description=description
+            ))
+
+    return PromptData(root=compacted)
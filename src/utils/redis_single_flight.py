@@ -0,0 +1,362 @@
+import time
+import uuid
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager, suppress
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, Union
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError, WatchError
+
+class SingleFlightTimeout(Exception):
+    """Raised when a caller gives up waiting on another caller's result."""
+
+class RedisSingleFlight:
+    """Coalesces concurrent computations of the same Redis value.
+
+    The first caller to miss on a key takes a short-lived Redis lock,
+    computes the value and stores it. Every other caller, in any process,
+    polls for the stored value instead of computing it again. The holder
+    renews its lock every third of lock_ttl while it computes, so only a
+    holder that has died lets its lock expire, and the next waiter takes
+    over.
+    """
+
+    def __init__(self,
+        redis_client: Redis,
+        lock_ttl: int = 120,
+        wait_timeout: float = 90.0,
+        poll_interval: float = 0.25,
+        prefix: str = "in_flight"
+    ):
+        """Initialisation method for RedisSingleFlight.
+
+        Args:
+            redis_client (Redis): Client for the Redis server holding the
+                locks and results.
+            lock_ttl (int): Seconds before an abandoned lock expires.
+            wait_timeout (float): Seconds a waiting caller polls for the
+                result before giving up.
+            poll_interval (float): Seconds between polls.
+            prefix (str): Prefix for the Redis lock keys.
+        """
+
+        self.redis_client = redis_client
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.prefix = prefix
+
+    def run(self,
+        key: str, compute: Callable[[], bytes], ttl: int) -> bytes:
+        """Returns the value stored at key, computing it at most once.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            compute (Callable[[], bytes]): Computes the value on a miss.
+            ttl (int): Seconds the stored result lives for.
+
+        Returns:
+            bytes: The stored or freshly computed value, as stored.
+
+        Raises:
+            SingleFlightTimeout: If another caller is still computing the
+                value after wait_timeout seconds.
+        """
+
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            value = self.redis_client.get(key)
+            if value is not None:
+                return value
+
+            token = self.acquire(key)
+            if token is not None:
+                try:
+                    # The previous holder may have stored it since our read
+                    value = self.redis_client.get(key)
+                    if value is not None:
+                        return value
+
+                    with self.hold(key, token):
+                        value = compute()
+                    self.redis_client.set(key, value, ex=ttl)
+                    return value
+                finally:
+                    self.release(key, token)
+
+            if time.monotonic() >= deadline:
+                raise SingleFlightTimeout(
+                    f"{key} is still being computed by another request"
+                )
+            time.sleep(self.poll_interval)
+
+    def acquire(self, key: str) -> Optional[str]:
+        """Tries to become the caller computing the value stored at key.
+
+        Args:
+            key (str): Redis key the result is stored under.
+
+        Returns:
+            Optional[str]: Token to pass to release, or None if another 
+                caller is already computing the value.
+        """
+
+        token = uuid.uuid4().hex
+        lock_key = f"{self.prefix}:{key}"
+        if self.redis_client.set(lock_key, token, nx=True, ex=self.lock_ttl):
+            return token
+
+        return None
+
+    def renew(self, key: str, token: str) -> bool:
+        """Resets the expiry of the lock taken by acquire to lock_ttl.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            token (str): Token returned by acquire.
+
+        Returns:
+            bool: Whether the lock was still held, and so renewed.
+        """
+
+        lock_key = f"{self.prefix}:{key}"
+
+        with self.redis_client.pipeline() as pipe:
+            try:
+                pipe.watch(lock_key)
+                current = pipe.get(lock_key)
+                if current is not None and self._decode(current) == token:
+                    pipe.multi()
+                    pipe.expire(lock_key, self.lock_ttl)
+                    pipe.execute()
+                    return True
+            except WatchError:
+                pass
+
+        return False
+
+    @contextmanager
+    def hold(self, key: str, token: str) -> Iterator[None]:
+        """Keeps the lock taken by acquire from expiring while the block runs.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            token (str): Token returned by acquire.
+        """
+
+        stopped = threading.Event()
+
+        def keep_renewing():
+            while not stopped.wait(self.lock_ttl / 3):
+                try:
+                    if not self.renew(key, token):
+                        return
+                except RedisError:
+                    # Retried on the next interval, before the lock expires
+                    pass
+
+        thread = threading.Thread(target=keep_renewing, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+
+    def release(self, key: str, token: str):
+        """Releases the lock taken by acquire, if it is still held.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            token (str): Token returned by acquire.
+        """
+
+        lock_key = f"{self.prefix}:{key}"
+
+        # Only delete the lock if it is still ours, it may have expired
+        # and been taken by another caller in the meantime
+        with self.redis_client.pipeline() as pipe:
+            try:
+                pipe.watch(lock_key)
+                current = pipe.get(lock_key)
+                if current is not None and self._decode(current) == token:
+                    pipe.multi()
+                    pipe.delete(lock_key)
+                    pipe.execute()
+            except WatchError:
+                pass
+
+    def _decode(self, value: Union[bytes, str]) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+class AsyncRedisSingleFlight(RedisSingleFlight):
+    """Asynchronous variant of RedisSingleFlight for the ASGI app.
+
+    Uses the same lock keys as RedisSingleFlight, so callers in either app
+    coalesce onto the same computation.
+    """
+
+    def __init__(self,
+        redis_client: AsyncRedis,
+        lock_ttl: int = 120,
+        wait_timeout: float = 90.0,
+        poll_interval: float = 0.25,
+        prefix: str = "in_flight"
+    ):
+        """Initialisation method for AsyncRedisSingleFlight.
+
+        Args:
+            redis_client (AsyncRedis): Asyncio client for the Redis server
+                holding the locks and results.
+            lock_ttl (int): Seconds before an abandoned lock expires.
+            wait_timeout (float): Seconds a waiting caller polls for the
+                result before giving up.
+            poll_interval (float): Seconds between polls.
+            prefix (str): Prefix for the Redis lock keys.
+        """
+
+        super().__init__(redis_client, lock_ttl, wait_timeout, poll_interval, prefix)
+
+    async def run(self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        ttl: int
+    ) -> bytes:
+        """Returns the value stored at key, computing it at most once.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            compute (Callable[[], Awaitable[bytes]]): Computes the value on a
+                miss.
+            ttl (int): Seconds the stored result lives for.
+
+        Returns:
+            bytes: The stored or freshly computed value, as stored.
+
+        Raises:
+            SingleFlightTimeout: If another caller is still computing the
+                value after wait_timeout seconds.
+        """
+
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            value = await self.redis_client.get(key)
+            if value is not None:
+                return value
+
+            token = await self.acquire(key)
+            if token is not None:
+                try:
+                    # The previous holder may have stored it since our read
+                    value = await self.redis_client.get(key)
+                    if value is not None:
+                        return value
+
+                    async with self.hold(key, token):
+                        value = await compute()
+                    await self.redis_client.set(key, value, ex=ttl)
+                    return value
+                finally:
+                    await self.release(key, token)
+
+            if time.monotonic() >= deadline:
+                raise SingleFlightTimeout(
+                    f"{key} is still being computed by another request"
+                )
+            await asyncio.sleep(self.poll_interval)
+
+    async def acquire(self, key: str) -> Optional[str]:
+        """Tries to become the caller computing the value stored at key.
+
+        Args:
+            key (str): Redis key the result is stored under.
+
+        Returns:
+            Optional[str]: Token to pass to release, or None if another 
+                caller is already computing the value.
+        """
+
+        token = uuid.uuid4().hex
+        lock_key = f"{self.prefix}:{key}"
+        if await self.redis_client.set(lock_key, token, nx=True, ex=self.lock_ttl):
+            return token
+
+        return None
+
+    async def renew(self, key: str, token: str) -> bool:
+        """Resets the expiry of the lock taken by acquire to lock_ttl.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            token (str): Token returned by acquire.
+
+        Returns:
+            bool: Whether the lock was still held, and so renewed.
+        """
+
+        lock_key = f"{self.prefix}:{key}"
+
+        async with self.redis_client.pipeline() as pipe:
+            try:
+                await pipe.watch(lock_key)
+                current = await pipe.get(lock_key)
+                if current is not None and self._decode(current) == token:
+                    pipe.multi()
+                    pipe.expire(lock_key, self.lock_ttl)
+                    await pipe.execute()
+                    return True
+            except WatchError:
+                pass
+
+        return False
+
+    @asynccontextmanager
+    async def hold(self, key: str, token: str) -> AsyncIterator[None]:
+        """Keeps the lock taken by acquire from expiring while the block runs.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            token (str): Token returned by acquire.
+        """
+
+        async def keep_renewing():
+            while True:
+                await asyncio.sleep(self.lock_ttl / 3)
+                try:
+                    if not await self.renew(key, token):
+                        return
+                except RedisError:
+                    # Retried on the next interval, before the lock expires
+                    pass
+
+        task = asyncio.create_task(keep_renewing())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def release(self, key: str, token: str):
+        """Releases the lock taken by acquire, if it is still held.
+
+        Args:
+            key (str): Redis key the result is stored under.
+            token (str): Token returned by acquire.
+        """
+
+        lock_key = f"{self.prefix}:{key}"
+
+        async with self.redis_client.pipeline() as pipe:
+            try:
+                await pipe.watch(lock_key)
+                current = await pipe.get(lock_key)
+                if current is not None and self._decode(current) == token:
+                    pipe.multi()
+                    pipe.delete(lock_key)
+                    await pipe.execute()
+            except WatchError:
+                pass
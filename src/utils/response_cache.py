@@ -0,0 +1,305 @@
+import re
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+from src.utils.cache_codec import CacheCodec, get_cache_codec
+
+class _InFlight:
+    """Result slot shared by callers waiting on the same cache miss."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+def canonicalise_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Canonicalises query parameters so equivalent searches share a key.
+
+    Args:
+        params (Dict[str, Any]): Query parameters from
+            JobListingsApi.parse_params.
+
+    Returns:
+        Dict[str, Any]: Parameters with case and whitespace folded out of
+            string values.
+    """
+
+    canonical = {}
+    for key, value in params.items():
+        if isinstance(value, str):
+            value = re.sub(r"\s+", " ", value).strip().lower()
+        canonical[key] = value
+
+    return canonical
+
+class ResponseCache:
+    """Content-addressed Redis cache for upstream API responses.
+
+    Entries are keyed by a hash of the canonicalised request parameters.
+    An entry is fresh for its ttl, after which it is still served for
+    stale_ttl seconds while a single background refresh replaces it.
+    Concurrent misses on the same key within a process share one fetch.
+    """
+
+    def __init__(self,
+        redis_client: Redis,
+        ttl: int = 3600,
+        stale_ttl: int = 600,
+        prefix: str = "job_search_cache",
+        codec: Optional[CacheCodec] = None
+    ):
+        """Initialisation method for ResponseCache.
+
+        Args:
+            redis_client (Redis): Client for the Redis server holding entries.
+            ttl (int): Default seconds an entry is served as fresh.
+            stale_ttl (int): Seconds an expired entry may still be served
+                while it is refreshed.
+            prefix (str): Prefix for the Redis keys.
+            codec (Optional[CacheCodec]): Serialises entries, or None to use
+                the process-wide codec.
+        """
+
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.prefix = prefix
+        self.codec = codec or get_cache_codec()
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0}
+
+    def cache_key(self, params: Dict[str, Any]) -> str:
+        """Builds the Redis key for a set of query parameters.
+
+        Args:
+            params (Dict[str, Any]): Query parameters.
+
+        Returns:
+            str: Redis key addressed by the canonical parameter content.
+        """
+
+        canonical = json.dumps(
+            canonicalise_params(params),
+            sort_keys=True,
+            separators=(",", ":")
+        )
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+        return f"{self.prefix}:{digest}"
+
+    def get_or_fetch(self,
+        params: Dict[str, Any],
+        fetch: Callable[[], str],
+        ttl: Optional[int] = None
+    ) -> str:
+        """Returns the cached response for params, fetching it on a miss.
+
+        Args:
+            params (Dict[str, Any]): Query parameters addressing the entry.
+            fetch (Callable[[], str]): Retrieves the response from upstream.
+            ttl (Optional[int]): Seconds the entry is fresh for, or None to
+                use the cache default.
+
+        Returns:
+            str: The upstream response.
+        """
+
+        key = self.cache_key(params)
+        ttl = self.ttl if ttl is None else ttl
+
+        entry = self._read(key)
+        if entry is not None:
+            if time.time() - entry["stored_at"] < entry["ttl"]:
+                self._count("hits")
+            else:
+                self._count("stale_hits")
+                self._refresh_in_background(key, fetch, ttl)
+
+            return entry["value"]
+
+        self._count("misses")
+        return self._single_flight(key, fetch, ttl)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: Fresh hits, stale hits, misses and misses that
+                were coalesced onto another caller's fetch.
+        """
+
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.redis_client.get(key)
+        return self.codec.decode(raw) if raw is not None else None
+
+    def _write(self, key: str, value: str, ttl: int):
+        entry = {"stored_at": time.time(), "ttl": ttl, "value": value}
+        self.redis_client.set(key, self.codec.encode(entry), ex=ttl + self.stale_ttl)
+
+    def _single_flight(self,
+        key: str, fetch: Callable[[], str], ttl: int) -> str:
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _InFlight()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fetch()
+            self._write(key, call.value, ttl)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+        return call.value
+
+    def _refresh_in_background(self,
+        key: str, fetch: Callable[[], str], ttl: int):
+        with self._lock:
+            if key in self._in_flight:
+                return
+
+        def refresh():
+            try:
+                self._single_flight(key, fetch, ttl)
+            except Exception:
+                # The stale entry keeps being served until a refresh succeeds
+                pass
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+class AsyncResponseCache(ResponseCache):
+    """Asynchronous variant of ResponseCache for the ASGI app.
+
+    Entries use the same keys and format as ResponseCache, so both apps
+    share them. Concurrent misses on the same key within the event loop
+    share one fetch, and stale entries are refreshed in a background task.
+    """
+
+    def __init__(self,
+        redis_client: AsyncRedis,
+        ttl: int = 3600,
+        stale_ttl: int = 600,
+        prefix: str = "job_search_cache",
+        codec: Optional[CacheCodec] = None
+    ):
+        """Initialisation method for AsyncResponseCache.
+
+        Args:
+            redis_client (AsyncRedis): Asyncio client for the Redis server 
+                holding entries.
+            ttl (int): Default seconds an entry is served as fresh.
+            stale_ttl (int): Seconds an expired entry may still be served
+                while it is refreshed.
+            prefix (str): Prefix for the Redis keys.
+            codec (Optional[CacheCodec]): Serialises entries, or None to use
+                the process-wide codec.
+        """
+
+        super().__init__(redis_client, ttl, stale_ttl, prefix, codec)
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._refreshes: Set[asyncio.Task] = set()
+
+    async def get_or_fetch(self,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[str]],
+        ttl: Optional[int] = None
+    ) -> str:
+        """Returns the cached response for params, fetching it on a miss.
+
+        Args:
+            params (Dict[str, Any]): Query parameters addressing the entry.
+            fetch (Callable[[], Awaitable[str]]): Retrieves the response from
+                upstream.
+            ttl (Optional[int]): Seconds the entry is fresh for, or None to
+                use the cache default.
+
+        Returns:
+            str: The upstream response.
+        """
+
+        key = self.cache_key(params)
+        ttl = self.ttl if ttl is None else ttl
+
+        raw = await self.redis_client.get(key)
+        if raw is not None:
+            entry = self.codec.decode(raw)
+            if time.time() - entry["stored_at"] < entry["ttl"]:
+                self._count("hits")
+            elif key not in self._pending:
+                self._count("stale_hits")
+                task = asyncio.create_task(self._refresh(key, fetch, ttl))
+                # The event loop only keeps weak references to tasks
+                self._refreshes.add(task)
+                task.add_done_callback(self._refreshes.discard)
+            else:
+                self._count("stale_hits")
+
+            return entry["value"]
+
+        self._count("misses")
+        return await self._single_flight_async(key, fetch, ttl)
+
+    async def _single_flight_async(self,
+        key: str, fetch: Callable[[], Awaitable[str]], ttl: int) -> str:
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._count("coalesced")
+            return await asyncio.shield(pending)
+
+        pending = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await fetch()
+            entry = {"stored_at": time.time(), "ttl": ttl, "value": value}
+            await self.redis_client.set(key, self.codec.encode(entry),
+                ex=ttl + self.stale_ttl)
+            pending.set_result(value)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as e:
+            pending.set_exception(e)
+            # Mark retrieved so an unawaited failure isn't logged
+            pending.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+        return value
+
+    async def _refresh(self,
+        key: str, fetch: Callable[[], Awaitable[str]], ttl: int):
+        try:
+            await self._single_flight_async(key, fetch, ttl)
+        except Exception:
+            # The stale entry keeps being served until a refresh succeeds
+            pass
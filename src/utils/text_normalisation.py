@@ -1,5 +1,7 @@
+import os
 import re
-from typing import Set, List, Iterable
+from functools import lru_cache
+from typing import Set, List, Iterable, FrozenSet
 
 SPECIAL_TOKENS = {
     "c++":"cpp",
@@ -38,22 +40,47 @@ CANONICAL_PHRASES = [
     (r"\bazure\b", "azure"),
 ]
 
+# Chains where one canonical phrase produces the input of a later one,
+# resolved up front so the combined pattern needs a single pass
+_CHAINED_PHRASES = [
+    (r"\brestful\s+api(s)?\b", "rest_api"),
+]
+
+_SPECIAL_TOKENS_PATTERN = re.compile(
+    "|".join(re.escape(key) for key in SPECIAL_TOKENS)
+)
+
+# Every canonical phrase starts with a word boundary and a literal letter,
+# so the boundary is hoisted out of the alternation and positions that
+# cannot start a phrase are rejected by a single lookahead
+_CANONICAL_REPLACEMENTS = {}
+_canonical_groups = []
+_canonical_starts = set()
+for _idx, (_pattern, _repl) in enumerate(_CHAINED_PHRASES + CANONICAL_PHRASES):
+    _body = _pattern[len(r"\b"):]
+    _CANONICAL_REPLACEMENTS[f"p{_idx}"] = _repl
+    _canonical_groups.append(f"(?P<p{_idx}>{_body})")
+    _canonical_starts.add(_body[0])
+
+_CANONICAL_PATTERN = re.compile(
+    r"\b(?=[" + "".join(sorted(_canonical_starts)) + "])"
+    + "(?:" + "|".join(_canonical_groups) + ")"
+)
+
+_NON_TOKEN_PATTERN = re.compile(r"[^a-z0-9_\s]+")
+
 def _normalise_text(text: str) -> str:
     text = text.lower().strip()
 
-    for key, val in SPECIAL_TOKENS.items():
-        text = text.replace(key, val)
-    
-    for pattern, repl in CANONICAL_PHRASES:
-        text = re.sub(pattern, repl, text)
-    
+    text = _SPECIAL_TOKENS_PATTERN.sub(lambda m: SPECIAL_TOKENS[m.group()], text)
+    text = _CANONICAL_PATTERN.sub(
+        lambda m: _CANONICAL_REPLACEMENTS[m.lastgroup], text
+    )
+
     text = text.replace("&", " and ")
-    text = re.sub(r"[/\-]", " ", text)
+    text = _NON_TOKEN_PATTERN.sub(" ", text)
 
-    text = re.sub(r"[^a-z0-9_\s]", " ", text)
-    
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return " ".join(text.split())
 
 def _tokens(text: str) -> List[str]:
     return [t for t in text.split(" ") if t]
@@ -79,14 +106,18 @@ def _light_lemmatise(tokens: Iterable[str]) -> List[str]:
 def _add_ngrams(tokens: list[str], n: int) -> Set[str]:
     return {"_".join(tokens[i : i + n]) for i in range(len(tokens) - n + 1)} if len(tokens) >= n else set()
 
-def text_normalisation(text: str) -> Set[str]:
+@lru_cache(maxsize=int(os.getenv("TEXT_NORMALISATION_CACHE_SIZE", "65536")))
+def text_normalisation(text: str) -> FrozenSet[str]:
     """Normalisation pipeline.
 
+    Results are memoised, the same qualifications are normalised many
+    times per evidence run.
+
     Args:
         text (str): Input string of text.
     
     Returns:
-        Set[str]: Set of canonical tokens.
+        FrozenSet[str]: Set of canonical tokens.
     """
 
     text = _normalise_text(text)
@@ -100,4 +131,4 @@ def text_normalisation(text: str) -> Set[str]:
     token_set |= _add_ngrams(toks, 2)
     token_set |= _add_ngrams(toks, 3)
 
-    return token_set
+    return frozenset(token_set)
@@ -0,0 +1,217 @@
+import json
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Tuple
+from unittest import mock
+
+import fakeredis
+import pytest
+
+class StubServer:
+    """Local HTTP/1.1 server standing in for an upstream API.
+
+    Each test sets respond, which maps a request path to a status, a body
+    and a delay in seconds. The server records the paths it was sent and
+    the most requests it was handling at once.
+    """
+
+    def __init__(self):
+        self.respond: Callable[[str], Tuple[int, bytes, float]] = \
+            lambda path: (200, b"{}", 0)
+        self.close_after_response = False
+        self.paths: List[str] = []
+        self.max_in_flight = 0
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.paths.append(self.path)
+                    stub._in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub._in_flight)
+                try:
+                    status, body, delay = stub.respond(self.path)
+                    time.sleep(delay)
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                # Drops the kept-alive socket without telling the client
+                self.close_connection = stub.close_after_response
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.host = f"127.0.0.1:{self._server.server_address[1]}"
+        self.url = f"http://{self.host}"
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    yield server
+    server.close()
+
+@pytest.fixture(scope="session")
+def _api_app():
+    # The app builds its Redis client at import, so it is swapped for an
+    # in-memory one before the first import
+    server = fakeredis.FakeServer()
+    with mock.patch("redis.Redis", lambda *args, **kwargs: fakeredis.FakeRedis(server=server)):
+        import api.app
+
+    return api.app
+
+@pytest.fixture
+def api_app(_api_app):
+    """The api/app.py module on an empty in-memory Redis."""
+    _api_app.redis_client.flushall()
+    return _api_app
+
+class FakeHistoryDB:
+    """In-memory history table behind a psycopg2-like connection.
+
+    Cursors answer the queries in src/queries/general.py that the saved
+    data pipelines run, and record each query with its parameters. Named
+    cursors stand in for server-side ones, handing rows over itersize at a
+    time and recording the size of each fetch. Inserted rows only reach
+    rows on commit, and ids are allocated from a sequence, handed out in a
+    shuffled order as Postgres does not promise one.
+    """
+
+    closed = 0
+
+    def __init__(self):
+        # (id, title, parameters, project_list, evidence), as decoded by
+        # psycopg2 from the jsonb columns
+        self.rows: List[Tuple] = []
+        self.executed: List[Tuple[str, Tuple]] = []
+        self.fetches: List[int] = []
+        self.pending: List[Tuple] = []
+        # Rows committed or discarded by each commit and rollback
+        self.commits: List[int] = []
+        self.rollbacks: List[int] = []
+        self._next_id = 1
+
+    def add_rows(self, count: int) -> List[int]:
+        """Appends rows as SaveProjectData stores them, returning their ids."""
+        ids = self._allocate(count)
+        for id in ids:
+            self.rows.append((
+                id,
+                f"Data Scientist - London - Oct 2025 ({id})",
+                {
+                    "role": "Data Scientist",
+                    "country": "uk",
+                    "off_site": False,
+                    "locations": ["London"],
+                    "date_posted": "week",
+                    "employment_types": ["FULLTIME"]
+                },
+                {"projects": []},
+                []
+            ))
+        return ids
+
+    def cursor(self, name=None) -> "FakeHistoryCursor":
+        return FakeHistoryCursor(self, name)
+
+    def commit(self):
+        self.commits.append(len(self.pending))
+        self.rows.extend(self.pending)
+        self.pending = []
+
+    def rollback(self):
+        self.rollbacks.append(len(self.pending))
+        self.pending = []
+
+    def get_transaction_status(self) -> int:
+        from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+        return TRANSACTION_STATUS_IDLE
+
+    def _allocate(self, count: int) -> List[int]:
+        ids = list(range(self._next_id, self._next_id + count))
+        self._next_id += count
+        return ids
+
+class FakeHistoryCursor:
+
+    def __init__(self, db: FakeHistoryDB, name=None):
+        self.db = db
+        self.name = name
+        self.itersize = 2000
+        self._result: List[Tuple] = []
+
+    def execute(self, query: str, params: Tuple = ()):
+        from src.queries import general
+
+        self.db.executed.append((query, params))
+        newest_first = sorted(self.db.rows, key=lambda row: row[0], reverse=True)
+
+        if query == "SELECT 1":
+            self._result = [(1,)]
+        elif query is general.ALLOCATE_HISTORY_IDS:
+            (count,) = params
+            ids = self.db._allocate(count)
+            random.Random(count).shuffle(ids)
+            self._result = [(id,) for id in ids]
+        elif query is general.ADD_HISTORY_BULK:
+            self.db.pending.extend(
+                (id, title, *(json.loads(column) for column in columns))
+                for id, title, *columns in params
+            )
+        elif query is general.RETRIEVE_SAVED_SUMMARIES:
+            (limit,) = params
+            self._result = [row[:3] for row in newest_first][:limit]
+        elif query is general.RETRIEVE_SAVED_SUMMARIES_BEFORE:
+            before_id, limit = params
+            self._result = [row[:3] for row in newest_first if row[0] < before_id][:limit]
+        elif query is general.EXPORT_HISTORY:
+            self._result = newest_first[::-1]
+        else:
+            raise NotImplementedError(query)
+
+    def fetchall(self) -> List[Tuple]:
+        result, self._result = self._result, []
+        return result
+
+    def __iter__(self):
+        if self.name is None:
+            yield from self.fetchall()
+            return
+
+        while self._result:
+            batch, self._result = self._result[:self.itersize], self._result[self.itersize:]
+            self.db.fetches.append(len(batch))
+            yield from batch
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._result = []
+
+@pytest.fixture
+def history_db():
+    return FakeHistoryDB()
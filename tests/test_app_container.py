@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from src.utils import app_container
+from src.utils.app_container import AppContainer
+
+class FakeClient:
+    """Records when it is started and closed."""
+
+    def __init__(self, name: str, log: list):
+        self.name = name
+        self.log = log
+        log.append(("create", name))
+
+    def start(self):
+        self.log.append(("start", self.name))
+
+    def close(self):
+        self.log.append(("close", self.name))
+
+@pytest.fixture
+def log(monkeypatch):
+    log = []
+
+    def factory(name):
+        return lambda *args, **kwargs: FakeClient(name, log)
+
+    monkeypatch.setattr(app_container, "AzureOpenAI", factory("openai_client"))
+    monkeypatch.setattr(app_container.redis, "Redis", factory("redis_client"))
+    monkeypatch.setattr(app_container, "get_http_pool", factory("http_pool"))
+    monkeypatch.setattr(app_container.DatabasePool, "from_env", factory("db_pool"))
+    monkeypatch.setattr(app_container, "get_evidence_pool", factory("evidence_pool"))
+    return log
+
+CLIENTS = ["openai_client", "redis_client", "http_pool", "db_pool", "evidence_pool"]
+
+def test_startup_creates_each_client_once(log):
+    container = AppContainer()
+
+    container.startup()
+    instances = dict(container._instances)
+    container.startup()
+
+    assert [name for event, name in log if event == "create"] == CLIENTS
+    assert container._instances == instances
+    assert container.main_pipeline.get_openai_client() is instances["openai_client"]
+
+def test_shutdown_closes_in_reverse_order_once(log):
+    container = AppContainer()
+    container.startup()
+    log.clear()
+
+    container.shutdown()
+    container.shutdown()
+
+    assert log == [("close", name) for name in reversed(CLIENTS)]
+
+def test_shutdown_before_startup_closes_nothing(log):
+    container = AppContainer()
+
+    container.shutdown()
+
+    assert log == []
+
+def test_only_created_clients_are_closed(log):
+    container = AppContainer()
+    container.redis_client
+    container.db_pool
+
+    container.shutdown()
+
+    assert [entry for entry in log if entry[0] == "close"] == [
+        ("close", "db_pool"), ("close", "redis_client")
+    ]
+
+def test_clients_are_recreated_after_shutdown(log):
+    container = AppContainer()
+    container.startup()
+    first = container.redis_client
+
+    container.shutdown()
+    container.startup()
+
+    assert container.redis_client is not first
+    assert [name for event, name in log if event == "create"] == CLIENTS * 2
+
+def test_concurrent_first_use_creates_one_client(log, monkeypatch):
+    def slow_redis(*args, **kwargs):
+        # Widens the window between the lookup and the creation
+        time.sleep(0.05)
+        return FakeClient("redis_client", log)
+
+    monkeypatch.setattr(app_container.redis, "Redis", slow_redis)
+    container = AppContainer()
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def use():
+        barrier.wait()
+        seen.append(container.redis_client)
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in seen}) == 1
+    assert log.count(("create", "redis_client")) == 1
@@ -0,0 +1,93 @@
+import json
+
+import psycopg2
+import pytest
+
+from benchmarks.fixtures import make_ux_info
+from src.pipelines import bulk_save_project_data
+from src.pipelines.run import MainPipeline
+from src.queries.general import ADD_HISTORY_BULK, ALLOCATE_HISTORY_IDS
+from src.utils.db_pool import DatabasePool
+from src.utils.evidence_matcher import EvidenceMatcher
+
+class FakeConnectionPool:
+    """Stands in for ThreadedConnectionPool, always lending the same connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        pass
+
+    def closeall(self):
+        pass
+
+def execute_values(cur, sql, argslist, page_size=100):
+    # One statement per page, as psycopg2's execute_values sends them
+    for start in range(0, len(argslist), page_size):
+        cur.execute(sql, argslist[start:start + page_size])
+
+def make_saves(count: int) -> list:
+    saves = []
+    for seed in range(count):
+        ux_info = make_ux_info(2, seed=seed)
+        matcher = EvidenceMatcher(ux_info["project_list"]["projects"], ux_info["evidence"])
+        saves.append((ux_info, matcher.run().to_schema().model_dump(exclude_none=True)))
+    return saves
+
+@pytest.fixture
+def db_pool(history_db, monkeypatch):
+    monkeypatch.setattr(
+        "psycopg2.pool.ThreadedConnectionPool",
+        lambda minconn, maxconn, **kwargs: FakeConnectionPool(history_db)
+    )
+    monkeypatch.setattr(bulk_save_project_data, "execute_values", execute_values)
+    return DatabasePool()
+
+def save(db_pool, saves, batch_size=3):
+    return MainPipeline().save_project_data_bulk(saves, db_pool, batch_size)
+
+def test_ids_follow_the_order_of_saves(history_db, db_pool):
+    saves = make_saves(7)
+
+    ids = save(db_pool, saves)
+
+    # The sequence hands the ids back shuffled
+    assert ids == sorted(ids)
+    stored = {row[0]: row for row in history_db.rows}
+    for id, (ux_info, parsed_evidence) in zip(ids, saves):
+        assert stored[id][3] == ux_info["project_list"]
+        assert stored[id][4] == parsed_evidence
+
+def test_rows_are_batched_in_one_transaction(history_db, db_pool):
+    save(db_pool, make_saves(7), batch_size=3)
+
+    queries = [query for query, _ in history_db.executed if query != "SELECT 1"]
+    assert queries == [ALLOCATE_HISTORY_IDS] + [ADD_HISTORY_BULK] * 3
+    assert [len(params) for query, params in history_db.executed
+        if query is ADD_HISTORY_BULK] == [3, 3, 1]
+    # Every row lands in the same commit
+    assert [n for n in history_db.commits if n] == [7]
+    assert not any(history_db.rollbacks)
+
+def test_failed_batch_rolls_back_every_row(history_db, db_pool, monkeypatch):
+    def failing_execute_values(cur, sql, argslist, page_size=100):
+        cur.execute(sql, argslist[:page_size])
+        raise psycopg2.DataError("value too long")
+
+    monkeypatch.setattr(bulk_save_project_data, "execute_values", failing_execute_values)
+
+    with pytest.raises(psycopg2.DataError):
+        save(db_pool, make_saves(7))
+
+    # The first batch was sent, then discarded with the rest
+    assert [n for n in history_db.rollbacks if n] == [3]
+    assert not any(history_db.commits)
+    assert history_db.rows == []
+
+def test_nothing_to_save(history_db, db_pool):
+    assert save(db_pool, []) == []
+    assert history_db.rows == []
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from src.utils import cache_codec
+from src.utils.cache_codec import CacheCodec, MAGIC, FORMAT_ORJSON, FORMAT_ORJSON_ZLIB
+
+UX_INFO = {
+    "parameters": {"query": ["Data Engineer in London"], "country": "uk"},
+    "project_list": {"projects": [
+        {"title": f"Project {i}", "achieved_qualifications": ["Python", "SQL"] * 20}
+        for i in range(20)
+    ]}
+}
+
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+def test_round_trip(compression):
+    codec = CacheCodec(compression=compression)
+
+    assert codec.decode(codec.encode(UX_INFO)) == UX_INFO
+
+def test_small_values_are_not_compressed():
+    codec = CacheCodec(compression="zlib", min_compress_size=1024)
+
+    assert codec.encode({"a": 1})[:2] == MAGIC + bytes([FORMAT_ORJSON])
+    assert codec.encode(UX_INFO)[:2] == MAGIC + bytes([FORMAT_ORJSON_ZLIB])
+
+def test_reads_entries_of_another_compression():
+    encoded = CacheCodec(compression="zlib").encode(UX_INFO)
+
+    assert CacheCodec(compression="none").decode(encoded) == UX_INFO
+
+def test_reads_legacy_json_entries():
+    codec = CacheCodec()
+
+    assert codec.decode(json.dumps(UX_INFO).encode("utf-8")) == UX_INFO
+    assert codec.decode(json.dumps(UX_INFO)) == UX_INFO
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError):
+        CacheCodec().decode(MAGIC + bytes([99]) + b"{}")
+
+def test_unknown_compression_raises():
+    with pytest.raises(ValueError):
+        CacheCodec(compression="brotli")
+
+@pytest.mark.skipif(cache_codec.zstandard is None, reason="zstandard not installed")
+def test_zstd_round_trip():
+    codec = CacheCodec(compression="zstd")
+
+    assert codec.decode(codec.encode(UX_INFO)) == UX_INFO
@@ -0,0 +1,152 @@
+from typing import Any, Dict, List
+
+import pytest
+from thefuzz import fuzz
+
+from benchmarks.bench_evidence_records import legacy_run
+from benchmarks.fixtures import make_ux_info
+from src.pipelines.project_evidence import ProjectEvidence
+from src.schemas.project_evidence import Match
+from src.utils.evidence_matcher import EvidenceMatcher, MatchRecords
+from src.utils.text_normalisation import text_normalisation
+
+def reference_matches(
+    projects: List[Dict[str, Any]], evidence: List[Dict[str, Any]]
+) -> List[Match]:
+    """Scores every pair one at a time, as ProjectEvidence did originally."""
+
+    matches = []
+    for project in projects:
+        for listing in evidence:
+            for proj_q in project["achieved_qualifications"]:
+                for job_q in listing.get("Qualifications") or []:
+                    norm_achieve = text_normalisation(proj_q)
+                    norm_qual = text_normalisation(job_q)
+                    overlap = len(norm_achieve & norm_qual) / len(norm_achieve | norm_qual)
+                    fuzz_sim = fuzz.token_set_ratio(proj_q, job_q) / 100
+
+                    if 0.4 * overlap + 0.6 * fuzz_sim >= 0.40:
+                        matches.append(Match(
+                            project_title=project["title"],
+                            project_achievement=proj_q,
+                            job_title=listing["job_title"],
+                            company_name=listing["employer_name"],
+                            qualification=job_q
+                        ))
+
+    return list(dict.fromkeys(matches))
+
+@pytest.fixture(scope="module", params=[False, True], ids=["verbatim", "distinct"])
+def ux_info(request) -> Dict[str, Any]:
+    return make_ux_info(30, distinct_qualifications=request.param)
+
+def test_exhaustive_reproduces_the_reference(ux_info):
+    projects, evidence = ux_info["project_list"]["projects"], ux_info["evidence"]
+
+    matcher = EvidenceMatcher(projects, evidence, exhaustive=True)
+
+    assert matcher.run().to_schema().root == reference_matches(projects, evidence)
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_pruned_loses_few_matches(seed):
+    ux_info = make_ux_info(100, distinct_qualifications=True, seed=seed)
+    projects, evidence = ux_info["project_list"]["projects"], ux_info["evidence"]
+
+    exhaustive = EvidenceMatcher(projects, evidence, exhaustive=True).run().to_schema().root
+    pruned = EvidenceMatcher(projects, evidence).run().to_schema().root
+
+    # Pruning only drops matches, those sharing no token with the listing
+    kept = set(pruned)
+    assert kept <= set(exhaustive)
+    assert [m for m in exhaustive if m in kept] == pruned
+    assert len(pruned) >= 0.97 * len(exhaustive)
+
+def test_project_evidence_is_exhaustive_by_default(monkeypatch):
+    monkeypatch.delenv("EVIDENCE_EXHAUSTIVE", raising=False)
+
+    assert ProjectEvidence(make_ux_info(1)).exhaustive
+
+def test_records_match_the_schema_per_hit_path(ux_info):
+    matcher = EvidenceMatcher(ux_info["project_list"]["projects"], ux_info["evidence"])
+
+    assert matcher.run().to_schema().root == legacy_run(matcher).root
+
+def test_records_intern_each_string_once(ux_info):
+    records = EvidenceMatcher(
+        ux_info["project_list"]["projects"], ux_info["evidence"]
+    ).run()
+
+    assert len(records.strings) == len(set(records.strings))
+    assert len(records.records) == len(set(records.records))
+    assert all(0 <= idx < len(records.strings)
+        for record in records.records for idx in record)
+
+def test_dedupe_keeps_the_first_score():
+    records = MatchRecords(scored=True)
+    key = tuple(records.intern(text) for text in ("P", "A", "J", "C", "Q"))
+    other = tuple(records.intern(text) for text in ("P", "A", "J", "C", "R"))
+    records.records += [key, other, key]
+    records.scores += [0.9, 0.5, 0.7]
+
+    records.dedupe()
+
+    assert records.records == [key, other]
+    assert records.scores == [0.9, 0.5]
+    assert [match["score"] for match in records.to_dicts()] == [0.9, 0.5]
+
+@pytest.mark.parametrize("top_k", [None, 3])
+def test_dicts_match_the_dumped_schema(ux_info, top_k):
+    records = EvidenceMatcher(
+        ux_info["project_list"]["projects"], ux_info["evidence"], top_k=top_k
+    ).run()
+
+    assert records.to_dicts() == records.to_schema().model_dump(exclude_none=True)
+
+def brute_force_top_k(
+    projects: List[Dict[str, Any]],
+    evidence: List[Dict[str, Any]],
+    top_k: int,
+    exhaustive: bool
+) -> List[Dict[str, Any]]:
+    """Scores every candidate of each achievement, then sorts and slices."""
+
+    def ranked(achievement):
+        first_seen = {}
+        for listing_pos, listing in enumerate(evidence):
+            for qual_pos, qual in enumerate(listing.get("Qualifications") or []):
+                key = (listing["job_title"], listing["employer_name"], qual)
+                first_seen.setdefault(key, (listing_pos, qual_pos))
+
+        candidates = []
+        for key, position in first_seen.items():
+            norm_achieve = text_normalisation(achievement)
+            norm_qual = text_normalisation(key[2])
+            union = norm_achieve | norm_qual
+            overlap = len(norm_achieve & norm_qual) / len(union) if union else 0.0
+            if not exhaustive and overlap == 0:
+                continue
+
+            score = 0.4 * overlap + 0.6 * fuzz.token_set_ratio(achievement, key[2]) / 100
+            if score >= 0.40:
+                candidates.append((-score, position, key))
+
+        return sorted(candidates)[:top_k]
+
+    matches = {}
+    for project in projects:
+        for achievement in project["achieved_qualifications"]:
+            for neg_score, _, (job_title, company_name, qual) in ranked(achievement):
+                match = (project["title"], achievement, job_title, company_name, qual)
+                matches.setdefault(match, round(-neg_score, 4))
+
+    fields = ["project_title", "project_achievement", "job_title", "company_name", "qualification"]
+    return [{**dict(zip(fields, match)), "score": score} for match, score in matches.items()]
+
+@pytest.mark.parametrize("exhaustive", [False, True], ids=["pruned", "exhaustive"])
+@pytest.mark.parametrize("top_k", [1, 2, 5])
+def test_top_k_matches_a_brute_force_sort(ux_info, top_k, exhaustive):
+    projects, evidence = ux_info["project_list"]["projects"], ux_info["evidence"]
+
+    matcher = EvidenceMatcher(projects, evidence, exhaustive=exhaustive, top_k=top_k)
+
+    assert matcher.run().to_dicts() == brute_force_top_k(projects, evidence, top_k, exhaustive)
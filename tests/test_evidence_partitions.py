@@ -0,0 +1,116 @@
+import copy
+import random
+
+import fakeredis
+import pytest
+
+from benchmarks.fixtures import make_qualification, make_ux_info
+from src.utils.cache_codec import CacheCodec
+from src.utils.evidence_cache import EvidenceCache
+from src.utils.evidence_matcher import EvidenceMatcher
+from src.utils.evidence_partitions import EvidencePartitions, listing_hash
+
+MODES = [(False, None), (True, None), (False, 2), (True, 2)]
+MODE_IDS = ["pruned", "exhaustive", "pruned-top2", "exhaustive-top2"]
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+@pytest.fixture
+def ux_info():
+    return make_ux_info(20, distinct_qualifications=True)
+
+def partitions(redis_client) -> EvidencePartitions:
+    return EvidencePartitions(redis_client, codec=CacheCodec())
+
+def expected(ux_info, exhaustive, top_k) -> list:
+    return EvidenceMatcher(
+        ux_info["project_list"]["projects"], ux_info["evidence"],
+        exhaustive=exhaustive, top_k=top_k
+    ).run().to_dicts()
+
+def run(engine, ux_info, exhaustive, top_k) -> list:
+    return engine.run(
+        ux_info["project_list"]["projects"], ux_info["evidence"],
+        exhaustive=exhaustive, top_k=top_k
+    ).to_dicts()
+
+def stored_fields(redis_client, engine, ux_info, exhaustive, top_k) -> dict:
+    return {
+        project["title"]: redis_client.hgetall(engine.key(project, exhaustive, top_k))
+        for project in ux_info["project_list"]["projects"]
+    }
+
+@pytest.mark.parametrize("exhaustive, top_k", MODES, ids=MODE_IDS)
+def test_first_run_and_reuse_equal_the_matcher(redis_client, ux_info, exhaustive, top_k):
+    n_pairs = len(ux_info["project_list"]["projects"]) * len(ux_info["evidence"])
+
+    first = partitions(redis_client)
+    assert run(first, ux_info, exhaustive, top_k) == expected(ux_info, exhaustive, top_k)
+    assert first.stats() == {"reused": 0, "computed": n_pairs}
+
+    # A fresh engine, as in another process, only reads Redis
+    second = partitions(redis_client)
+    assert run(second, ux_info, exhaustive, top_k) == expected(ux_info, exhaustive, top_k)
+    assert second.stats() == {"reused": n_pairs, "computed": 0}
+
+@pytest.mark.parametrize("exhaustive, top_k", MODES, ids=MODE_IDS)
+def test_changed_listing_only_recomputes_its_field(redis_client, ux_info, exhaustive, top_k):
+    engine = partitions(redis_client)
+    run(engine, ux_info, exhaustive, top_k)
+    before = stored_fields(redis_client, engine, ux_info, exhaustive, top_k)
+
+    changed = copy.deepcopy(ux_info)
+    listing = changed["evidence"][7]
+    old_hash = listing_hash(listing)
+    listing["Qualifications"][0] = make_qualification(random.Random(1))
+    new_hash = listing_hash(listing).encode()
+
+    engine = partitions(redis_client)
+    assert run(engine, changed, exhaustive, top_k) == expected(changed, exhaustive, top_k)
+
+    n_projects = len(ux_info["project_list"]["projects"])
+    assert engine.stats()["computed"] == n_projects
+
+    after = stored_fields(redis_client, engine, changed, exhaustive, top_k)
+    for title, fields in after.items():
+        # Every other field is untouched, the old one is left to expire
+        # with the hash
+        assert set(fields) == set(before[title]) | {new_hash}
+        assert {k: v for k, v in fields.items() if k != new_hash} == before[title]
+        assert old_hash.encode() in fields
+
+def test_regenerated_project_only_recomputes_its_partitions(redis_client, ux_info):
+    engine = partitions(redis_client)
+    run(engine, ux_info, True, None)
+
+    changed = copy.deepcopy(ux_info)
+    changed["project_list"]["projects"][0]["title"] = "Regenerated project"
+
+    engine = partitions(redis_client)
+    assert run(engine, changed, True, None) == expected(changed, True, None)
+    assert engine.stats()["computed"] == len(ux_info["evidence"])
+
+def test_modes_do_not_share_partitions(redis_client, ux_info):
+    engine = partitions(redis_client)
+    for exhaustive, top_k in MODES:
+        assert run(engine, ux_info, exhaustive, top_k) == expected(ux_info, exhaustive, top_k)
+
+    project = ux_info["project_list"]["projects"][0]
+    keys = {engine.key(project, exhaustive, top_k) for exhaustive, top_k in MODES}
+    assert len(keys) == len(MODES)
+    assert engine.stats()["reused"] == 0
+
+def test_evidence_cache_is_keyed_by_mode(redis_client, ux_info):
+    redis_client.set("ux_info:search", b"{}", ex=600)
+    pruned = EvidenceCache(redis_client, codec=CacheCodec(), exhaustive=False)
+    exhaustive = EvidenceCache(redis_client, codec=CacheCodec(), exhaustive=True)
+    ranked = EvidenceCache(redis_client, codec=CacheCodec(), exhaustive=True, top_k=5)
+
+    pruned.put("ux_info:search", ux_info, [{"project_title": "Pruned"}])
+
+    assert pruned.get("ux_info:search", ux_info) == [{"project_title": "Pruned"}]
+    assert exhaustive.get("ux_info:search", ux_info) is None
+    assert ranked.get("ux_info:search", ux_info) is None
+    assert 0 < redis_client.ttl(pruned.key("ux_info:search", ux_info)) <= 600
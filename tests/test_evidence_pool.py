@@ -0,0 +1,67 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from benchmarks.fixtures import make_ux_info
+from src.utils.evidence_matcher import EvidenceMatcher
+from src.utils.evidence_pool import EvidencePool
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = EvidencePool(workers=2, min_pairs=0, preload=["src.utils.evidence_matcher"])
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="module")
+def ux_info():
+    return make_ux_info(40, distinct_qualifications=True)
+
+def matcher(ux_info, **kwargs) -> EvidenceMatcher:
+    return EvidenceMatcher(ux_info["project_list"]["projects"], ux_info["evidence"], **kwargs)
+
+@pytest.mark.parametrize("exhaustive", [False, True], ids=["pruned", "exhaustive"])
+def test_pool_scores_equal_serial_scores(pool, ux_info, exhaustive):
+    serial = matcher(ux_info, exhaustive=exhaustive).score_matrix()
+    parallel = matcher(ux_info, exhaustive=exhaustive, pool=pool).score_matrix()
+
+    assert np.array_equal(parallel, serial)
+
+@pytest.mark.parametrize("exhaustive", [False, True], ids=["pruned", "exhaustive"])
+@pytest.mark.parametrize("top_k", [1, 2, 5])
+def test_pool_ranking_equals_serial_ranking(pool, ux_info, top_k, exhaustive):
+    serial = matcher(ux_info, exhaustive=exhaustive, top_k=top_k).run()
+    parallel = matcher(ux_info, exhaustive=exhaustive, top_k=top_k, pool=pool).run()
+
+    assert parallel.to_dicts() == serial.to_dicts()
+
+def test_small_work_stays_serial(ux_info, monkeypatch):
+    pool = EvidencePool(workers=2, min_pairs=10 ** 9)
+    monkeypatch.setattr(pool, "map", lambda *args: pytest.fail("pool used"))
+
+    matcher(ux_info, pool=pool).score_matrix()
+    matcher(ux_info, top_k=2, pool=pool).run()
+
+def test_broken_pool_falls_back_to_serial(pool, ux_info, monkeypatch, caplog):
+    def broken_map(*args):
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(pool, "map", broken_map)
+
+    assert np.array_equal(
+        matcher(ux_info, pool=pool).score_matrix(),
+        matcher(ux_info).score_matrix()
+    )
+    assert matcher(ux_info, top_k=2, pool=pool).run().to_dicts() == \
+        matcher(ux_info, top_k=2).run().to_dicts()
+    assert "Evidence pool broke" in caplog.text
+
+def test_pool_recovers_after_a_worker_dies(pool, ux_info):
+    # A worker exiting mid-task breaks the whole executor
+    with pytest.raises(BrokenProcessPool):
+        pool.map(os._exit, [1])
+
+    parallel = matcher(ux_info, pool=pool).score_matrix()
+
+    assert np.array_equal(parallel, matcher(ux_info).score_matrix())
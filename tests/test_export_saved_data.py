@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+
+import pytest
+
+from benchmarks.fixtures import make_ux_info
+from src.pipelines.export_saved_data import CSV_COLUMNS, ExportSavedData
+from src.pipelines.save_project_data import SaveProjectData
+from src.utils.evidence_matcher import EvidenceMatcher
+
+def saved_row(id: int, top_k=None) -> tuple:
+    """A history row as /api/save stores it, decoded from jsonb."""
+    ux_info = make_ux_info(3, seed=id)
+    matcher = EvidenceMatcher(
+        ux_info["project_list"]["projects"], ux_info["evidence"], top_k=top_k
+    )
+    parsed_evidence = matcher.run().to_schema().model_dump(exclude_none=True)
+
+    title, *columns = SaveProjectData(ux_info, parsed_evidence, None, None).build_row()
+    return (id, title, *(json.loads(column) for column in columns))
+
+@pytest.fixture
+def history_db(history_db):
+    history_db.rows = [saved_row(1), saved_row(2, top_k=2)]
+    return history_db
+
+def export(history_db, output_format: str, itersize: int = 500) -> str:
+    return "".join(ExportSavedData(history_db, output_format, itersize).run())
+
+def test_ndjson_round_trips_saved_rows(history_db):
+    lines = export(history_db, "ndjson").splitlines()
+
+    exported = [json.loads(line) for line in lines]
+    assert exported == [dict(zip(CSV_COLUMNS, row)) for row in history_db.rows]
+
+def test_csv_round_trips_saved_rows(history_db):
+    header, *rows = csv.reader(io.StringIO(export(history_db, "csv")))
+
+    assert header == CSV_COLUMNS
+    exported = [
+        (int(id), title, *(json.loads(column) for column in columns))
+        for id, title, *columns in rows
+    ]
+    assert exported == history_db.rows
+
+def test_evidence_keeps_every_match_field(history_db):
+    ranked = json.loads(export(history_db, "ndjson").splitlines()[1])["evidence"]
+
+    assert ranked
+    assert set(ranked[0]) == {
+        "project_title", "project_achievement", "job_title",
+        "company_name", "qualification", "score"
+    }
+
+def test_rows_stream_through_a_named_cursor(history_db):
+    history_db.rows = [saved_row(id) for id in (3, 1, 4, 2, 5)]
+
+    lines = ExportSavedData(history_db, "ndjson", itersize=2).run()
+    first = next(lines)
+
+    # Only the first batch has been fetched when the first line is out
+    assert history_db.fetches == [2]
+    ids = [json.loads(line)["id"] for line in [first, *lines]]
+    assert ids == [1, 2, 3, 4, 5]
+    assert history_db.fetches == [2, 2, 1]
+
+def test_unsupported_format_is_rejected(history_db):
+    with pytest.raises(ValueError):
+        ExportSavedData(history_db, "xml")
@@ -0,0 +1,56 @@
+import pytest
+
+from src.pipelines.fetch_saved_data import FetchSavedData
+from src.queries.general import RETRIEVE_SAVED_SUMMARIES, RETRIEVE_SAVED_SUMMARIES_BEFORE
+
+def fetch(history_db, before_id=None, limit=3):
+    return FetchSavedData(history_db, history_db.cursor(), before_id, limit).run()
+
+def test_first_page_reads_one_row_past_the_limit(history_db):
+    ids = history_db.add_rows(5)
+
+    page = fetch(history_db)
+
+    assert history_db.executed == [(RETRIEVE_SAVED_SUMMARIES, (4,))]
+    assert [item.id for item in page.items] == ids[::-1][:3]
+    assert page.next_cursor == ids[2]
+
+def test_next_page_starts_below_the_cursor(history_db):
+    ids = history_db.add_rows(5)
+
+    page = fetch(history_db, before_id=ids[2])
+
+    assert history_db.executed == [(RETRIEVE_SAVED_SUMMARIES_BEFORE, (ids[2], 4))]
+    assert [item.id for item in page.items] == ids[1::-1]
+    assert page.next_cursor is None
+
+@pytest.mark.parametrize("rows, next_cursor", [(3, None), (4, 2)])
+def test_next_cursor_only_when_a_row_is_left(history_db, rows, next_cursor):
+    history_db.add_rows(rows)
+
+    page = fetch(history_db, limit=3)
+
+    assert len(page.items) == 3
+    assert page.next_cursor == next_cursor
+
+def test_empty_history(history_db):
+    page = fetch(history_db)
+
+    assert page.items == []
+    assert page.next_cursor is None
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7, 10])
+def test_pages_cover_every_row_once(history_db, limit):
+    ids = history_db.add_rows(7)
+    # Gaps left by deleted rows
+    history_db.rows = [row for row in history_db.rows if row[0] not in (2, 5)]
+
+    seen, cursor = [], None
+    while True:
+        page = fetch(history_db, before_id=cursor, limit=limit)
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [id for id in ids[::-1] if id not in (2, 5)]
@@ -0,0 +1,65 @@
+import time
+import threading
+
+import pytest
+
+from src.utils.http_pool import HTTPConnectionPool
+
+def test_reuses_kept_alive_connections(stub_server):
+    pool = HTTPConnectionPool()
+
+    for _ in range(3):
+        assert pool.request("http", stub_server.host, "GET", "/") == (200, b"{}")
+
+    stats = pool.stats()
+    assert (stats["misses"], stats["hits"], stats["idle"]) == (1, 2, 1)
+
+def test_retries_a_stale_connection_once(stub_server):
+    pool = HTTPConnectionPool()
+    # The server drops each socket after answering, so the pooled one is stale
+    stub_server.close_after_response = True
+
+    assert pool.request("http", stub_server.host, "GET", "/first")[0] == 200
+    assert pool.request("http", stub_server.host, "GET", "/second")[0] == 200
+
+    assert pool.stats()["reconnects"] == 1
+    assert stub_server.paths == ["/first", "/second"]
+
+def test_caps_connections_per_host(stub_server):
+    pool = HTTPConnectionPool(max_per_host=2)
+    stub_server.respond = lambda path: (200, b"{}", 0.1)
+
+    threads = [
+        threading.Thread(target=pool.request, args=("http", stub_server.host, "GET", "/"))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(stub_server.paths) == 6
+    assert stub_server.max_in_flight == 2
+    assert pool.stats()["idle"] <= 2
+
+def test_gives_up_waiting_for_a_connection_slot(stub_server):
+    pool = HTTPConnectionPool(max_per_host=1, acquire_timeout=0.1)
+    stub_server.respond = lambda path: (200, b"{}", 0.5)
+
+    holder = threading.Thread(target=pool.request, args=("http", stub_server.host, "GET", "/"))
+    holder.start()
+    while not stub_server.paths:
+        time.sleep(0.01)
+
+    with pytest.raises(TimeoutError):
+        pool.request("http", stub_server.host, "GET", "/")
+    holder.join()
+
+def test_evicts_idle_connections(stub_server):
+    pool = HTTPConnectionPool(idle_timeout=0)
+
+    pool.request("http", stub_server.host, "GET", "/")
+    pool.request("http", stub_server.host, "GET", "/")
+
+    stats = pool.stats()
+    assert (stats["evictions"], stats["hits"], stats["misses"]) == (1, 0, 2)
@@ -0,0 +1,127 @@
+import json
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from benchmarks.bench_job_listing_parse import legacy_parse_job_listing
+from benchmarks.fixtures import make_raw_job_listings
+from src.pipelines.job_listings_api import JobListingsApi
+from src.utils.http_pool import HTTPConnectionPool, HTTPStatusError
+
+LOCATIONS = ["London", "Leeds", "Bristol", "York"]
+
+def listing_for(path: str) -> bytes:
+    # One listing per query, titled with the query it answers
+    query = parse_qs(urlsplit(path).query)["query"][0]
+    return json.dumps({"data": [{"job_id": query, "job_title": query}]}).encode()
+
+def build_api(stub_server, monkeypatch, **env) -> JobListingsApi:
+    monkeypatch.setenv("OPEN_WEB_NINJA_URL", stub_server.url)
+    monkeypatch.setenv("OPEN_WEB_NINJA_API_KEY", "test-key")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    api = JobListingsApi("Data", LOCATIONS, None, None, [])
+    api.http_pool = HTTPConnectionPool()
+
+    return api
+
+def titles(responses) -> list:
+    return [listing.root[0].job_title for listing in responses.job_listings]
+
+def test_results_stay_in_input_order(stub_server, monkeypatch):
+    # Earlier queries answer last
+    delays = {f"Data roles in {loc}.": 0.05 * (len(LOCATIONS) - i)
+        for i, loc in enumerate(LOCATIONS)}
+    stub_server.respond = lambda path: (
+        200, listing_for(path), delays[parse_qs(urlsplit(path).query)["query"][0]]
+    )
+
+    api = build_api(stub_server, monkeypatch, JOB_LISTINGS_MAX_IN_FLIGHT="4")
+    responses = api.run()
+
+    assert titles(responses) == [f"Data roles in {loc}." for loc in LOCATIONS]
+    assert responses.parameters.query == titles(responses)
+    assert stub_server.max_in_flight > 1
+
+def test_max_in_flight_is_respected(stub_server, monkeypatch):
+    stub_server.respond = lambda path: (200, listing_for(path), 0.1)
+
+    api = build_api(stub_server, monkeypatch, JOB_LISTINGS_MAX_IN_FLIGHT="2")
+    api.run()
+
+    assert len(stub_server.paths) == len(LOCATIONS)
+    assert stub_server.max_in_flight == 2
+
+def test_timeout_fires(stub_server, monkeypatch):
+    stub_server.respond = lambda path: (200, listing_for(path), 1)
+
+    api = build_api(stub_server, monkeypatch, JOB_LISTINGS_TIMEOUT="0.2")
+
+    with pytest.raises(TimeoutError):
+        api.run()
+
+def test_non_2xx_raises(stub_server, monkeypatch):
+    stub_server.respond = lambda path: (503, b'{"message": "busy"}', 0)
+
+    api = build_api(stub_server, monkeypatch)
+
+    with pytest.raises(HTTPStatusError) as error:
+        api.run()
+    assert error.value.status == 503
+
+def test_async_results_stay_in_input_order(stub_server, monkeypatch):
+    delays = {f"Data roles in {loc}.": 0.05 * (len(LOCATIONS) - i)
+        for i, loc in enumerate(LOCATIONS)}
+    stub_server.respond = lambda path: (
+        200, listing_for(path), delays[parse_qs(urlsplit(path).query)["query"][0]]
+    )
+
+    api = build_api(stub_server, monkeypatch, JOB_LISTINGS_MAX_IN_FLIGHT="2")
+
+    async def main():
+        async with httpx.AsyncClient() as client:
+            return await api.run_async(client)
+
+    responses = asyncio.run(main())
+
+    assert titles(responses) == [f"Data roles in {loc}." for loc in LOCATIONS]
+    assert stub_server.max_in_flight == 2
+
+def test_async_non_2xx_raises(stub_server, monkeypatch):
+    stub_server.respond = lambda path: (500, b"{}", 0)
+
+    api = build_api(stub_server, monkeypatch)
+
+    async def main():
+        async with httpx.AsyncClient() as client:
+            return await api.run_async(client)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+
+def sparse_listing(idx: int) -> dict:
+    # Fields the upstream API leaves out or sends as null
+    listing = make_raw_job_listings(1, seed=idx)[0]
+    listing.update(job_salary=None, job_benefits=None, job_is_remote=None)
+    listing["apply_options"] = [{"publisher": "Indeed"}]
+    listing["job_highlights"] = {"Qualifications": ["Python"]}
+    listing["unknown_field"] = {"nested": True}
+    del listing["job_city"]
+    return listing
+
+@pytest.mark.parametrize("listings", [
+    make_raw_job_listings(50),
+    [sparse_listing(idx) for idx in range(5)],
+    []
+], ids=["fixtures", "sparse", "empty"])
+def test_json_parser_matches_the_original(listings):
+    raw = json.dumps({"data": listings})
+    api = JobListingsApi("Data", LOCATIONS, None, None, [])
+
+    parsed = api.parse_job_listing_json(raw)
+
+    assert [job.model_dump() for job in parsed] == \
+        [job.model_dump() for job in legacy_parse_job_listing(json.loads(raw))]
@@ -0,0 +1,122 @@
+import time
+
+import fakeredis
+import pytest
+
+from src.utils.cache_codec import CacheCodec
+from src.utils.job_queue import (
+    FAILED,
+    QUEUED,
+    RETRYING,
+    RUNNING,
+    SUCCEEDED,
+    JobQueue,
+    QueueWorker
+)
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+def make_queue(redis_client, **kwargs) -> JobQueue:
+    return JobQueue(redis_client, codec=CacheCodec(), **kwargs)
+
+def pending(queue: JobQueue) -> int:
+    return queue.redis_client.xpending(queue.stream_key, queue.group)["pending"]
+
+def test_enqueue_claim_complete(redis_client):
+    queue = make_queue(redis_client)
+
+    job_id = queue.enqueue({"job_search_id": "search"})
+    assert queue.status(job_id)["status"] == QUEUED
+    assert queue.status(job_id)["attempts"] == 0
+
+    message_id, claimed_id, payload = queue.claim("worker-1", block_ms=10)
+    assert (claimed_id, payload) == (job_id, {"job_search_id": "search"})
+    assert queue.status(job_id)["status"] == RUNNING
+    assert queue.status(job_id)["attempts"] == 1
+
+    queue.progress(message_id, job_id, "worker-1", "generating")
+    assert queue.status(job_id)["progress"] == "generating"
+
+    queue.complete(message_id, job_id, {"id": "ux_info:search"})
+    status = queue.status(job_id)
+    assert status["status"] == SUCCEEDED
+    assert status["result"] == {"id": "ux_info:search"}
+
+    # Acknowledged and removed from the stream
+    assert pending(queue) == 0
+    assert redis_client.xlen(queue.stream_key) == 0
+    assert queue.claim("worker-1", block_ms=10) is None
+
+def test_failed_job_is_retried_until_max_attempts(redis_client):
+    queue = make_queue(redis_client, max_attempts=3)
+    calls = []
+
+    def handler(payload, progress):
+        calls.append(payload)
+        raise RuntimeError(f"attempt {len(calls)} failed")
+
+    worker = QueueWorker(queue, handler, name="worker", block_ms=10)
+    job_id = queue.enqueue({"job_search_id": "search"})
+
+    for attempt in (1, 2):
+        assert worker.run_once()
+        status = queue.status(job_id)
+        assert (status["status"], status["attempts"]) == (RETRYING, attempt)
+        assert status["error"] == f"attempt {attempt} failed"
+
+    assert worker.run_once()
+    status = queue.status(job_id)
+    assert (status["status"], status["attempts"]) == (FAILED, 3)
+    assert status["error"] == "attempt 3 failed"
+
+    assert len(calls) == 3
+    assert not worker.run_once()
+    assert redis_client.xlen(queue.stream_key) == 0
+
+def test_job_of_a_dead_worker_is_reclaimed(redis_client):
+    queue = make_queue(redis_client, visibility_timeout=1)
+    job_id = queue.enqueue({"job_search_id": "search"})
+
+    # The first worker claims the job and dies without acknowledging it
+    message_id, _, _ = queue.claim("dead-worker", block_ms=10)
+
+    # Still within the visibility timeout
+    assert queue.claim("live-worker", block_ms=10) is None
+
+    time.sleep(1.1)
+
+    reclaimed_message_id, reclaimed_id, _ = queue.claim("live-worker", block_ms=10)
+    assert (reclaimed_message_id, reclaimed_id) == (message_id, job_id)
+    assert queue.status(job_id)["attempts"] == 2
+
+    consumers = redis_client.xpending_range(
+        queue.stream_key, queue.group, min="-", max="+", count=10
+    )
+    assert [c["consumer"] for c in consumers] == [b"live-worker"]
+
+    queue.complete(reclaimed_message_id, job_id, {"id": "ux_info:search"})
+    assert queue.status(job_id)["status"] == SUCCEEDED
+
+def test_job_is_failed_once_every_worker_died(redis_client):
+    queue = make_queue(redis_client, visibility_timeout=0, max_attempts=2)
+    job_id = queue.enqueue({"job_search_id": "search"})
+
+    queue.claim("worker-1", block_ms=10)
+    queue.claim("worker-2", block_ms=10)
+
+    assert queue.claim("worker-3", block_ms=10) is None
+    status = queue.status(job_id)
+    assert status["status"] == FAILED
+    assert status["error"] == "Worker stopped responding on every attempt"
+    assert pending(queue) == 0
+
+def test_expired_job_is_dropped(redis_client):
+    queue = make_queue(redis_client)
+    job_id = queue.enqueue({"job_search_id": "search"})
+    redis_client.delete(queue._job_key(job_id))
+
+    assert queue.claim("worker-1", block_ms=10) is None
+    assert queue.status(job_id) is None
+    assert redis_client.xlen(queue.stream_key) == 0
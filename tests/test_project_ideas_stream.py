@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from src.schemas.base import Parameters
+from src.schemas.project_gen import GeneratedProject, ProjectList, UxInformation
+
+PROJECTS = [
+    GeneratedProject(
+        title=f"Project {i}",
+        problem_statement="Problem",
+        target_users=["Users"],
+        core_features=["Feature"],
+        recommended_tech_stack=["Python"],
+        achieved_qualifications=["Python"]
+    )
+    for i in range(3)
+]
+
+class StubPipeline:
+    """Yields the projects one at a time, then the assembled ux_info."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def project_idea_generation_stream(self, job_listings):
+        self.calls += 1
+        yield from PROJECTS
+        yield UxInformation(
+            parameters=Parameters(query=["Data roles in London."], country="uk"),
+            project_list=ProjectList(projects=PROJECTS),
+            evidence=[]
+        )
+
+def parse_events(body: bytes) -> list:
+    events = []
+    for block in body.decode("utf-8").strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append((event[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+@pytest.fixture
+def pipeline(api_app, monkeypatch):
+    stub = StubPipeline()
+    monkeypatch.setitem(api_app.container._instances, "main_pipeline", stub)
+    api_app.redis_client.set("search", api_app.cache_codec.encode({"job_listings": []}))
+    return stub
+
+def stream(api_app) -> list:
+    response = api_app.app.test_client().post(
+        "/api/project-ideas/stream", json={"job_search_id": "search"}
+    )
+    assert response.mimetype == "text/event-stream"
+    return parse_events(response.data)
+
+def test_projects_then_done(api_app, pipeline):
+    events = stream(api_app)
+
+    assert [event for event, _ in events] == ["project"] * len(PROJECTS) + ["done"]
+    assert [data["title"] for _, data in events[:-1]] == [p.title for p in PROJECTS]
+
+    done = events[-1][1]
+    assert done["id"] == "ux_info:search"
+    assert done["data"]["project_list"]["projects"] == [data for _, data in events[:-1]]
+    assert api_app.redis_client.get("in_flight:ux_info:search") is None
+
+def test_cached_ux_info_is_replayed(api_app, pipeline):
+    first = stream(api_app)
+    second = stream(api_app)
+
+    assert second == first
+    assert pipeline.calls == 1
+
+def test_json_route_serves_the_streamed_result(api_app, pipeline):
+    events = stream(api_app)
+
+    response = api_app.app.test_client().post(
+        "/api/project-ideas", json={"job_search_id": "search"}
+    )
+
+    assert response.get_json() == events[-1][1]
+    assert pipeline.calls == 1
+
+def test_unavailable_when_generation_is_queued(api_app, pipeline, monkeypatch):
+    monkeypatch.setattr(api_app, "PROJECT_IDEAS_QUEUE", True)
+
+    response = api_app.app.test_client().post(
+        "/api/project-ideas/stream", json={"job_search_id": "search"}
+    )
+
+    assert response.status_code == 404
+    assert pipeline.calls == 0
@@ -0,0 +1,126 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.pipelines.project_generation_api import ProjectGenApi
+from src.schemas.project_gen import ProjectList, PromptData
+from src.utils.prompt_cache import PromptCache, prompt_fingerprint
+
+SKILLS = [
+    "python", "sql", "docker", "kafka", "spark", "airflow", "terraform",
+    "linux", "react", "django", "flask", "redis", "postgres", "tableau",
+    "excel", "scala", "golang", "rust", "java", "kotlin"
+]
+EXTRA_SKILLS = ["swift", "haskell", "elixir"]
+
+def prompt(skills) -> PromptData:
+    return PromptData([
+        {"Qualifications": [skill], "job_description": None} for skill in skills
+    ])
+
+def project_list(title: str) -> ProjectList:
+    return ProjectList(projects=[{
+        "title": title,
+        "problem_statement": "Problem",
+        "target_users": ["Users"],
+        "core_features": ["Feature"],
+        "recommended_tech_stack": ["Python"],
+        "achieved_qualifications": ["python"]
+    }])
+
+class StubClient:
+    """Stands in for AzureOpenAI, counting the completions it is asked for."""
+
+    def __init__(self):
+        self.calls = 0
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=self.parse))
+        )
+
+    def parse(self, **kwargs):
+        self.calls += 1
+        parsed = project_list(f"Generated {self.calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))])
+
+@pytest.fixture
+def client():
+    return StubClient()
+
+def generate(client, cache, prompt_data) -> str:
+    api = ProjectGenApi([], client=client, prompt_cache=cache)
+    return api.generate_project_list(prompt_data).projects[0].title
+
+def test_fingerprint_tokens_are_one_per_skill():
+    # The near-hit cases below count on this
+    _, tokens = prompt_fingerprint(prompt(SKILLS + EXTRA_SKILLS))
+    assert len(tokens) == len(SKILLS) + len(EXTRA_SKILLS)
+
+def test_exact_hit_skips_the_model(client):
+    cache = PromptCache()
+
+    assert generate(client, cache, prompt(SKILLS)) == "Generated 1"
+    # Reordered and repeated qualifications share the fingerprint
+    assert generate(client, cache, prompt(SKILLS[::-1] + SKILLS[:3])) == "Generated 1"
+
+    assert client.calls == 1
+    assert cache.stats()["hits"] == 1
+
+def test_near_hit_just_above_threshold(client):
+    cache = PromptCache(similarity_threshold=0.9)
+    generate(client, cache, prompt(SKILLS))
+
+    # Jaccard similarity 20 / 22, about 0.91
+    assert generate(client, cache, prompt(SKILLS + EXTRA_SKILLS[:2])) == "Generated 1"
+
+    assert client.calls == 1
+    assert cache.stats()["near_hits"] == 1
+
+def test_near_miss_just_below_threshold(client):
+    cache = PromptCache(similarity_threshold=0.9)
+    generate(client, cache, prompt(SKILLS))
+
+    # Jaccard similarity 20 / 23, about 0.87
+    assert generate(client, cache, prompt(SKILLS + EXTRA_SKILLS)) == "Generated 2"
+
+    assert client.calls == 2
+    assert cache.stats()["near_hits"] == 0
+
+def test_lru_eviction_at_capacity(client):
+    cache = PromptCache(max_entries=2, similarity_threshold=1.0)
+    first, second, third = prompt(SKILLS[:5]), prompt(SKILLS[5:10]), prompt(SKILLS[10:15])
+
+    generate(client, cache, first)
+    generate(client, cache, second)
+    # Using first makes second the least recently used
+    generate(client, cache, first)
+    generate(client, cache, third)
+
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+def test_entries_expire_after_ttl(client):
+    cache = PromptCache(ttl=0.05)
+    generate(client, cache, prompt(SKILLS))
+
+    time.sleep(0.1)
+
+    assert generate(client, cache, prompt(SKILLS)) == "Generated 2"
+    assert client.calls == 2
+    assert cache.stats()["evictions"] == 1
+
+def test_hit_rate_counts_exact_and_near_hits(client):
+    cache = PromptCache()
+
+    assert cache.stats()["hit_rate"] == 0.0
+
+    generate(client, cache, prompt(SKILLS))
+    generate(client, cache, prompt(SKILLS))
+    generate(client, cache, prompt(SKILLS + EXTRA_SKILLS[:1]))
+    generate(client, cache, prompt(EXTRA_SKILLS))
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["near_hits"], stats["misses"]) == (1, 1, 2)
+    assert stats["hit_rate"] == 0.5
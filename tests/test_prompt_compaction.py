@@ -0,0 +1,71 @@
+import pytest
+
+from benchmarks.fixtures import make_raw_job_listings
+from src.schemas.project_gen import JobHighlights, PromptData
+from src.utils.prompt_compaction import (
+    DESCRIPTION_OVERHEAD,
+    QUALIFICATION_OVERHEAD,
+    compact_prompt_data,
+    estimate_tokens
+)
+
+def prompt_data(n_jobs: int = 40) -> PromptData:
+    return PromptData(root=[
+        JobHighlights(
+            Qualifications=job["job_highlights"]["Qualifications"],
+            job_description=job["job_description"]
+        )
+        for job in make_raw_job_listings(n_jobs)
+    ])
+
+def estimated_size(compacted: PromptData) -> int:
+    size = 0
+    for job in compacted.root:
+        for qual in job.Qualifications or []:
+            size += estimate_tokens(qual) + QUALIFICATION_OVERHEAD
+        if job.job_description:
+            size += estimate_tokens(job.job_description) + DESCRIPTION_OVERHEAD
+    return size
+
+def test_output_is_deterministic():
+    first = compact_prompt_data(prompt_data(), 2000)
+    second = compact_prompt_data(prompt_data(), 2000)
+
+    assert first.model_dump() == second.model_dump()
+
+@pytest.mark.parametrize("budget", [50, 300, 1000, 6000])
+def test_stays_within_the_token_budget(budget):
+    compacted = compact_prompt_data(prompt_data(), budget)
+
+    assert 0 < estimated_size(compacted) <= budget
+
+def test_qualifications_are_deduplicated_across_listings():
+    data = PromptData(root=[
+        JobHighlights(Qualifications=["Python", "SQL"], job_description=None),
+        JobHighlights(Qualifications=["  python ", "Docker"], job_description=None)
+    ])
+
+    compacted = compact_prompt_data(data, 1000)
+
+    assert [job.Qualifications for job in compacted.root] == [["Python", "SQL"], ["Docker"]]
+
+def test_most_requested_qualifications_are_kept_first():
+    data = PromptData(root=[
+        JobHighlights(Qualifications=["Rare skill", "Kubernetes"], job_description=None),
+        JobHighlights(Qualifications=["Kubernetes"], job_description=None)
+    ])
+    # Room for one qualification only
+    budget = estimate_tokens("Kubernetes") + QUALIFICATION_OVERHEAD
+
+    compacted = compact_prompt_data(data, budget)
+
+    assert [job.Qualifications for job in compacted.root] == [["Kubernetes"]]
+
+def test_descriptions_are_truncated():
+    data = PromptData(root=[
+        JobHighlights(Qualifications=["Python"], job_description="python " * 500)
+    ])
+
+    compacted = compact_prompt_data(data, 6000, max_description_tokens=20)
+
+    assert estimate_tokens(compacted.root[0].job_description) <= 20
@@ -0,0 +1,105 @@
+import time
+import asyncio
+import threading
+
+import fakeredis
+import pytest
+
+from src.utils.redis_single_flight import (
+    AsyncRedisSingleFlight,
+    RedisSingleFlight,
+    SingleFlightTimeout
+)
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+def test_contending_callers_compute_once(redis_client):
+    flight = RedisSingleFlight(redis_client, wait_timeout=5, poll_interval=0.01)
+    calls = []
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return b"ux_info"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.run("key", compute, 60)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [b"ux_info"] * 4
+    assert len(calls) == 1
+    assert redis_client.get("key") == b"ux_info"
+    assert redis_client.get("in_flight:key") is None
+
+def test_waiter_times_out_while_lock_is_held(redis_client):
+    flight = RedisSingleFlight(redis_client, wait_timeout=0.1, poll_interval=0.01)
+    flight.acquire("key")
+
+    with pytest.raises(SingleFlightTimeout):
+        flight.run("key", lambda: b"ux_info", 60)
+
+def test_waiter_takes_over_a_failed_holder(redis_client):
+    flight = RedisSingleFlight(redis_client, wait_timeout=5, poll_interval=0.01)
+    def fail():
+        raise RuntimeError("generation failed")
+
+    with pytest.raises(RuntimeError):
+        flight.run("key", fail, 60)
+
+    assert flight.run("key", lambda: b"ux_info", 60) == b"ux_info"
+
+def test_release_and_renew_only_touch_own_lock(redis_client):
+    flight = RedisSingleFlight(redis_client)
+    token = flight.acquire("key")
+
+    assert flight.acquire("key") is None
+    assert not flight.renew("key", "other")
+    flight.release("key", "other")
+    assert redis_client.get("in_flight:key") is not None
+
+    assert flight.renew("key", token)
+    flight.release("key", token)
+    assert redis_client.get("in_flight:key") is None
+
+def test_lock_is_renewed_past_its_ttl(redis_client):
+    flight = RedisSingleFlight(redis_client, lock_ttl=1, wait_timeout=5, poll_interval=0.01)
+    calls = []
+    def compute():
+        calls.append(1)
+        time.sleep(1.5)
+        return b"ux_info"
+
+    holder = threading.Thread(target=lambda: flight.run("key", compute, 60))
+    holder.start()
+    time.sleep(0.1)
+
+    assert flight.run("key", compute, 60) == b"ux_info"
+    holder.join()
+    assert len(calls) == 1
+
+def test_async_contending_callers_compute_once():
+    async def main():
+        redis_client = fakeredis.FakeAsyncRedis()
+        flight = AsyncRedisSingleFlight(redis_client, wait_timeout=5, poll_interval=0.01)
+        calls = []
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return b"ux_info"
+
+        results = await asyncio.gather(
+            *(flight.run("key", compute, 60) for _ in range(4))
+        )
+
+        assert results == [b"ux_info"] * 4
+        assert len(calls) == 1
+        assert await redis_client.get("in_flight:key") is None
+
+    asyncio.run(main())
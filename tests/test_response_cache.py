@@ -0,0 +1,95 @@
+import time
+import threading
+
+import fakeredis
+import pytest
+
+from src.utils.cache_codec import CacheCodec
+from src.utils import response_cache
+from src.utils.response_cache import ResponseCache
+
+PARAMS = {"query": "Data Engineer in London", "country": "uk"}
+
+@pytest.fixture
+def cache():
+    return ResponseCache(
+        fakeredis.FakeRedis(), ttl=60, stale_ttl=30, codec=CacheCodec()
+    )
+
+def test_miss_fetches_and_stores(cache):
+    assert cache.get_or_fetch(PARAMS, lambda: "listings") == "listings"
+    assert cache.redis_client.ttl(cache.cache_key(PARAMS)) == 90
+    assert cache.stats()["misses"] == 1
+
+def test_hit_skips_fetch(cache):
+    cache.get_or_fetch(PARAMS, lambda: "listings")
+
+    def fetch():
+        raise AssertionError("fetched on a hit")
+
+    assert cache.get_or_fetch(PARAMS, fetch) == "listings"
+    assert cache.stats()["hits"] == 1
+
+def test_equivalent_params_share_an_entry(cache):
+    cache.get_or_fetch(PARAMS, lambda: "listings")
+    equivalent = {"query": "  data engineer   in LONDON ", "country": "UK"}
+
+    assert cache.cache_key(equivalent) == cache.cache_key(PARAMS)
+
+def test_stale_hit_serves_old_value_and_refreshes(cache, monkeypatch):
+    cache.get_or_fetch(PARAMS, lambda: "old")
+
+    now = time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 61)
+
+    refreshed = threading.Event()
+    def fetch():
+        refreshed.set()
+        return "new"
+
+    assert cache.get_or_fetch(PARAMS, fetch) == "old"
+    assert refreshed.wait(5)
+
+    deadline = time.monotonic() + 5
+    while cache._read(cache.cache_key(PARAMS))["value"] != "new":
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert cache.stats()["stale_hits"] == 1
+
+def test_failed_fetch_is_not_cached(cache):
+    def fetch():
+        raise RuntimeError("upstream error")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch(PARAMS, fetch)
+
+    assert cache.redis_client.get(cache.cache_key(PARAMS)) is None
+    assert cache.get_or_fetch(PARAMS, lambda: "listings") == "listings"
+
+def test_concurrent_misses_share_one_fetch(cache):
+    calls = []
+    release = threading.Event()
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "listings"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch(PARAMS, fetch)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.monotonic() + 5
+    while cache.stats()["coalesced"] < 3:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["listings"] * 4
+    assert len(calls) == 1
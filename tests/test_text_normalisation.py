@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from benchmarks.bench_text_normalisation import legacy_text_normalisation
+from benchmarks.fixtures import QUALIFICATIONS, make_qualification
+from src.utils.text_normalisation import text_normalisation
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "C++ and C# on .NET",
+    "CI/CD pipelines, CI - CD and continuous   integration",
+    "RESTful APIs and a RESTful API",
+    "REST API design",
+    "ML, Machine Learning and LLMs",
+    "Large Language Models with Retrieval-Augmented Generation (RAG)",
+    "retrieval augmented generation",
+    "Vector DB or vector database",
+    "Node.js, NodeJS, React.js and PostgreSQL / Postgre SQL",
+    "AWS & Azure",
+    "R&D",
+    "hands-on experience building pipelines",
+    "Proven ability to develop data-driven dashboards",
+    "Café naïve résumé",
+    "mlops html xml rags",
+    "5+ years' experience in Python/SQL",
+]
+
+# Fragments that exercise the special tokens, canonical phrases and
+# punctuation in random combinations
+FRAGMENTS = [
+    "c++", "c#", ".net", "ci", "cd", "/", "-", "continuous", "integration",
+    "delivery", "restful", "rest", "api", "apis", "design", "machine",
+    "learning", "ml", "large", "language", "models", "llm", "retrieval",
+    "augmented", "generation", "rag", "vector", "db", "database", "node.js",
+    "react.js", "postgre", "sql", "aws", "azure", "&", "python", "the",
+    "skills", "testing", "queries", ",", "(", ")"
+]
+
+def random_texts(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        parts = rng.choices(FRAGMENTS, k=rng.randint(1, 10))
+        yield "".join(part + rng.choice(["", " ", "  "]) for part in parts)
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_edge_cases_match_the_original(text):
+    assert text_normalisation(text) == legacy_text_normalisation(text)
+
+def test_fixture_qualifications_match_the_original():
+    rng = random.Random(0)
+    texts = QUALIFICATIONS + [make_qualification(rng) for _ in range(200)]
+
+    for text in texts:
+        assert text_normalisation(text) == legacy_text_normalisation(text), text
+
+def test_random_phrases_match_the_original():
+    for text in random_texts(2000):
+        assert text_normalisation(text) == legacy_text_normalisation(text), text
+
+def test_cached_results_are_immutable():
+    first = text_normalisation("Python and SQL")
+
+    assert isinstance(first, frozenset)
+    assert text_normalisation("Python and SQL") is first